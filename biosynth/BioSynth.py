@@ -1,6 +1,4 @@
 import sys
-from biosynth.executions.controllers.cli_controller import CLIController
-from biosynth.executions.controllers.gui_controller import GUIController
 from biosynth.utils.file_utils import delete_dir
 from biosynth.utils.input_utils import ArgumentParser
 from biosynth.utils.logger import Logger
@@ -16,10 +14,32 @@ class BioSynthApp:
 
         Clears the output directory, parses CLI args to detect GUI mode, sets
         the global output format accordingly, and delegates to the matching
-        controller. Logs errors and exits with a non-zero code on failure or
+        controller. ``compile-patterns``, ``serve`` and ``submit`` as the first
+        argument run the automaton-cache, optimization-service and service
+        client subcommands instead. Controllers are imported only once chosen,
+        so CLI runs never load the Qt stack and load Jinja2 only when a report
+        is rendered. Logs errors and exits with a non-zero code on failure or
         user interrupt.
         """
         try:
+            if args and args[0] == "compile-patterns":
+                set_output_format(OutputFormat.TERMINAL)
+                from biosynth.executions.controllers.compile_controller import CompilePatternsController
+                CompilePatternsController(args[1:]).execute()
+                return
+
+            if args and args[0] == "serve":
+                set_output_format(OutputFormat.TERMINAL)
+                from biosynth.executions.controllers.serve_controller import ServeController
+                ServeController(args[1:]).execute()
+                return
+
+            if args and args[0] == "submit":
+                set_output_format(OutputFormat.TERMINAL)
+                from biosynth.executions.controllers.submit_controller import SubmitController
+                SubmitController(args[1:]).execute()
+                return
+
             delete_dir('output')
 
             parser = ArgumentParser()
@@ -27,9 +47,11 @@ class BioSynthApp:
 
             if gui:
                 set_output_format(OutputFormat.GUI)
+                from biosynth.executions.controllers.gui_controller import GUIController
                 GUIController().execute()
             else:
                 set_output_format(OutputFormat.TERMINAL)
+                from biosynth.executions.controllers.cli_controller import CLIController
                 CLIController(args).execute()
         except Exception as e:
             Logger.error(e)
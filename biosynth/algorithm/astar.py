@@ -0,0 +1,232 @@
+import heapq
+
+import numpy as np
+
+from biosynth.algorithm.backpointers import BackpointerTable, SYMBOL_BITS, SYMBOL_MASK
+from biosynth.algorithm.fsm import FORBIDDEN
+from biosynth.utils.cost_utils import BASES, CostTable
+from biosynth.utils.pattern_scanner import PatternScanner
+
+# Relative margin subtracted from the heuristic, so that rounding in its sums
+# can never make it overestimate the exact cost of a path. Queue priorities
+# are rounded to a quarter of it, so that the rounding noise of equally
+# promising cells cannot reorder them.
+_ROUNDING_SLACK = 1e-9
+
+
+def charge_columns(cost_table):
+    """
+    Returns the 1-based DP column charging a change at every position.
+
+    A non-coding base is charged at its own column and a codon base at the
+    column of the codon's third position, where the whole codon is priced.
+
+    Args:
+        cost_table (CostTable): Precomputed costs per position, last bigram and base.
+
+    Returns:
+        np.ndarray: The charging column of every 0-based position.
+    """
+    row_index = cost_table.row_index
+    columns = np.arange(1, len(row_index) + 1)
+    charged = np.flatnonzero(row_index != CostTable.ZERO_ROW)
+    if len(charged) == 0:
+        return columns
+
+    # Codon positions 1 and 2 use the zero row and are charged at the next charged
+    # position; those of a truncated last codon are never charged and keep their own
+    following = np.searchsorted(charged, np.arange(len(row_index)))
+    deferred = (row_index == CostTable.ZERO_ROW) & (following < len(charged))
+    return np.where(deferred, charged[np.minimum(following, len(charged) - 1)] + 1, columns)
+
+
+def change_penalties(cost_table):
+    """
+    Returns the least extra cost of changing the original base at every position.
+
+    The extra cost is the cheapest entry of the charging column (see
+    :func:`charge_columns`) that spells a different base at the position,
+    above the cheapest entry of that column. In a codon this only counts
+    codons differing at the position's own phase, so a synonymous change of
+    the third base does not discount a change of the first.
+
+    Args:
+        cost_table (CostTable): Precomputed costs per position, last bigram and base.
+
+    Returns:
+        np.ndarray: The penalty of every 0-based position.
+    """
+    rows = cost_table.rows
+    keys = np.arange(rows.shape[1])
+
+    # Original key of every row: the base of a non-coding row, the target codon of a codon row
+    original = np.zeros(len(rows), dtype=np.int64)
+    original[:CostTable.ZERO_ROW] = np.arange(CostTable.ZERO_ROW)
+    original[CostTable.CODON_ROWS:] = np.arange(len(rows) - CostTable.CODON_ROWS) % rows.shape[1]
+
+    # Penalty per row and distance of the changed base from the charging column
+    cheapest = rows.min(axis=1)
+    penalties = np.zeros((len(rows), 3))
+    for offset in range(3):
+        shift = 2 * offset
+        changed = (keys[np.newaxis, :] >> shift & 3) != (original[:, np.newaxis] >> shift & 3)
+        cheapest_change = np.where(changed, rows, np.inf).min(axis=1)
+        with np.errstate(invalid="ignore"):
+            penalties[:, offset] = np.where(np.isfinite(cheapest), cheapest_change - cheapest, 0.0)
+    penalties[CostTable.ZERO_ROW] = 0.0
+
+    columns = charge_columns(cost_table)
+    return penalties[cost_table.row_index[columns - 1], columns - 1 - np.arange(len(columns))]
+
+
+def remaining_cost_bounds(target_sequence, unwanted_patterns, cost_table):
+    """
+    Lower-bounds the cost still to be paid after every DP column.
+
+    Every column costs at least its cheapest entry. On top of that, every
+    occurrence of an unwanted pattern in the original sequence must be
+    broken by a change inside it, charged at one of its columns. The bound
+    adds the change penalties of the best set of occurrences whose charged
+    columns do not overlap, each with its cheapest penalty, so no change is
+    counted twice.
+
+    Args:
+        target_sequence (str): The input DNA sequence.
+        unwanted_patterns (iterable): The patterns the automaton avoids; a pattern it does not
+            enforce would make the bound overestimate.
+        cost_table (CostTable): Precomputed costs per position, last bigram and base.
+
+    Returns:
+        np.ndarray: ``n + 1`` bounds; entry ``i`` bounds the cost of columns ``i + 1..n``.
+    """
+    n = len(cost_table)
+    minimums = cost_table.position_minimums()
+    suffix = np.zeros(n + 1)
+    suffix[:n] = np.cumsum(minimums[::-1])[::-1]
+
+    columns = charge_columns(cost_table).tolist()
+    penalties = change_penalties(cost_table).tolist()
+
+    # Occurrences grouped by their first charged column
+    occurrences = [[] for _ in range(n + 2)]
+    for start, end, _ in PatternScanner.for_patterns(unwanted_patterns).scan(target_sequence):
+        penalty = min(penalties[start:end])
+        if penalty > 0:
+            occurrences[columns[start]].append((columns[end - 1], penalty))
+
+    # Weighted interval scheduling over the charged columns, from the end
+    hits = [0.0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        hits[i] = hits[i + 1]
+        for last, penalty in occurrences[i + 1]:
+            hits[i] = max(hits[i], penalty + hits[last])
+
+    return suffix + np.array(hits)
+
+
+def eliminate_astar(target_sequence, fsm, cost_table, stats=None):
+    """
+    Finds the cheapest sequence by a best-first search of the DP lattice.
+
+    The lattice cells ``(column, state)`` are the nodes of a shortest-path
+    graph whose edges are the transitions of finite cost. Cells are expanded
+    lazily in the order of their cost plus :func:`remaining_cost_bounds`, an
+    admissible estimate of the cost still to come, so when the input needs
+    only a few changes the search follows the original sequence and visits
+    a small fraction of the ``n x |V|`` table. A cell is expanded again if a
+    cheaper way to it turns up later, so the first cell of the last column
+    taken from the queue is optimal: the minimum cost equals that of the
+    exhaustive fill, while among equally cheap sequences another one may be
+    returned.
+
+    Args:
+        target_sequence (str): The input DNA sequence.
+        fsm (FSM): The pattern-avoiding automaton.
+        cost_table (CostTable): Precomputed costs per position, last bigram and base.
+        stats (dict): Optional dict whose ``lattice_cells`` and ``expanded_cells`` counters are
+            increased by the number of cells of the lattice and of expanded cells.
+
+    Returns:
+        tuple: ``(min_cost, optimized_seq)``; ``optimized_seq`` is ``None`` when
+        no sequence avoids the unwanted patterns.
+    """
+    n = len(target_sequence)
+    compiled = fsm.compiled
+    n_states = len(compiled.states)
+
+    if n < 2:
+        return float('inf'), None
+
+    # The FSM only tracks states of two or more bases, so shorter patterns are not enforced
+    patterns = [p for p in fsm.unwanted_patterns if len(p) > 2]
+    bounds = remaining_cost_bounds(target_sequence, patterns, cost_table)
+    if not np.isfinite(bounds[2]):
+        return float('inf'), None
+    slack = _ROUNDING_SLACK * max(1.0, float(bounds[2]))
+    quantum = slack / 4
+    bounds = (bounds - slack).tolist()
+    transitions = compiled.transitions.tolist()
+    state_bigram = compiled.state_bigram.tolist()
+    rows = cost_table.rows.tolist()
+    row_index = cost_table.row_index.tolist()
+    target_bases = [BASES.index(base) for base in target_sequence]
+
+    # Cells are keyed by column * |V| + state; the queue holds (estimate, -column, changed, order, cell,
+    # cost), so that among equally promising cells the deepest one is expanded first, keeping the
+    # original base where possible
+    best = {}
+    back = {}
+    queue = []
+    initial = cost_table.initial.tolist()
+    target_state = compiled.index.get(target_sequence[:2])
+    for b, v_id in enumerate(compiled.bigram_states.tolist()):
+        cost = initial[0][b // len(BASES)] + initial[1][b % len(BASES)]
+        if cost < float('inf'):
+            cell = 2 * n_states + v_id
+            best[cell] = cost
+            queue.append((round((cost + bounds[2]) / quantum), -2, v_id != target_state, len(queue), cell, cost))
+    heapq.heapify(queue)
+
+    order = len(queue)
+    expanded = 0
+    final_cell = None
+    while queue:
+        *_, cell, cost = heapq.heappop(queue)
+        if cost > best[cell]:
+            continue  # A cheaper way to this cell was found after it was queued
+        i, u_id = divmod(cell, n_states)
+        expanded += 1
+        if i == n:
+            final_cell = cell
+            break
+
+        costs = rows[row_index[i]]
+        key = state_bigram[u_id] * len(BASES)
+        for s_id, v_id in enumerate(transitions[u_id]):
+            if v_id == FORBIDDEN:
+                continue
+            next_cost = cost + costs[key + s_id]
+            next_cell = cell + n_states - u_id + v_id
+            if next_cost < best.get(next_cell, float('inf')):
+                best[next_cell] = next_cost
+                back[next_cell] = BackpointerTable.encode(u_id, s_id)
+                order += 1
+                heapq.heappush(queue, (round((next_cost + bounds[i + 1]) / quantum), -i - 1,
+                                       s_id != target_bases[i], order, next_cell, next_cost))
+
+    if stats is not None:
+        stats["lattice_cells"] = stats.get("lattice_cells", 0) + (n - 1) * n_states
+        stats["expanded_cells"] = stats.get("expanded_cells", 0) + expanded
+
+    if final_cell is None:
+        return float('inf'), None
+
+    # Backtrack from the final cell to the seeded column
+    symbols = []
+    cell = final_cell
+    for i in range(n, 2, -1):
+        code = back[cell]
+        symbols.append(BASES[code & SYMBOL_MASK])
+        cell = (i - 1) * n_states + (code >> SYMBOL_BITS)
+    symbols.reverse()
+    return best[final_cell], compiled.states[cell - 2 * n_states] + ''.join(symbols)
@@ -0,0 +1,84 @@
+import numpy as np
+
+# Number of bits reserved for the base consumed by a transition (|Σ| = 4).
+SYMBOL_BITS = 2
+SYMBOL_MASK = (1 << SYMBOL_BITS) - 1
+
+# First DP column that carries a backpointer; columns 1 and 2 are seeded directly.
+FIRST_COLUMN = 3
+
+
+class BackpointerTable:
+    """
+    Compact ``n x |V|`` backpointer storage for the elimination DP.
+
+    Each cell packs the predecessor state id and the index of the consumed
+    base into one small unsigned integer: ``(predecessor << 2) | symbol``.
+    The narrowest dtype that can hold every code is used, and its maximum
+    value marks cells without a finite-cost predecessor.
+
+    Attributes:
+        table (np.ndarray): Packed backpointers, one row per column ``first_column..n``.
+        first_column (int): The DP column stored in the first row.
+        none (int): Sentinel code for cells without a predecessor.
+    """
+
+    def __init__(self, n, n_states, first_column=FIRST_COLUMN):
+        """
+        Allocates the table for columns ``first_column..n`` over ``n_states`` FSM states.
+
+        Args:
+            n (int): Last DP column, i.e. the length of the target sequence.
+            n_states (int): Number of FSM states.
+            first_column (int): First DP column to store; defaults to column 3.
+                Segments of the table are used when recomputing between checkpoints.
+        """
+        dtype = BackpointerTable.code_dtype(n_states)
+        self.none = np.iinfo(dtype).max
+        self.first_column = first_column
+        self.table = np.full((max(n - first_column + 1, 0), n_states), self.none, dtype=dtype)
+
+    @staticmethod
+    def code_dtype(n_states):
+        """Return the narrowest unsigned dtype holding every packed code plus the sentinel."""
+        for dtype in (np.uint8, np.uint16, np.uint32):
+            if (n_states << SYMBOL_BITS) < np.iinfo(dtype).max:
+                return dtype
+        return np.uint64
+
+    @staticmethod
+    def encode(predecessor, symbol):
+        """Pack a predecessor state id and a base index into one code."""
+        return (predecessor << SYMBOL_BITS) | symbol
+
+    def set_column(self, i, codes):
+        """Store the packed codes of DP column ``i`` (1-based)."""
+        self.table[i - self.first_column] = codes
+
+    def trace(self, final_state, alphabet):
+        """
+        Follows the backpointers from ``final_state`` at the last column down to ``first_column - 1``.
+
+        Args:
+            final_state (int): State id selected at the last column.
+            alphabet (str): Bases in symbol-index order.
+
+        Returns:
+            tuple: ``(state, symbols)`` – the state id at column ``first_column - 1``
+            and the bases chosen for the stored columns in sequence order.
+
+        Raises:
+            ValueError: If a cell on the path has no predecessor.
+        """
+        symbols = []
+        state = final_state
+        for row in range(len(self.table) - 1, -1, -1):
+            code = int(self.table[row, state])
+            if code == self.none:
+                raise ValueError(f"No transition found for position {row + self.first_column} and state {state}")
+
+            symbols.append(alphabet[code & SYMBOL_MASK])
+            state = code >> SYMBOL_BITS
+
+        symbols.reverse()
+        return state, symbols
@@ -0,0 +1,214 @@
+import numpy as np
+
+from biosynth.algorithm.backpointers import BackpointerTable, SYMBOL_BITS, SYMBOL_MASK
+from biosynth.algorithm.fsm import FORBIDDEN
+from biosynth.algorithm.vectorized_dp import PredecessorGraph, fill_column, initial_column
+from biosynth.utils.amino_acid_utils import AminoAcidConfig
+from biosynth.utils.cost_utils import BASES, CODONS, CostTable
+
+# Number of bits reserved for the codon consumed by a codon step (64 codons).
+CODON_BITS = 6
+CODON_MASK = (1 << CODON_BITS) - 1
+
+# Largest automaton stepped by codons regardless of the candidate codons. A
+# codon step gathers one edge per state and candidate codon against 12 for
+# three base steps, so with many candidates it only pays off while the
+# per-column overhead dominates, i.e. for small automata.
+MAX_CODON_STRIDE_STATES = 128
+
+
+class CodonStep:
+    """
+    Edges of one codon step, in the CSR layout of :class:`PredecessorGraph`.
+
+    An edge reads a whole codon from a state in one step. Only codons with a
+    finite cost at the step are kept, so stop codons and codons missing from
+    the usage table are pruned before the DP touches them.
+
+    Attributes:
+        states (list): The FSM states, in id order.
+        src (np.ndarray): Source state id of every edge.
+        dst (np.ndarray): Target state id of every edge.
+        edge_key (np.ndarray): Codon index (into ``CODONS``) of every edge, which is also
+            its flat index into a ``16 x 4`` cost-table row.
+        edge_code (np.ndarray): Packed ``(src << CODON_BITS) | codon`` of every edge.
+        reachable (np.ndarray): Ids of the states with at least one incoming edge.
+        segment_starts (np.ndarray): Offset of the first edge of every reachable state.
+    """
+
+    def __init__(self, states, codon_dst, costs, target_codon):
+        """
+        Selects and orders the codon edges of a step.
+
+        Args:
+            states (list): The FSM states, in id order.
+            codon_dst (np.ndarray): ``|V| x 64`` state reached by reading every codon.
+            costs (np.ndarray): Flat ``16 x 4`` cost-table row of the codon's third position.
+            target_codon (int): Codon of the original sequence at this step.
+        """
+        self.states = states
+
+        src, codon = np.nonzero((codon_dst != FORBIDDEN) & np.isfinite(costs)[np.newaxis, :])
+        dst = codon_dst[src, codon]
+
+        # Codons read from the same state are tried with the original codon first,
+        # then its synonymous codons, so that ties keep the encoded codon or protein.
+        rank = np.array([0 if c == target_codon else
+                         1 if AminoAcidConfig.encodes_same_amino_acid(CODONS[c], CODONS[target_codon]) else 2
+                         for c in range(len(CODONS))])
+        order = np.lexsort((src, codon, rank[codon], dst))
+        self.src = src[order]
+        self.dst = dst[order]
+        self.edge_key = codon[order]
+        self.edge_code = (self.src << CODON_BITS) | self.edge_key
+
+        counts = np.bincount(self.dst, minlength=len(states))
+        self.reachable = np.flatnonzero(counts > 0)
+        self.segment_starts = np.concatenate(([0], np.cumsum(counts)))[self.reachable]
+
+
+class CodonGraph:
+    """
+    Codon-level view of the compiled FSM for stepping over whole codons.
+
+    The automaton is advanced by the three bases of every codon at once, so
+    a coding stretch takes one DP step per codon instead of three.
+
+    Attributes:
+        states (list): The FSM states, in id order.
+        codon_dst (np.ndarray): ``|V| x 64`` state reached from every state by reading
+            every codon, ``FORBIDDEN`` when a base of the codon completes an unwanted pattern.
+    """
+
+    def __init__(self, fsm):
+        """
+        Precomposes the transitions of ``fsm`` over the 64 codons.
+
+        Args:
+            fsm (FSM): The pattern-avoiding automaton.
+        """
+        compiled = fsm.compiled
+        self.states = compiled.states
+
+        transitions = compiled.transitions.astype(np.int64)
+        codon_bases = np.array([[BASES.index(base) for base in codon] for codon in CODONS])
+        state = np.broadcast_to(np.arange(len(self.states))[:, np.newaxis], (len(self.states), len(CODONS)))
+        for k in range(3):
+            valid = state != FORBIDDEN
+            state = np.where(valid, transitions[np.where(valid, state, 0), codon_bases[:, k]], FORBIDDEN)
+        self.codon_dst = state
+        self._steps = {}
+
+    def step(self, cost_table, row):
+        """Return the :class:`CodonStep` of the cost-table row ``row``, built once per row."""
+        if row not in self._steps:
+            target_codon = (row - CostTable.CODON_ROWS) % len(CODONS)
+            self._steps[row] = CodonStep(self.states, self.codon_dst, cost_table.rows[row], target_codon)
+        return self._steps[row]
+
+
+def plan_strides(cost_table, n_states=0):
+    """
+    Splits DP columns ``3..n`` into single-base steps and codon steps.
+
+    A codon step covers the columns of a whole codon: its first two bases
+    are free and its third is charged for the codon, so the three columns
+    collapse into one. Codons overlapping the first two positions, which are
+    seeded directly, are stepped base by base, and so are codons with more
+    than 12 candidates when the automaton has more than
+    ``MAX_CODON_STRIDE_STATES`` states.
+
+    Args:
+        cost_table (CostTable): Precomputed costs per position, last bigram and base.
+        n_states (int): Number of states of the automaton.
+
+    Returns:
+        list: ``(stride, column)`` pairs, ``column`` being the last 1-based column of the step.
+    """
+    row_index = cost_table.row_index.tolist()
+    if n_states > MAX_CODON_STRIDE_STATES:
+        stride_rows = np.isfinite(cost_table.rows).sum(axis=1) <= 3 * len(BASES)
+    else:
+        stride_rows = np.ones(len(cost_table.rows), dtype=bool)
+    stride_rows[:CostTable.CODON_ROWS] = False
+    stride_rows = stride_rows.tolist()
+
+    n = len(row_index)
+    steps = []
+    i = 3
+    while i <= n:
+        if i + 2 <= n and row_index[i - 1] == row_index[i] == CostTable.ZERO_ROW and stride_rows[row_index[i + 1]]:
+            steps.append((3, i + 2))
+            i += 3
+        else:
+            steps.append((1, i))
+            i += 1
+    return steps
+
+
+def eliminate_codon_stride(target_sequence, fsm, cost_table):
+    """
+    Runs the elimination DP one codon per step inside coding regions.
+
+    Non-coding positions are filled base by base as in
+    :func:`~biosynth.algorithm.vectorized_dp.eliminate_vectorized`; every
+    codon of a coding region is filled in one step over the codons allowed
+    there (see :func:`plan_strides`). The minimum cost is the same as
+    that of the other engines; among equally cheap codons read from the same
+    state the original codon is preferred, then synonymous codons.
+
+    Args:
+        target_sequence (str): The input DNA sequence.
+        fsm (FSM): The pattern-avoiding automaton.
+        cost_table (CostTable): Precomputed costs per position, last bigram and base.
+
+    Returns:
+        tuple: ``(min_cost, optimized_seq)``; ``optimized_seq`` is ``None`` when
+        no sequence avoids the unwanted patterns.
+    """
+    n = len(target_sequence)
+    graph = PredecessorGraph(fsm)
+    codon_graph = CodonGraph(fsm)
+
+    if n < 2:
+        return float('inf'), None
+
+    dtype = BackpointerTable.code_dtype(len(graph.states) << (CODON_BITS - SYMBOL_BITS))
+    none = np.iinfo(dtype).max
+
+    column = initial_column(graph, cost_table)
+    back = []
+    for stride, i in plan_strides(cost_table, len(graph.states)):
+        if stride == 3:
+            step = codon_graph.step(cost_table, int(cost_table.row_index[i - 1]))
+        else:
+            step = graph
+        column, best_edge = fill_column(step, column, cost_table.column(i))
+
+        codes = np.full(len(graph.states), none, dtype=dtype)
+        valid = best_edge >= 0
+        codes[valid] = step.edge_code[best_edge[valid]]
+        back.append((stride, codes))
+
+    final_state = int(np.argmin(column))
+    min_cost = float(column[final_state])
+    if min_cost == float('inf'):
+        return min_cost, None
+
+    # Backtrack over the steps, a base or a whole codon at a time
+    pieces = []
+    state = final_state
+    for stride, codes in reversed(back):
+        code = int(codes[state])
+        if code == none:
+            raise ValueError(f"No transition found for state {state}")
+        if stride == 3:
+            pieces.append(CODONS[code & CODON_MASK])
+            state = code >> CODON_BITS
+        else:
+            pieces.append(BASES[code & SYMBOL_MASK])
+            state = code >> SYMBOL_BITS
+
+    pieces.append(graph.states[state])
+    pieces.reverse()
+    return min_cost, ''.join(pieces)
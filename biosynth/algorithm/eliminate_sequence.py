@@ -1,25 +1,66 @@
-from collections import defaultdict
-
-from biosynth.algorithm.fsm import FSM
-from biosynth.data.app_data import CostData
+from functools import partial
+
+import numpy as np
+
+from biosynth.algorithm.astar import eliminate_astar
+from biosynth.algorithm.backpointers import BackpointerTable
+from biosynth.algorithm.codon_dp import eliminate_codon_stride
+from biosynth.algorithm.fsm import FSM, FORBIDDEN
+from biosynth.algorithm.fsm_cache import load_fsm
+from biosynth.algorithm.incremental import DPCheckpoints, eliminate_incremental
+from biosynth.algorithm.marginals import MarginalCosts, marginal_costs
+from biosynth.algorithm.reachability import MIN_PRUNED_STATES, live_cells
+from biosynth.algorithm.sweep import eliminate_sweep
+from biosynth.algorithm.top_k import eliminate_top_k
+from biosynth.algorithm.vectorized_dp import PredecessorGraph, eliminate_vectorized, eliminate_low_memory
+from biosynth.algorithm.windowed import eliminate_windowed
+from biosynth.data.optimization import OptimizationRequest
 from biosynth.utils.descriptions import format_cost, get_elimination_process_description, \
     get_non_coding_region_cost_description, get_coding_region_cost_description
-from biosynth.utils.cost_utils import EliminationScorerConfig
+from biosynth.utils.cost_utils import EliminationScorerConfig, BASES
 from biosynth.utils.date_utils import format_current_date
+from biosynth.utils.pattern_scanner import PatternScanner
 from biosynth.utils.text_utils import format_text_bold_for_output
 
 
+def _record_change(cost_contribution, cost_substitution, position, original, modified, cost_f):
+    """Append a change row to the contribution list (cost > 0) or the free-substitution list."""
+    row = {"Position": position, "Original": original, "Optimized": modified,
+           "Cost": f"{cost_f:.3f}".rstrip('0').rstrip('.')}
+
+    if cost_f > 0:
+        cost_contribution.append(row)
+    elif original != modified:
+        cost_substitution.append(row)
+
+
 class EliminationController:
     """Driver for the DP-based elimination of unwanted patterns from a DNA sequence."""
 
     @staticmethod
-    def eliminate(target_sequence, unwanted_patterns, coding_positions):
+    def eliminate(target_sequence, unwanted_patterns, coding_positions, fsm=None, request=None, alternatives=None,
+                  checkpoints=None, marginals=None):
         """Run the FSM-guided dynamic-programming optimizer that removes ``unwanted_patterns``.
 
         Args:
             target_sequence: The input DNA sequence (without the ``*`` marker).
-            unwanted_patterns: Iterable of patterns that must not appear in the result.
+            unwanted_patterns: Iterable of patterns that must not appear in the result. With
+                ``request.both_strands`` their reverse complements are removed too.
             coding_positions: Per-base codon-phase array (0 for non-coding).
+            fsm: Optional automaton from :meth:`build_fsm` for the same patterns, e.g. shared by
+                the records of a batch; built here when omitted.
+            request: :class:`OptimizationRequest` supplying the costs and engine options; taken
+                from the app data when omitted.
+            alternatives: Optional list that receives one row per alternative sequence when
+                ``request.top_k`` is above 1 (see :meth:`describe_alternatives`).
+            checkpoints: Optional :class:`~biosynth.algorithm.incremental.DPCheckpoints` of the previous
+                run; the DP then resumes from the first position whose costs changed, e.g. after an edit
+                in the GUI. Replaces the engine, low-memory and windowed options.
+            marginals: Optional list that receives, with ``request.marginals``, one row of four
+                costs per position, also when no pattern occurs: the cheapest total cost with each
+                base forced there, all ``inf`` when no valid sequence exists (see
+                :func:`~biosynth.algorithm.marginals.marginal_costs`). The DP then runs with
+                checkpoints, fresh ones when none are given, whose forward columns that pass reuses.
 
         Returns:
             A tuple ``(info, cost_contribution, cost_substitution, optimized_seq,
@@ -30,155 +71,368 @@ class EliminationController:
         # Initialize information string for the elimination process
         info = ""
 
+        if request is None:
+            request = OptimizationRequest.from_app_data(target_sequence)
+
+        # Remove the patterns from the reverse strand as well
+        unwanted_patterns = request.patterns_to_eliminate(unwanted_patterns)
+
         # Check if unwanted patterns exist
-        if not any(x in target_sequence for x in unwanted_patterns):
+        if not PatternScanner.for_patterns(unwanted_patterns).contains_any(target_sequence):
             info += "No invalid patterns identified — the original sequence will be retained."
+            if request.marginals:
+                # Forcing a base may still create a pattern, so the costs come from the automaton as well
+                cost_table = EliminationScorerConfig.cost_table(target_sequence, coding_positions,
+                                                                request.codon_usage, request.alpha, request.beta,
+                                                                request.w, request.optimized_codon)
+                if request.coding_mode != "full":
+                    cost_table = cost_table.synonymous_only()
+                if fsm is None:
+                    fsm, _ = EliminationController.build_fsm(unwanted_patterns, request)
+                info += EliminationController._marginal_costs(target_sequence, fsm, cost_table, checkpoints,
+                                                              marginals)
             return info, None, target_sequence, 0.0  # Return unchanged sequence
 
         # Additional descriptions (placeholders for actual descriptions)
         info += f"{format_text_bold_for_output(get_elimination_process_description())}\n"
-        info += f"\nNon-Coding regions:\n{get_non_coding_region_cost_description()}\n"
-        info += f"\nCoding regions:\n{get_coding_region_cost_description()}\n"
-
-        n = len(target_sequence)
+        info += f"\nNon-Coding regions:\n{get_non_coding_region_cost_description(request)}\n"
+        info += f"\nCoding regions:\n{get_coding_region_cost_description(request)}\n"
 
         # Initialize utility and FSM classes
         elimination_scorer = EliminationScorerConfig()
-        initial_cost_function, cost_function = elimination_scorer.cost_function(target_sequence,
-                                                                                coding_positions,
-                                                                                CostData.codon_usage,
-                                                                                CostData.alpha,
-                                                                                CostData.beta,
-                                                                                CostData.w,
-                                                                                CostData.optimized_codon)
-        fsm = FSM(unwanted_patterns, elimination_scorer.alphabet)
-
-        # Invert fsm.f into a predecessor map so the DP inner loop iterates only
-        # over states that actually transition into v, instead of scanning every
-        # (u, sigma) pair. Drops the fill complexity from O(n·|V|²·|Σ|) to
-        # O(n·|V|·|Σ|).
-        predecessors = defaultdict(list)
-        for (u, sigma), v_next in fsm.f.items():
-            if v_next is not None:
-                predecessors[v_next].append((u, sigma))
-
-        # Dynamic programming table A, initialized with infinity
-        A = defaultdict(lambda: float('inf'))
-        # A* table for backtracking (stores the previous state and transition symbol)
-        A_star = {}
-        A_info = {}
+        cost_table = elimination_scorer.cost_table(target_sequence,
+                                                   coding_positions,
+                                                   request.codon_usage,
+                                                   request.alpha,
+                                                   request.beta,
+                                                   request.w,
+                                                   request.optimized_codon)
+        if fsm is None:
+            fsm, fsm_info = EliminationController.build_fsm(unwanted_patterns, request)
+            info += fsm_info
+
+        # The marginal costs are refilled from the forward columns the incremental DP stores
+        if request.marginals and checkpoints is None:
+            checkpoints = DPCheckpoints()
+
+        stats = {}
+        found = []
+        if request.top_k > 1:
+            engine = partial(eliminate_top_k, k=request.top_k, alternatives=found)
+        elif checkpoints is not None:
+            engine = partial(eliminate_incremental, checkpoints=checkpoints, stats=stats)
+        elif request.low_memory:
+            engine = eliminate_low_memory
+        elif request.engine == "vectorized":
+            engine = eliminate_vectorized
+        elif request.engine == "codon":
+            engine = eliminate_codon_stride
+        elif request.engine == "astar":
+            engine = partial(eliminate_astar, stats=stats)
+        else:
+            engine = partial(EliminationController._eliminate_python, stats=stats)
+
+        tables = []
+
+        def run(table):
+            tables.append(table)
+            found.clear()
+            if request.windowed and request.top_k == 1 and checkpoints is None:
+                return eliminate_windowed(target_sequence, coding_positions, fsm, table, engine)
+            return engine(target_sequence, fsm, table)
+
+        if request.coding_mode == "full":
+            min_cost, optimized_seq = run(cost_table)
+        else:
+            # A non-synonymous codon costs at least w + 1, so a synonymous-only solution
+            # that is not more expensive is optimal over the full alphabet as well
+            min_cost, optimized_seq = run(cost_table.synonymous_only())
+            if min_cost == float('inf'):
+                info += ("\nNo sequence avoids the unwanted patterns with synonymous codon substitutions only; "
+                         "falling back to the full alphabet.\n")
+                min_cost, optimized_seq = run(cost_table)
+            elif request.coding_mode == "auto" and min_cost > request.w + 1:
+                info += (f"\nThe synonymous-only solution costs {format_cost(min_cost)}, more than a non-synonymous "
+                         f"substitution (at least {format_cost(request.w + 1)}); re-optimizing with the full "
+                         f"alphabet.\n")
+                min_cost, optimized_seq = run(cost_table)
+            elif request.coding_mode == "auto" and request.top_k > 1 and (
+                    len(found) < request.top_k or found[-1][0] > request.w + 1):
+                # Every alternative, not only the cheapest, must beat a non-synonymous substitution
+                info += (f"\nThe {request.top_k} cheapest sequences may include non-synonymous substitutions; "
+                         f"re-optimizing with the full alphabet.\n")
+                min_cost, optimized_seq = run(cost_table)
+
+        if stats.get("dp_cells"):
+            info += (f"\nReachability pruning: {stats['pruned_cells']:,} of {stats['dp_cells']:,} DP cells "
+                     f"({stats['pruned_cells'] / stats['dp_cells']:.1%}) cannot lie on a finite-cost path and were "
+                     f"skipped.\n")
+        if stats.get("reused_columns"):
+            info += (f"\nIncremental DP: {stats['reused_columns']:,} of {stats['dp_columns']:,} DP columns "
+                     f"({stats['reused_columns'] / stats['dp_columns']:.1%}) were reused from the previous run.\n")
+        if stats.get("lattice_cells"):
+            info += (f"\nA* search: {stats['expanded_cells']:,} of {stats['lattice_cells']:,} lattice cells "
+                     f"({stats['expanded_cells'] / stats['lattice_cells']:.1%}) were expanded.\n")
+
+        if request.marginals:
+            # Over the alphabet of the final run, so that forced bases respect the coding mode
+            info += EliminationController._marginal_costs(target_sequence, fsm, tables[-1], checkpoints, marginals)
 
-        # Initialize all bigram states in column 2
-        for v in fsm.V:
-            if len(v) == 2:
-                changes_1, cost_f_1 = initial_cost_function(1, v[0])
-                changes_2, cost_f_2 = initial_cost_function(2, v[1])
+        # If no valid sequence was found
+        if min_cost == float('inf'):
+            info += "\nNo valid sequence found that avoids the unwanted patterns."
+            return info, None, None, min_cost
 
-                cost = cost_f_1 + cost_f_2
-                changes = changes_1[0] + changes_2[0], changes_1[1] + changes_2[1]
+        # The DP only tracks costs; rebuild the change rows along the chosen path
+        cost_contribution, cost_substitution = EliminationController.describe_changes(
+            target_sequence, coding_positions, optimized_seq, cost_table)
 
-                A[(2, v)] = cost
-                A_info[(2, v)] = changes, cost
+        if request.top_k > 1:
+            info += f"\nTop-k search: found {len(found)} of the {request.top_k} requested sequences.\n"
+            if alternatives is not None:
+                alternatives.extend(EliminationController.describe_alternatives(target_sequence, found))
 
-        # Fill the dynamic programming table
-        for i in range(3, n + 1):
-            for v in fsm.V:
-                best_cost = float('inf')
-                best_prev = None
-                best_info = None
-                for (u, sigma) in predecessors[v]:
-                    changes, cost_f = cost_function(i, u, sigma)
-                    cost = A[(i - 1, u)] + cost_f
-                    if cost < best_cost:
-                        best_cost = cost
-                        best_prev = (u, sigma)
-                        best_info = (changes, cost_f)
+        # Append final information to the info string
+        info += f"\n{format_text_bold_for_output('_' * 50)}\n"
+        info += "\n🚀 Elimination Process Completed!\n"
+        info += f"📆 {format_current_date()}"
 
-                if best_prev is not None:
-                    A[(i, v)] = best_cost
-                    A_star[(i, v)] = best_prev
-                    A_info[(i, v)] = best_info
+        return info, cost_contribution, cost_substitution, optimized_seq, min_cost
 
-        # Find the minimum cost and final state
-        min_cost = float('inf')
-        final_state = None
-        for v in fsm.V:
-            if A[(n, v)] < min_cost:
-                min_cost = A[(n, v)]
-                final_state = v
+    @staticmethod
+    def _marginal_costs(target_sequence, fsm, cost_table, checkpoints, marginals):
+        """Extend ``marginals`` with the marginal costs over ``cost_table`` and return their info line."""
+        costs = marginal_costs(target_sequence, fsm, cost_table, checkpoints)
+        if marginals is not None:
+            marginals.extend(costs.tolist())
+        free = len(MarginalCosts(costs).free_positions())
+        return f"\nMarginal costs: {free:,} of {len(costs):,} positions can change without raising the cost.\n"
 
-        # If no valid sequence was found
-        if min_cost == float('inf'):
-            info += "\nNo valid sequence found that avoids the unwanted patterns."
-            return info, None, None, min_cost
+    @staticmethod
+    def sweep(target_sequence, unwanted_patterns, coding_positions, requests, fsm=None):
+        """Run the elimination for several cost settings in a single DP pass.
 
-        # Reconstruct the sequence with the minimum cost
-        path = []
-        sequence = []
-        cost_contribution = []
-        cost_substitution = []
+        The requests must only differ in ``alpha``, ``beta``, ``w`` and
+        ``optimized_codon``; the automaton and the options are those of the
+        first one. All settings are filled together by :func:`eliminate_sweep`,
+        and the coding mode is applied per setting as in :meth:`eliminate`,
+        re-running the settings that need the full alphabet in a second pass.
 
-        # starting from the end
-        current_state = final_state
+        Args:
+            target_sequence: The input DNA sequence (without the ``*`` marker).
+            unwanted_patterns: Iterable of patterns that must not appear in the result.
+            coding_positions: Per-base codon-phase array (0 for non-coding).
+            requests: The :class:`OptimizationRequest` of every setting.
+            fsm: Optional automaton from :meth:`build_fsm` for the same patterns; built here when omitted.
 
-        # Backtrack to reconstruct the sequence
-        for i in range(n, 2, -1):
-            if (i, current_state) not in A_star:
-                raise ValueError(f"No transition found for position {i} and state {current_state}")
+        Returns:
+            A list with a tuple ``(cost_contribution, cost_substitution, optimized_seq, min_cost)``
+            per request; ``optimized_seq`` is ``None`` and ``min_cost`` is ``inf`` when no valid
+            sequence exists.
+        """
+        request = requests[0]
+        unwanted_patterns = request.patterns_to_eliminate(unwanted_patterns)
+
+        if not PatternScanner.for_patterns(unwanted_patterns).contains_any(target_sequence):
+            return [([], [], target_sequence, 0.0) for _ in requests]
+
+        cost_tables = [EliminationScorerConfig.cost_table(target_sequence, coding_positions, r.codon_usage, r.alpha,
+                                                          r.beta, r.w, r.optimized_codon) for r in requests]
+        if fsm is None:
+            fsm, _ = EliminationController.build_fsm(unwanted_patterns, request)
+
+        if request.coding_mode == "full":
+            results = eliminate_sweep(target_sequence, fsm, cost_tables)
+        else:
+            results = eliminate_sweep(target_sequence, fsm, [table.synonymous_only() for table in cost_tables])
+            rerun = [k for k, (min_cost, _) in enumerate(results)
+                     if min_cost == float('inf') or (request.coding_mode == "auto" and min_cost > requests[k].w + 1)]
+            if rerun:
+                full = eliminate_sweep(target_sequence, fsm, [cost_tables[k] for k in rerun])
+                for k, result in zip(rerun, full):
+                    results[k] = result
+
+        outcomes = []
+        for cost_table, (min_cost, optimized_seq) in zip(cost_tables, results):
+            if optimized_seq is None:
+                outcomes.append(([], [], None, min_cost))
+                continue
+            cost_contribution, cost_substitution = EliminationController.describe_changes(
+                target_sequence, coding_positions, optimized_seq, cost_table)
+            outcomes.append((cost_contribution, cost_substitution, optimized_seq, min_cost))
+        return outcomes
 
-            prev_state, char = A_star[(i, current_state)]  # Get the previous state and symbol
-            (original_codon, modified_codon), cost_f = A_info[(i, current_state)]
+    @staticmethod
+    def build_fsm(unwanted_patterns, request=None):
+        """Build the pattern-avoiding automaton with the engine options of ``request``.
 
-            if cost_f > 0:
-                cost_contribution.append(
-                    {"Position": i, "Original": original_codon, "Optimized": modified_codon, "Cost": f"{cost_f:.3f}".rstrip('0').rstrip('.')})
+        The automaton is loaded from the on-disk cache when ``request.fsm_cache`` is set and
+        minimized when ``request.minimize_fsm`` is set.
 
-            # Record the change that actually occurred
-            if original_codon != modified_codon and cost_f == 0:
-                cost_substitution.append({"Position": i, "Original": original_codon, "Optimized": modified_codon, "Cost": f"{cost_f:.3f}".rstrip('0').rstrip('.')})
+        Args:
+            unwanted_patterns: The patterns to avoid, reverse complements already included.
+            request: :class:`OptimizationRequest` holding the options; taken from the app data when omitted.
 
-            path.append((i, current_state))
-            sequence.append(char)
+        Returns:
+            A tuple ``(fsm, info)`` where ``info`` reports the minimization, or is empty.
+        """
+        if request is None:
+            request = OptimizationRequest.from_app_data()
 
-            current_state = prev_state
+        alphabet = EliminationScorerConfig().alphabet
+        if request.fsm_cache:
+            fsm = load_fsm(unwanted_patterns, alphabet)
+        else:
+            fsm = FSM(unwanted_patterns, alphabet)
 
-        # Concatenate S after v2
-        path.append((2, current_state))
-        sequence.append(current_state)
+        info = ""
+        if request.minimize_fsm:
+            n_states = len(fsm.compiled)
+            fsm = FSM(unwanted_patterns, alphabet, compiled=fsm.compiled.minimized())
+            info = f"\nFSM minimization: {n_states} states reduced to {len(fsm.compiled)}.\n"
 
-        # Reconstruct the first two positions (0 and 1) from current_state
-        # Check and log changes at positions 0 and 1
-        original_0, original_1 = target_sequence[0], target_sequence[1]
+        return fsm, info
 
-        if coding_positions[1] == 0:
-            (original_base, modified_base), cost_f = initial_cost_function(2, current_state[1])
+    @staticmethod
+    def _eliminate_python(target_sequence, fsm, cost_table, stats=None):
+        """Fill the DP table with the reference pure-Python engine.
 
-            if cost_f > 0:
-                cost_contribution.append(
-                    {"Position": 2, "Original": original_base, "Optimized": modified_base, "Cost": f"{cost_f:.3f}".rstrip('0').rstrip('.')})
+        Runs on the compiled FSM; states are visited in id order and
+        predecessors in (state, base) order so that ties are broken
+        deterministically and identically to the vectorized engine. Only the previous and current DP columns are
+        kept; the path is recovered from a packed :class:`BackpointerTable`.
 
-            if current_state[1] != original_1 and cost_f == 0:
-                cost_substitution.append({"Position": 2, "Original": original_base, "Optimized": modified_base, "Cost": f"{cost_f:.3f}".rstrip('0').rstrip('.')})
+        With at least ``MIN_PRUNED_STATES`` states, cells that cannot lie on
+        a finite-cost path (see :func:`live_cells`) are skipped; a predecessor
+        of a live cell through a finite-cost transition is live itself, so
+        the costs and ties are unchanged.
 
-        if coding_positions[0] == 0:
-            (original_base, modified_base), cost_f = initial_cost_function(1, current_state[0])
+        Args:
+            stats: Optional dict whose ``dp_cells`` and ``pruned_cells`` counters are increased
+                by the number of cells of this fill and of skipped cells.
 
-            if cost_f > 0:
-                cost_contribution.append({"Position": 1, "Original": original_base, "Optimized": modified_base, "Cost": f"{cost_f:.3f}".rstrip('0').rstrip('.')})
+        Returns:
+            A tuple ``(min_cost, optimized_seq)``; the sequence is ``None`` when
+            ``min_cost`` is ``inf``.
+        """
+        n = len(target_sequence)
+        compiled = fsm.compiled
+        states = compiled.states
+        sigmas = ''.join(BASES)
+
+        # Invert the transition table into a predecessor map so the DP inner
+        # loop iterates only over states that actually transition into v,
+        # instead of scanning every (u, sigma) pair. Drops the fill complexity
+        # from O(n·|V|²·|Σ|) to O(n·|V|·|Σ|). Each edge carries its index into
+        # a cost-table row.
+        predecessors = [[] for _ in states]
+        state_bigram = compiled.state_bigram.tolist()
+        for u_id, row in enumerate(compiled.transitions.tolist()):
+            for s_id, v_id in enumerate(row):
+                if v_id != FORBIDDEN:
+                    key = state_bigram[u_id] * len(BASES) + s_id
+                    predecessors[v_id].append((u_id, key, BackpointerTable.encode(u_id, s_id)))
+
+        if n < 2:
+            return float('inf'), None
+
+        # States of every column that can lie on a finite-cost path
+        live = None
+        if len(states) >= MIN_PRUNED_STATES:
+            live = live_cells(PredecessorGraph(fsm), cost_table)
+            if stats is not None:
+                n_cells = (n - 2) * len(states)
+                stats["dp_cells"] = stats.get("dp_cells", 0) + n_cells
+                stats["pruned_cells"] = stats.get("pruned_cells", 0) + n_cells - int(live[3:].sum())
+
+        # Initialize all bigram states in column 2
+        column = [float('inf')] * len(states)
+        initial = cost_table.initial.tolist()
+        for b, v_id in enumerate(compiled.bigram_states.tolist()):
+            column[v_id] = initial[0][b // len(BASES)] + initial[1][b % len(BASES)]
+
+        # Backpointer table (packed previous state and transition symbol per cell)
+        back = BackpointerTable(n, len(states))
+        rows = cost_table.rows.tolist()
+        row_index = cost_table.row_index.tolist()
+
+        # Fill the dynamic programming table
+        for i in range(3, n + 1):
+            costs = rows[row_index[i - 1]]
+            prev_column = column
+            column = [float('inf')] * len(states)
+            codes = [back.none] * len(states)
+            for v_id in (range(len(states)) if live is None else np.flatnonzero(live[i]).tolist()):
+                best_cost = float('inf')
+                for (u_id, key, code) in predecessors[v_id]:
+                    cost = prev_column[u_id] + costs[key]
+                    if cost < best_cost:
+                        best_cost = cost
+                        codes[v_id] = code
 
-            if current_state[0] != original_0 and cost_f == 0:
-                cost_substitution.append({"Position": 1, "Original": original_base, "Optimized": modified_base, "Cost": f"{cost_f:.3f}".rstrip('0').rstrip('.')})
+                column[v_id] = best_cost
 
+            back.set_column(i, codes)
 
-        # Reverse the sequence and changes info for correct order
-        path.reverse()
-        sequence.reverse()
-        cost_substitution.reverse()
-        cost_contribution.reverse()
+        # Find the minimum cost and final state
+        min_cost = float('inf')
+        final_state = None
+        for v_id in range(len(states)):
+            if column[v_id] < min_cost:
+                min_cost = column[v_id]
+                final_state = v_id
 
-        # Append final information to the info string
-        info += f"\n{format_text_bold_for_output('_' * 50)}\n"
-        info += "\n🚀 Elimination Process Completed!\n"
-        info += f"📆 {format_current_date()}"
+        # If no valid sequence was found
+        if min_cost == float('inf'):
+            return min_cost, None
+
+        # Backtrack to reconstruct the sequence
+        first_state, symbols = back.trace(final_state, sigmas)
+        return min_cost, states[first_state] + ''.join(symbols)
+
+    @staticmethod
+    def describe_alternatives(target_sequence, found):
+        """Build one row per alternative sequence from the ``(cost, sequence)`` pairs of :func:`eliminate_top_k`.
+
+        Args:
+            target_sequence: The input DNA sequence.
+            found: The alternatives in order of increasing cost.
+
+        Returns:
+            A list of ``{"Rank", "Cost", "Changed_Bases", "Sequence"}`` rows, cheapest first.
+        """
+        return [{"Rank": rank, "Cost": format_cost(cost),
+                 "Changed_Bases": sum(a != b for a, b in zip(target_sequence, sequence)), "Sequence": sequence}
+                for rank, (cost, sequence) in enumerate(found, start=1)]
+
+    @staticmethod
+    def describe_changes(target_sequence, coding_positions, optimized_seq, cost_table):
+        """Rebuild the cost-contribution and substitution rows along an optimized sequence.
+
+        The DP fill deals only in costs and backpointers; the charged costs
+        are read back from ``cost_table`` in one pass over the chosen path,
+        and the base or codon strings are only built for the reported rows.
+
+        Args:
+            target_sequence: The input DNA sequence.
+            coding_positions: Per-base codon-phase array (0 for non-coding).
+            optimized_seq: The sequence selected by the DP.
+            cost_table: The :class:`CostTable` the DP ran on.
+
+        Returns:
+            A tuple ``(cost_contribution, cost_substitution)`` ordered by position.
+        """
+        cost_contribution = []
+        cost_substitution = []
 
-        return info, cost_contribution, cost_substitution, ''.join(sequence), min_cost
+        costs = cost_table.position_costs(optimized_seq).tolist()
+        for i, (original, modified, cost_f) in enumerate(zip(target_sequence, optimized_seq, costs), start=1):
+            codon_pos = coding_positions[i - 1]
+            if codon_pos in (-3, 3):
+                # A codon is charged at its third position
+                _record_change(cost_contribution, cost_substitution, i, target_sequence[i - 3:i],
+                               optimized_seq[i - 3:i], cost_f)
+            elif codon_pos == 0 and (cost_f > 0 or original != modified):
+                _record_change(cost_contribution, cost_substitution, i, original, modified, cost_f)
+
+        return cost_contribution, cost_substitution
@@ -1,5 +1,12 @@
 from collections import deque
 
+import numpy as np
+
+from biosynth.utils.cost_utils import BASES, BIGRAMS, BIGRAM_INDEX, IUPAC_CODES
+
+# Transition-table entry of a transition that would complete an unwanted pattern.
+FORBIDDEN = -1
+
 
 def kmp_based_fsm_bigram(unwanted_patterns, sigma):
     """
@@ -20,10 +27,12 @@ def kmp_based_fsm_bigram(unwanted_patterns, sigma):
     states = set()
     epsilon = ''
 
-    # Prefix elongation and invalid transitions
+    # Prefix elongation and invalid transitions; the latter are set last, so that a
+    # pattern that is a prefix of another one stays invalid whatever the set order
     for p in unwanted_patterns:
-        for j in range(1, len(p) + 1):
+        for j in range(1, len(p)):
             f[(p[:j - 1], p[j - 1])] = p[:j]
+    for p in unwanted_patterns:
         f[(p[:- 1], p[- 1])] = None  # Invalid transition into complete pattern
 
     # Computing state space V and the functions f and g
@@ -75,6 +84,74 @@ def kmp_based_fsm_bigram(unwanted_patterns, sigma):
     return states, f, g
 
 
+def degenerate_fsm_bigram(unwanted_patterns, sigma):
+    """
+    Constructs the FSM of patterns written with IUPAC codes, without expanding them into literals.
+
+    A state is the pair (last two characters, set of partially matched
+    pattern prefixes), the latter kept as one Shift-And bit vector with a bit
+    per pattern position; a transition completing a pattern is invalid. The
+    states are discovered breadth-first from the sixteen bigrams and named
+    after the shortest string reaching them, so that, as in
+    :func:`kmp_based_fsm_bigram`, the last two characters of a state's name
+    are its last two bases and every bigram is a state. Patterns shorter than
+    three characters are not enforced, also as in that construction.
+
+    Args:
+        unwanted_patterns (set): The set of unwanted patterns, possibly with IUPAC codes.
+        sigma (set): The alphabet of allowed characters.
+
+    Returns:
+        V (set): The set of states in the FSM.
+        f (dict): The transition function of the FSM, mapping (state, character) pairs to new states.
+        g (dict): Empty; kept for symmetry with :func:`kmp_based_fsm_bigram`.
+    """
+    # Shift-And masks: bit k of masks[s] is set when s matches the pattern position of bit k
+    masks = {s: 0 for s in sigma}
+    starts = 0
+    finals = 0
+    offset = 0
+    for p in sorted(p for p in unwanted_patterns if len(p) > 2):
+        starts |= 1 << offset
+        for k, code in enumerate(p):
+            for s in IUPAC_CODES.get(code, code):
+                if s in masks:
+                    masks[s] |= 1 << (offset + k)
+        finals |= 1 << (offset + len(p) - 1)
+        offset += len(p)
+
+    def step(prefixes, s):
+        return ((prefixes << 1) | starts) & masks[s]
+
+    f = {}
+    names = {}
+    state_queue = deque()
+    for x in sorted(sigma):
+        for y in sorted(sigma):
+            key = (x + y, step(step(0, x), y))
+            names[key] = x + y
+            state_queue.append(key)
+
+    while state_queue:
+        key = state_queue.popleft()
+        last2, prefixes = key
+        v = names[key]
+
+        for s in sorted(sigma):
+            next_prefixes = step(prefixes, s)
+            if next_prefixes & finals:
+                f[(v, s)] = None  # Invalid transition into complete pattern
+                continue
+
+            next_key = (last2[1] + s, next_prefixes)
+            if next_key not in names:
+                names[next_key] = v + s
+                state_queue.append(next_key)
+            f[(v, s)] = names[next_key]
+
+    return set(names.values()), f, {}
+
+
 class FSM:
     """
     A class representing a finite state machine (FSM) for eliminating unwanted patterns from a sequence.
@@ -91,15 +168,182 @@ class FSM:
         calculate_fsm(self, P, Σ): Constructs the FSM by calculating the states and transition function.
     """
 
-    def __init__(self, unwanted_patterns, alphabet):
+    def __init__(self, unwanted_patterns, alphabet, compiled=None):
         """
         Initializes the FSM with the given unwanted patterns and alphabet.
 
         Args:
-            unwanted_patterns (set): The set of unwanted patterns to be eliminated.
+            unwanted_patterns (set): The set of unwanted patterns to be eliminated. Patterns with
+                IUPAC codes are compiled directly by :func:`degenerate_fsm_bigram`.
             alphabet (set): The alphabet of allowed characters in the sequence.
+            compiled (CompiledFSM): A previously compiled form of the same automaton, e.g. loaded
+                from the on-disk cache. The construction is then skipped and the string form is
+                derived from it on first use; ``g``, only needed while constructing, is left empty.
         """
         self.sigma = alphabet
         self.unwanted_patterns = unwanted_patterns
+        self._compiled = compiled
+
+        if compiled is not None:
+            self._V, self._f, self.g = None, None, {}
+        elif all(set(p) <= set(self.sigma) for p in self.unwanted_patterns):
+            self._V, self._f, self.g = kmp_based_fsm_bigram(self.unwanted_patterns, self.sigma)
+        else:
+            self._V, self._f, self.g = degenerate_fsm_bigram(self.unwanted_patterns, self.sigma)
+
+    @property
+    def V(self):
+        """The set of string states."""
+        if self._V is None:
+            self._V = set(self._compiled.states)
+        return self._V
+
+    @property
+    def f(self):
+        """The transition function, mapping ``(state, character)`` to the next state or ``None``."""
+        if self._f is None:
+            self._f = self._compiled.transition_dict()
+        return self._f
+
+    @property
+    def compiled(self):
+        """The integer form of the automaton, built on first use (see :class:`CompiledFSM`)."""
+        if self._compiled is None:
+            self._compiled = CompiledFSM.build(self)
+        return self._compiled
+
+
+class CompiledFSM:
+    """
+    Integer-indexed form of an :class:`FSM` over the DNA alphabet.
+
+    States are numbered ``0..|V|-1`` in sorted order of their strings, and
+    bases are numbered in ``BASES`` order, so that the DP engines can run on
+    arrays instead of string-keyed dict lookups.
 
-        self.V, self.f, self.g = kmp_based_fsm_bigram(self.unwanted_patterns, self.sigma)
+    Attributes:
+        states (list): The string states, in id order.
+        index (dict): State string to its id.
+        transitions (np.ndarray): ``|V| x 4`` int32 next-state ids, ``FORBIDDEN`` for
+            transitions that complete an unwanted pattern.
+        state_bigram (np.ndarray): Bigram class (index into ``BIGRAMS``) of the last two bases of every state.
+        bigram_states (np.ndarray): Ids of the two-letter states, in ``BIGRAMS`` order.
+    """
+
+    def __init__(self, states, transitions, state_bigram, bigram_states):
+        self.states = states
+        self.index = {v: k for k, v in enumerate(states)}
+        self.transitions = transitions
+        self.state_bigram = state_bigram
+        self.bigram_states = bigram_states
+
+    def __len__(self):
+        return len(self.states)
+
+    @staticmethod
+    def build(fsm):
+        """
+        Numbers the states of ``fsm`` and tabulates its transition function.
+
+        Args:
+            fsm (FSM): The automaton to compile.
+
+        Returns:
+            CompiledFSM: The integer form of ``fsm``.
+        """
+        states = sorted(fsm.V)
+        index = {v: k for k, v in enumerate(states)}
+
+        transitions = np.full((len(states), len(BASES)), FORBIDDEN, dtype=np.int32)
+        for u_id, u in enumerate(states):
+            for s_id, s in enumerate(BASES):
+                v = fsm.f[(u, s)]
+                if v is not None:
+                    transitions[u_id, s_id] = index[v]
+
+        state_bigram = np.fromiter((BIGRAM_INDEX[v[-2:]] for v in states), dtype=np.int32, count=len(states))
+        bigram_states = np.fromiter((index[v] for v in BIGRAMS), dtype=np.int32, count=len(BIGRAMS))
+        return CompiledFSM(states, transitions, state_bigram, bigram_states)
+
+    def minimized(self):
+        """
+        Merges states that are indistinguishable for the elimination DP.
+
+        Two states are merged when they end in the same two bases, which is
+        all the cost function looks at, and every base either leads both to
+        merged states or is forbidden from both. The blocks are found by
+        iterative partition refinement starting from the bigram classes, so
+        the set of pattern-free sequences and the cost of each of them are
+        unchanged; only ties between equally cheap sequences may be broken
+        differently.
+
+        Blocks keep the order of their first state, and each is named after
+        its shortest state, so the two-letter states keep their names.
+
+        Returns:
+            CompiledFSM: The minimized automaton.
+        """
+        labels = self.state_bigram.astype(np.int64)
+        n_blocks = len(np.unique(labels))
+        forbidden = self.transitions == FORBIDDEN
+        while True:
+            successors = np.where(forbidden, -1, labels[np.where(forbidden, 0, self.transitions)])
+            _, refined = np.unique(np.column_stack([labels, successors]), axis=0, return_inverse=True)
+            refined = refined.reshape(-1)
+            if refined.max(initial=-1) + 1 == n_blocks:
+                break
+            labels, n_blocks = refined, refined.max() + 1
+
+        # Number the blocks in order of their first state
+        first = np.full(n_blocks, len(self.states))
+        np.minimum.at(first, labels, np.arange(len(self.states)))
+        order = np.argsort(first)
+        block = np.empty(n_blocks, dtype=np.int64)
+        block[order] = np.arange(n_blocks)
+        labels = block[labels]
+        first = first[order]
+
+        names = [None] * n_blocks
+        for v_id, v in enumerate(self.states):
+            b = labels[v_id]
+            if names[b] is None or len(v) < len(names[b]):
+                names[b] = v
+
+        transitions = self.transitions[first]
+        transitions = np.where(transitions == FORBIDDEN, FORBIDDEN,
+                               labels[np.where(transitions == FORBIDDEN, 0, transitions)]).astype(np.int32)
+        return CompiledFSM(names, transitions, self.state_bigram[first],
+                           labels[self.bigram_states].astype(np.int32))
+
+    def transition_dict(self):
+        """Return the transition function in the string form of :attr:`FSM.f`."""
+        f = {}
+        for u, row in zip(self.states, self.transitions.tolist()):
+            for s, v_id in zip(BASES, row):
+                f[(u, s)] = None if v_id == FORBIDDEN else self.states[v_id]
+        return f
+
+    def save(self, file):
+        """
+        Writes the arrays to ``file`` in NumPy's ``.npz`` format.
+
+        Args:
+            file (str or file): Destination path or binary file object.
+        """
+        np.savez(file, states=np.array(self.states), transitions=self.transitions,
+                 state_bigram=self.state_bigram, bigram_states=self.bigram_states)
+
+    @staticmethod
+    def load(file):
+        """
+        Reads an automaton written by :meth:`save`.
+
+        Args:
+            file (str or file): Source path or binary file object.
+
+        Returns:
+            CompiledFSM: The loaded automaton.
+        """
+        with np.load(file, allow_pickle=False) as data:
+            return CompiledFSM(data["states"].tolist(), data["transitions"], data["state_bigram"],
+                               data["bigram_states"])
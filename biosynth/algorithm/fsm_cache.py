@@ -0,0 +1,97 @@
+import hashlib
+import os
+import tempfile
+import zipfile
+
+from biosynth.algorithm.fsm import FSM, CompiledFSM
+
+# Bumped whenever the automaton construction or the file layout changes.
+CACHE_VERSION = 2
+
+
+def cache_root():
+    """
+    Returns the directory holding BioSynth's on-disk caches.
+
+    ``$BIOSYNTH_CACHE_DIR`` takes precedence, then ``$XDG_CACHE_HOME/biosynth``
+    and finally ``~/.cache/biosynth``.
+    """
+    path = os.environ.get("BIOSYNTH_CACHE_DIR")
+    if not path:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        path = os.path.join(base, "biosynth")
+    return path
+
+
+def cache_dir():
+    """Returns the directory holding the cached automata."""
+    return os.path.join(cache_root(), "fsm")
+
+
+def pattern_set_key(unwanted_patterns, alphabet):
+    """Return the content hash identifying the automaton of ``unwanted_patterns`` over ``alphabet``."""
+    content = "\n".join([f"v{CACHE_VERSION}", "".join(sorted(alphabet))] + sorted(set(unwanted_patterns)))
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def cache_path(unwanted_patterns, alphabet):
+    """Return the cache file of the automaton of ``unwanted_patterns`` over ``alphabet``."""
+    return os.path.join(cache_dir(), f"{pattern_set_key(unwanted_patterns, alphabet)}.npz")
+
+
+def store_fsm(fsm):
+    """
+    Writes the compiled form of ``fsm`` to the cache.
+
+    The file is written under a temporary name and renamed into place, so
+    concurrent runs never read a partial entry.
+
+    Args:
+        fsm (FSM): The automaton to store.
+
+    Returns:
+        str: Path of the cache entry.
+
+    Raises:
+        OSError: If the cache directory cannot be written.
+    """
+    path = cache_path(fsm.unwanted_patterns, fsm.sigma)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fsm.compiled.save(fh)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+def load_fsm(unwanted_patterns, alphabet):
+    """
+    Returns the automaton of ``unwanted_patterns``, from the cache when possible.
+
+    On a miss the automaton is built and stored; an unreadable or unwritable
+    cache only costs the construction time.
+
+    Args:
+        unwanted_patterns (set): The set of unwanted patterns to be eliminated.
+        alphabet (set): The alphabet of allowed characters in the sequence.
+
+    Returns:
+        FSM: The pattern-avoiding automaton.
+    """
+    path = cache_path(unwanted_patterns, alphabet)
+    try:
+        return FSM(unwanted_patterns, alphabet, compiled=CompiledFSM.load(path))
+    except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+        pass
+
+    fsm = FSM(unwanted_patterns, alphabet)
+    try:
+        store_fsm(fsm)
+    except OSError:
+        pass
+    return fsm
@@ -0,0 +1,160 @@
+import numpy as np
+
+from biosynth.algorithm.backpointers import BackpointerTable, FIRST_COLUMN
+from biosynth.algorithm.vectorized_dp import PredecessorGraph, back_codes, fill_column, initial_column
+from biosynth.utils.cost_utils import BASES
+
+# Columns between two stored DP columns; a resumed run recomputes at most this many unchanged columns.
+CHECKPOINT_INTERVAL = 64
+
+
+class DPCheckpoints:
+    """
+    Forward state of the last run of :func:`eliminate_incremental`, kept to resume it after local edits.
+
+    Column ``i`` of the DP only depends on the costs of positions ``1..i``,
+    so after an edit every column before the first changed cost, and its
+    backpointers, are still valid. The DP columns are stored every
+    ``interval`` columns, plus the last one, in ``interval`` times less
+    memory than the backpointers.
+
+    Attributes:
+        interval (int): Columns between two stored DP columns.
+        compiled (CompiledFSM): The automaton of the last run.
+        graph (PredecessorGraph): Its predecessor arrays.
+        cost_table (CostTable): The costs of the last run.
+        back (BackpointerTable): The backpointers of the last run.
+        columns (dict): Stored DP columns by 1-based column index.
+    """
+
+    def __init__(self, interval=CHECKPOINT_INTERVAL):
+        self.interval = interval
+        self.compiled = None
+        self.graph = None
+        self.cost_table = None
+        self.back = None
+        self.columns = {}
+
+    def clear(self):
+        """Forget the last run, so that the next one starts from column 2."""
+        self.__init__(self.interval)
+
+    def first_changed_column(self, cost_table):
+        """
+        Returns the first DP column of a run on ``cost_table`` that differs from the last run.
+
+        Args:
+            cost_table (CostTable): The costs of the new run.
+
+        Returns:
+            int: A column from 2 (nothing can be reused) to ``min(n_last, n) + 1``
+            (every common column is unchanged).
+        """
+        previous = self.cost_table
+        common = min(len(previous), len(cost_table))
+        if not np.array_equal(previous.initial, cost_table.initial):
+            return 2
+
+        old_index, new_index = previous.row_index[:common], cost_table.row_index[:common]
+        if previous.rows is cost_table.rows or np.array_equal(previous.rows, cost_table.rows):
+            changed = old_index != new_index
+        else:
+            changed = np.any(previous.rows[old_index] != cost_table.rows[new_index], axis=1)
+
+        # The first two positions are covered by the initial costs
+        positions = np.flatnonzero(changed[2:])
+        return int(positions[0]) + 3 if len(positions) else common + 1
+
+    def resume_column(self, fsm, cost_table):
+        """
+        Returns the stored column from which a run of ``fsm`` on ``cost_table`` can resume.
+
+        Args:
+            fsm (FSM): The automaton of the new run.
+            cost_table (CostTable): The costs of the new run.
+
+        Returns:
+            int: The index of a stored, still valid DP column, or 0 when the
+            run must start from column 2.
+        """
+        compiled = fsm.compiled
+        if (self.compiled is None or self.compiled.states != compiled.states
+                or not np.array_equal(self.compiled.transitions, compiled.transitions)):
+            return 0
+
+        limit = min(self.first_changed_column(cost_table) - 1, len(cost_table))
+        valid = [i for i in self.columns if i <= limit]
+        return max(valid, default=0)
+
+
+def eliminate_incremental(target_sequence, fsm, cost_table, checkpoints=None, stats=None):
+    """
+    Runs the vectorized elimination DP, resuming from the checkpoints of the previous run.
+
+    The DP is filled from the last stored column before the first position
+    whose costs differ from the previous run of ``checkpoints``, and the
+    backpointers of the columns before it are reused; a single-base edit
+    near the end of a long sequence only recomputes the last few columns.
+    The result is the one of
+    :func:`~biosynth.algorithm.vectorized_dp.eliminate_vectorized`.
+
+    Args:
+        target_sequence (str): The input DNA sequence.
+        fsm (FSM): The pattern-avoiding automaton.
+        cost_table (CostTable): Precomputed costs per position, last bigram and base.
+        checkpoints (DPCheckpoints): The state of the previous run, updated to this one; a
+            fresh :class:`DPCheckpoints` runs the whole DP.
+        stats (dict): Optional dictionary that receives ``dp_columns`` and ``reused_columns``.
+
+    Returns:
+        tuple: ``(min_cost, optimized_seq)``; ``optimized_seq`` is ``None`` when
+        no sequence avoids the unwanted patterns.
+    """
+    n = len(target_sequence)
+    if checkpoints is None:
+        checkpoints = DPCheckpoints()
+
+    if n < 2:
+        checkpoints.clear()
+        return float('inf'), None
+
+    start = checkpoints.resume_column(fsm, cost_table)
+    if start:
+        graph = checkpoints.graph
+        column = checkpoints.columns[start]
+        back = checkpoints.back
+        if len(back.table) != max(n - FIRST_COLUMN + 1, 0):
+            back = BackpointerTable(n, len(graph.states))
+            reused = max(start - FIRST_COLUMN + 1, 0)
+            back.table[:reused] = checkpoints.back.table[:reused]
+        columns = {i: stored for i, stored in checkpoints.columns.items() if i <= start}
+    else:
+        graph = PredecessorGraph(fsm)
+        start = 2
+        column = initial_column(graph, cost_table)
+        back = BackpointerTable(n, len(graph.states))
+        columns = {2: column}
+
+    for i in range(start + 1, n + 1):
+        column, best_edge = fill_column(graph, column, cost_table.column(i))
+        back.set_column(i, back_codes(graph, best_edge, back))
+        if i % checkpoints.interval == 0 or i == n:
+            columns[i] = column
+
+    checkpoints.compiled = fsm.compiled
+    checkpoints.graph = graph
+    checkpoints.cost_table = cost_table
+    checkpoints.back = back
+    checkpoints.columns = columns
+
+    if stats is not None:
+        stats["dp_columns"] = n - 2
+        stats["reused_columns"] = start - 2
+
+    final_state = int(np.argmin(column))
+    min_cost = float(column[final_state])
+    if min_cost == float('inf'):
+        return min_cost, None
+
+    first_state, symbols = back.trace(final_state, ''.join(BASES))
+    return min_cost, graph.states[first_state] + ''.join(symbols)
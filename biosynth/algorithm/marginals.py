@@ -0,0 +1,154 @@
+import numpy as np
+
+from biosynth.algorithm.incremental import CHECKPOINT_INTERVAL
+from biosynth.algorithm.vectorized_dp import PredecessorGraph, fill_column, initial_column
+from biosynth.utils.cost_utils import BASES, BASE_INDEX
+
+
+def _min_by_base(totals, bases):
+    """Return the minimum of ``totals`` over the states whose base (see ``bases``) is each of ``BASES``."""
+    minimums = np.full(len(BASES), np.inf)
+    np.minimum.at(minimums, bases, totals)
+    return minimums
+
+
+def _stored_columns(graph, cost_table, interval):
+    """Return the forward DP columns 2, every multiple of ``interval`` and ``n``, by 1-based column index."""
+    n = len(cost_table)
+    column = initial_column(graph, cost_table)
+    columns = {2: column}
+    for i in range(3, n + 1):
+        column, _ = fill_column(graph, column, cost_table.column(i))
+        if i % interval == 0 or i == n:
+            columns[i] = column
+    return columns
+
+
+def marginal_costs(target_sequence, fsm, cost_table, checkpoints=None):
+    """
+    Computes the cheapest total cost with every base forced at every position.
+
+    A forward pass gives the cost of the cheapest prefix into every cell of
+    the DP, and a backward pass over the same automaton the cost of the
+    cheapest suffix out of it. Their sum is the cheapest sequence through the
+    cell, and the cell's state ends in the base of its position, so entry
+    ``[p, b]`` is the minimum over the cells of column ``p + 1`` ending in
+    base ``b``. The minimum of every row is the optimal cost.
+
+    Only every ``interval``-th forward column is kept: the backward pass
+    walks the segments between them from the end and refills each segment's
+    forward columns from its first one, so memory is ``n / interval``
+    columns instead of ``n``. The stored columns are taken from
+    ``checkpoints`` when they hold the run on the same automaton and costs,
+    e.g. the optimization that was just run, and computed here otherwise.
+
+    Args:
+        target_sequence (str): The input DNA sequence.
+        fsm (FSM): The pattern-avoiding automaton.
+        cost_table (CostTable): Precomputed costs per position, last bigram and base.
+        checkpoints (DPCheckpoints): Optional state of a run of
+            :func:`~biosynth.algorithm.incremental.eliminate_incremental`.
+
+    Returns:
+        np.ndarray: ``n x 4`` costs in ``BASES`` order; ``inf`` where no sequence
+        avoiding the unwanted patterns has that base at that position.
+    """
+    n = len(target_sequence)
+    marginals = np.full((n, len(BASES)), np.inf)
+    if n < 2:
+        return marginals
+
+    if checkpoints is not None and checkpoints.resume_column(fsm, cost_table) == n:
+        graph, columns = checkpoints.graph, checkpoints.columns
+    else:
+        graph = PredecessorGraph(fsm)
+        columns = _stored_columns(graph, cost_table, CHECKPOINT_INTERVAL)
+    stops = sorted(i for i in columns if i <= n)
+    last_base = fsm.compiled.state_bigram % len(BASES)
+
+    # Outgoing edges grouped by source state, for the backward min over successors
+    order = np.argsort(graph.src, kind='stable')
+    src, dst, edge_key = graph.src[order], graph.dst[order], graph.edge_key[order]
+    sources, starts = np.unique(src, return_index=True)
+
+    backward = np.zeros(len(graph.states))
+    for first, last in reversed(list(zip(stops, stops[1:]))):
+        segment = [columns[first]]
+        for i in range(first + 1, last):
+            segment.append(fill_column(graph, segment[-1], cost_table.column(i))[0])
+        segment.append(columns[last])
+
+        for i in range(last, first, -1):
+            marginals[i - 1] = _min_by_base(segment[i - first] + backward, last_base)
+            candidates = cost_table.column(i)[edge_key] + backward[dst]
+            backward = np.full(len(graph.states), np.inf)
+            if len(sources):
+                backward[sources] = np.minimum.reduceat(candidates, starts)
+
+    # Column 2 holds the two-letter states, which also fix the first base
+    totals = columns[2] + backward
+    marginals[1] = _min_by_base(totals, last_base)
+    marginals[0] = _min_by_base(totals, fsm.compiled.state_bigram // len(BASES))
+    return marginals
+
+
+class MarginalCosts:
+    """
+    Answers "what is the cheapest sequence with this base here" from the marginal costs.
+
+    Every query is a lookup in the ``n x 4`` array of :func:`marginal_costs`,
+    so forcing or freeing a base does not rerun the optimization. The cost
+    of a single locked base is exact; with several locked bases, the largest
+    of their costs is a lower bound.
+
+    Attributes:
+        costs (np.ndarray): ``n x 4`` cheapest total costs, in ``BASES`` order.
+        min_cost (float): The optimal cost.
+        tolerance (float): Cost difference below which a cost equals the optimal one.
+    """
+
+    def __init__(self, costs, tolerance=1e-9):
+        """
+        Wraps the marginal costs of one optimization.
+
+        Args:
+            costs: ``n x 4`` array or nested list from :func:`marginal_costs`.
+            tolerance (float): Rounding tolerance, relative to the optimal cost when it exceeds 1.
+        """
+        self.costs = np.asarray(costs, dtype=float).reshape(-1, len(BASES))
+        self.min_cost = float(self.costs[0].min()) if len(self.costs) else float('inf')
+        self.tolerance = tolerance * max(1.0, self.min_cost) if np.isfinite(self.min_cost) else tolerance
+
+    def __len__(self):
+        return len(self.costs)
+
+    def cost(self, position, base):
+        """Return the cheapest total cost with ``base`` at the 0-based ``position``."""
+        return float(self.costs[position, BASE_INDEX[base]])
+
+    def extra_cost(self, position, base):
+        """Return how much forcing ``base`` at ``position`` adds to the optimal cost."""
+        return self.cost(position, base) - self.min_cost
+
+    def free_bases(self, position):
+        """Return the bases that ``position`` can take without raising the optimal cost."""
+        row = self.costs[position]
+        return [base for base, cost in zip(BASES, row.tolist()) if cost <= self.min_cost + self.tolerance]
+
+    def locked_cost(self, locks):
+        """
+        Returns the cheapest total cost with the bases of ``locks`` forced.
+
+        Args:
+            locks (dict): Base forced at every locked 0-based position.
+
+        Returns:
+            float: The exact cost for up to one lock, a lower bound for more; the
+            optimal cost without locks.
+        """
+        return max((self.cost(position, base) for position, base in locks.items()), default=self.min_cost)
+
+    def free_positions(self):
+        """Return the 0-based positions where more than one base keeps the optimal cost."""
+        free = self.costs <= self.min_cost + self.tolerance
+        return np.flatnonzero(free.sum(axis=1) > 1).tolist()
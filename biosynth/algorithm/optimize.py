@@ -0,0 +1,120 @@
+from dataclasses import replace
+
+from biosynth.algorithm.eliminate_sequence import EliminationController
+from biosynth.algorithm.result_cache import load_result, store_result
+from biosynth.data.optimization import OptimizationResult
+from biosynth.utils.coding_region import CodingRegionLocator
+from biosynth.utils.display_utils import SequenceUtils
+
+
+def analyze(request):
+    """
+    Locates the coding region and the pattern occurrences of the request's sequence.
+
+    Args:
+        request (OptimizationRequest): The optimization to prepare.
+
+    Returns:
+        OptimizationResult: The result without the elimination fields.
+
+    Raises:
+        ValueError: If the ``*`` marker is not followed by a valid start codon.
+    """
+    start_codon_identified, cleaned_sequence = CodingRegionLocator.find_start_codon(request.sequence)
+    coding_positions, coding_indexes = CodingRegionLocator.get_coding_and_non_coding_regions_positions(
+        cleaned_sequence, start_codon_identified)
+
+    occurrences = None
+    if request.unwanted_patterns:
+        occurrences = SequenceUtils.get_pattern_occurrences(cleaned_sequence, request.unwanted_patterns,
+                                                            both_strands=request.both_strands)
+
+    return OptimizationResult(cleaned_sequence=cleaned_sequence,
+                              start_codon_identified=start_codon_identified,
+                              coding_positions=coding_positions,
+                              coding_indexes=coding_indexes,
+                              unwanted_patterns_occurrences=occurrences)
+
+
+def optimize(request, fsm=None, analysis=None, checkpoints=None):
+    """
+    Eliminates the unwanted patterns of a request at minimum cost.
+
+    Only ``request`` is read, never the app data, so independent requests
+    can be optimized concurrently in threads or processes. With
+    ``request.result_cache`` the result is looked up in, and stored to, the
+    on-disk result cache (see :mod:`biosynth.algorithm.result_cache`).
+
+    Args:
+        request (OptimizationRequest): The optimization to run.
+        fsm (FSM): Optional automaton of ``request.patterns_to_eliminate()``, e.g. shared by many requests.
+        analysis (OptimizationResult): Optional result of :func:`analyze` for the same request.
+        checkpoints (DPCheckpoints): Optional forward state of the previous run, resumed after local edits
+            (see :meth:`EliminationController.eliminate`).
+
+    Returns:
+        OptimizationResult: The analysis together with the optimized sequence, its cost and the changes.
+
+    Raises:
+        ValueError: If the ``*`` marker is not followed by a valid start codon.
+    """
+    if request.result_cache:
+        cached = load_result(request)
+        if cached is not None:
+            cached.info = f"{cached.info}\n\nThe result was loaded from the result cache."
+            return cached
+
+    if analysis is None:
+        analysis = analyze(request)
+
+    alternatives, marginals = [], []
+    result = EliminationController.eliminate(analysis.cleaned_sequence, request.unwanted_patterns,
+                                             analysis.coding_positions, fsm=fsm, request=request,
+                                             alternatives=alternatives, checkpoints=checkpoints, marginals=marginals)
+    if len(result) == 4:
+        # Nothing to eliminate, or no valid sequence
+        info, _, optimized_sequence, min_cost = result
+        cost_contribution, cost_substitution = [], []
+    else:
+        info, cost_contribution, cost_substitution, optimized_sequence, min_cost = result
+
+    result = replace(analysis, info=info, cost_contribution=cost_contribution, cost_substitution=cost_substitution,
+                     optimized_sequence=optimized_sequence, min_cost=min_cost, alternatives=alternatives,
+                     marginal_costs=marginals if request.marginals else None)
+
+    if request.result_cache:
+        try:
+            store_result(request, result)
+        except OSError:
+            pass
+    return result
+
+
+def sweep(requests, fsm=None, analysis=None):
+    """
+    Eliminates the unwanted patterns of one sequence under several cost settings.
+
+    The requests share their sequence, patterns and engine options and only
+    differ in ``alpha``, ``beta``, ``w`` and ``optimized_codon``; they are
+    analyzed once and optimized together in one DP pass (see
+    :meth:`EliminationController.sweep`).
+
+    Args:
+        requests (list): The :class:`OptimizationRequest` of every setting.
+        fsm (FSM): Optional automaton of ``requests[0].patterns_to_eliminate()``.
+        analysis (OptimizationResult): Optional result of :func:`analyze` for the first request.
+
+    Returns:
+        list: The :class:`OptimizationResult` of every request, in order, without ``info``.
+
+    Raises:
+        ValueError: If the ``*`` marker is not followed by a valid start codon.
+    """
+    if analysis is None:
+        analysis = analyze(requests[0])
+
+    outcomes = EliminationController.sweep(analysis.cleaned_sequence, requests[0].unwanted_patterns,
+                                           analysis.coding_positions, requests, fsm=fsm)
+    return [replace(analysis, cost_contribution=cost_contribution, cost_substitution=cost_substitution,
+                    optimized_sequence=optimized_sequence, min_cost=min_cost)
+            for cost_contribution, cost_substitution, optimized_sequence, min_cost in outcomes]
@@ -0,0 +1,48 @@
+import numpy as np
+
+# Smallest automaton worth the pre-pass. It costs a few NumPy calls per
+# column, about as much as filling a column of a small automaton in Python.
+MIN_PRUNED_STATES = 64
+
+
+def live_cells(graph, cost_table):
+    """
+    Marks the DP cells that can lie on a finite-cost path.
+
+    A cell ``(i, v)`` is live when state ``v`` can be reached at column ``i``
+    from a seeded two-letter state, and the sequence can be completed from
+    it up to the last column, both through transitions of finite cost. Every
+    other cell, e.g. one after which every continuation completes an
+    unwanted pattern or needs a stop codon, keeps an infinite cost or never
+    reaches the end, so the fill can skip it without changing any result.
+
+    Args:
+        graph (PredecessorGraph): The CSR predecessor arrays of the automaton.
+        cost_table (CostTable): Precomputed costs per position, last bigram and base.
+
+    Returns:
+        np.ndarray: ``(n + 1) x |V|`` booleans, row ``i`` for DP column ``i``; rows 0 and 1 are unused.
+    """
+    n = len(cost_table)
+    n_states = len(graph.states)
+    live = np.zeros((n + 1, n_states), dtype=bool)
+    if n < 2:
+        return live
+
+    # Forward: states reachable at every column
+    seeded = np.isfinite(cost_table.initial[0][:, np.newaxis] + cost_table.initial[1][np.newaxis, :]).reshape(-1)
+    live[2, graph.bigram_states[seeded]] = True
+
+    # Edges of finite cost per distinct cost-table row; column i uses row_index[i - 1]
+    finite = np.isfinite(cost_table.rows)[:, graph.edge_key]
+    row_index = cost_table.row_index.tolist()
+    for i in range(3, n + 1):
+        edges = live[i - 1, graph.src] & finite[row_index[i - 1]]
+        live[i] = np.bincount(graph.dst, weights=edges, minlength=n_states) > 0
+
+    # Backward: keep the reachable states from which the last column can be reached
+    for i in range(n - 1, 1, -1):
+        edges = live[i + 1, graph.dst] & finite[row_index[i]]
+        live[i] &= np.bincount(graph.src, weights=edges, minlength=n_states) > 0
+
+    return live
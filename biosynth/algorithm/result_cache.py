@@ -0,0 +1,135 @@
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict, fields
+
+from biosynth.algorithm.fsm_cache import cache_root
+from biosynth.data.optimization import OptimizationRequest, OptimizationResult
+from biosynth.utils.input_utils import VERSION
+
+# Bumped whenever the optimization results or the file layout change.
+CACHE_VERSION = 2
+
+# Total size of the cached results; the least recently used ones are evicted beyond it.
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+# Request fields that do not affect the result.
+_IGNORED_FIELDS = ("codon_usage_filename", "fsm_cache", "result_cache")
+
+
+def cache_dir():
+    """Returns the directory holding the cached results (see :func:`~biosynth.algorithm.fsm_cache.cache_root`)."""
+    return os.path.join(cache_root(), "results")
+
+
+def request_key(request):
+    """
+    Return the content hash identifying the result of ``request``.
+
+    The hash covers every request field that affects the result, in a
+    canonical form (sorted patterns and codon table), together with the
+    package and cache versions.
+    """
+    content = {f.name: getattr(request, f.name) for f in fields(OptimizationRequest)
+               if f.name not in _IGNORED_FIELDS}
+    content["unwanted_patterns"] = sorted(request.unwanted_patterns)
+    content["codon_usage"] = sorted((request.codon_usage or {}).items())
+    content["version"] = [CACHE_VERSION, VERSION]
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def cache_path(request):
+    """Return the cache file of the result of ``request``."""
+    return os.path.join(cache_dir(), f"{request_key(request)}.json")
+
+
+def load_result(request):
+    """
+    Returns the cached result of ``request``, or ``None`` on a miss.
+
+    A hit marks the entry as recently used; an unreadable entry counts as a miss.
+
+    Args:
+        request (OptimizationRequest): The optimization to look up.
+
+    Returns:
+        OptimizationResult: The stored result, or ``None``.
+    """
+    path = cache_path(request)
+    try:
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        result = OptimizationResult(**data)
+        os.utime(path)
+    except (OSError, ValueError, TypeError):
+        return None
+
+    if result.coding_indexes is not None:
+        result.coding_indexes = tuple(result.coding_indexes)
+    return result
+
+
+def store_result(request, result, max_bytes=MAX_CACHE_BYTES):
+    """
+    Writes the result of ``request`` to the cache and evicts the least recently used entries.
+
+    The file is written under a temporary name and renamed into place, so
+    concurrent runs never read a partial entry.
+
+    Args:
+        request (OptimizationRequest): The optimization that produced ``result``.
+        result (OptimizationResult): The result to store.
+        max_bytes (int): Size limit of the whole cache.
+
+    Returns:
+        str: Path of the cache entry.
+
+    Raises:
+        OSError: If the cache directory cannot be written.
+    """
+    path = cache_path(request)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(asdict(result), fh)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    evict(max_bytes)
+    return path
+
+
+def evict(max_bytes=MAX_CACHE_BYTES):
+    """
+    Removes the least recently used results until the cache fits in ``max_bytes``.
+
+    Returns:
+        int: Number of removed entries.
+    """
+    entries = []
+    with os.scandir(cache_dir()) as it:
+        for entry in it:
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
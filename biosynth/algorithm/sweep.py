@@ -0,0 +1,101 @@
+import numpy as np
+
+from biosynth.algorithm.backpointers import BackpointerTable
+from biosynth.algorithm.vectorized_dp import PredecessorGraph
+from biosynth.utils.cost_utils import BASES
+
+
+def fill_columns(graph, prev, costs):
+    """
+    Computes one DP column from the previous one for every setting of a sweep.
+
+    Args:
+        graph (PredecessorGraph): The CSR predecessor arrays.
+        prev (np.ndarray): ``K x |V|`` costs of column ``i - 1``, one row per setting.
+        costs (np.ndarray): ``K x 64`` flat costs of column ``i`` per setting.
+
+    Returns:
+        tuple: ``(columns, best_edge)``, both ``K x |V|``; ``best_edge`` holds the first
+        cheapest incoming edge per setting and state, or -1 when the state is unreachable.
+    """
+    n_settings, n_states = prev.shape
+    columns = np.full((n_settings, n_states), np.inf)
+    best_edge = np.full((n_settings, n_states), -1, dtype=np.int64)
+
+    if len(graph.reachable) == 0:
+        return columns, best_edge
+
+    candidates = prev[:, graph.src] + costs[:, graph.edge_key]
+    columns[:, graph.reachable] = np.minimum.reduceat(candidates, graph.segment_starts, axis=1)
+
+    # First edge reaching the segment minimum, as in fill_column
+    is_best = candidates == columns[:, graph.dst]
+    edge_ids = np.where(is_best, np.arange(candidates.shape[1]), candidates.shape[1])
+    best_edge[:, graph.reachable] = np.minimum.reduceat(edge_ids, graph.segment_starts, axis=1)
+    best_edge[~np.isfinite(columns)] = -1
+
+    return columns, best_edge
+
+
+def eliminate_sweep(target_sequence, fsm, cost_tables):
+    """
+    Runs the vectorized elimination DP for several cost settings in one pass.
+
+    The settings of a sweep only differ in their costs, not in the codon
+    phases of the sequence, so their cost tables share ``row_index``. Their
+    rows are stacked along a setting axis and every DP column is filled for
+    all settings at once over the same automaton. Each setting gets the same
+    sequence as :func:`~biosynth.algorithm.vectorized_dp.eliminate_vectorized`
+    run on its own table.
+
+    Args:
+        target_sequence (str): The input DNA sequence.
+        fsm (FSM): The pattern-avoiding automaton.
+        cost_tables (list): One :class:`CostTable` per setting.
+
+    Returns:
+        list: ``(min_cost, optimized_seq)`` per setting; ``optimized_seq`` is ``None`` when
+        no sequence avoids the unwanted patterns.
+
+    Raises:
+        ValueError: If the tables do not share their codon phases.
+    """
+    n = len(target_sequence)
+    graph = PredecessorGraph(fsm)
+    n_settings = len(cost_tables)
+
+    if n < 2:
+        return [(float('inf'), None)] * n_settings
+
+    row_index = cost_tables[0].row_index
+    if any(not np.array_equal(table.row_index, row_index) for table in cost_tables):
+        raise ValueError("The cost tables of a sweep must share their codon phases.")
+
+    rows = np.stack([table.rows for table in cost_tables])
+
+    # Column 2 per setting from the costs of the first two positions
+    columns = np.full((n_settings, len(graph.states)), np.inf)
+    for v_id in graph.bigram_states:
+        v = graph.states[v_id]
+        columns[:, v_id] = [table.initial[0, BASES.index(v[0])] + table.initial[1, BASES.index(v[1])]
+                            for table in cost_tables]
+
+    backs = [BackpointerTable(n, len(graph.states)) for _ in range(n_settings)]
+    for i in range(3, n + 1):
+        columns, best_edge = fill_columns(graph, columns, rows[:, row_index[i - 1]])
+        codes = np.full(best_edge.shape, backs[0].none, dtype=backs[0].table.dtype)
+        valid = best_edge >= 0
+        codes[valid] = graph.edge_code[best_edge[valid]]
+        for back, setting_codes in zip(backs, codes):
+            back.set_column(i, setting_codes)
+
+    results = []
+    final_states = np.argmin(columns, axis=1)
+    min_costs = columns[np.arange(n_settings), final_states]
+    for back, final_state, min_cost in zip(backs, final_states.tolist(), min_costs.tolist()):
+        if min_cost == float('inf'):
+            results.append((min_cost, None))
+            continue
+        first_state, symbols = back.trace(final_state, ''.join(BASES))
+        results.append((min_cost, graph.states[first_state] + ''.join(symbols)))
+    return results
@@ -0,0 +1,99 @@
+import numpy as np
+
+from biosynth.algorithm.backpointers import BackpointerTable, SYMBOL_BITS
+from biosynth.algorithm.vectorized_dp import PredecessorGraph, initial_column
+from biosynth.utils.cost_utils import BASES
+
+# Largest number of sequences kept per DP cell.
+MAX_TOP_K = 100
+
+
+def fill_column_top_k(graph, prev, costs, k):
+    """
+    Computes the ``k`` cheapest partial costs of every state of one DP column.
+
+    Args:
+        graph (PredecessorGraph): The CSR predecessor arrays.
+        prev (np.ndarray): ``|V| x k`` ascending partial costs of column ``i - 1``.
+        costs (np.ndarray): Flat ``16 x 4`` costs of column ``i`` (see ``CostTable.column``).
+        k (int): Number of partial costs kept per state.
+
+    Returns:
+        tuple: ``(column, best)``, both ``|V| x k``; ``best`` holds the candidate
+        ``edge * k + rank`` of every kept cost, the edge reading from rank ``rank`` of its
+        source state, or -1 where fewer than ``k`` finite costs reach the state.
+    """
+    n_states = len(graph.states)
+    column = np.full((n_states, k), np.inf)
+    best = np.full((n_states, k), -1, dtype=np.int64)
+
+    # Candidates in (edge, rank) order; the stable sort keeps that order between equal costs,
+    # so the first rank is the same choice as fill_column's
+    candidates = (prev[graph.src] + costs[graph.edge_key][:, np.newaxis]).reshape(-1)
+    order = np.lexsort((candidates, np.repeat(graph.dst, k)))
+
+    dst = graph.dst[order // k]
+    slot = np.arange(len(order)) - graph.indptr[dst] * k
+    kept = (slot < k) & np.isfinite(candidates[order])
+    column[dst[kept], slot[kept]] = candidates[order[kept]]
+    best[dst[kept], slot[kept]] = order[kept]
+    return column, best
+
+
+def eliminate_top_k(target_sequence, fsm, cost_table, k=1, alternatives=None):
+    """
+    Runs the elimination DP keeping the ``k`` cheapest partial costs of every cell.
+
+    Every state of the automaton is reached by a unique path for a given
+    prefix, so distinct paths spell distinct sequences and the ``k``
+    cheapest paths into the last column are the ``k`` cheapest distinct
+    sequences. The backpointers take ``n x |V| x k`` packed codes, ``k`` times
+    those of :func:`~biosynth.algorithm.vectorized_dp.eliminate_vectorized`;
+    the cheapest sequence is the one that engine returns.
+
+    Args:
+        target_sequence (str): The input DNA sequence.
+        fsm (FSM): The pattern-avoiding automaton.
+        cost_table (CostTable): Precomputed costs per position, last bigram and base.
+        k (int): Number of sequences to find.
+        alternatives (list): Optional list that receives the ``(cost, sequence)`` of up to
+            ``k`` cheapest sequences, in order of increasing cost.
+
+    Returns:
+        tuple: ``(min_cost, optimized_seq)``; ``optimized_seq`` is ``None`` when
+        no sequence avoids the unwanted patterns.
+    """
+    n = len(target_sequence)
+    graph = PredecessorGraph(fsm)
+    n_states = len(graph.states)
+
+    if n < 2:
+        return float('inf'), None
+
+    column = np.full((n_states, k), np.inf)
+    column[:, 0] = initial_column(graph, cost_table)
+
+    # Packed (source state * k + rank, base) per column, state and rank
+    back = BackpointerTable(n, n_states * k)
+    for i in range(3, n + 1):
+        column, best = fill_column_top_k(graph, column, cost_table.column(i), k)
+        codes = np.full(n_states * k, back.none, dtype=back.table.dtype)
+        valid = best.reshape(-1) >= 0
+        edge, rank = np.divmod(best.reshape(-1)[valid], k)
+        codes[valid] = ((graph.src[edge] * k + rank) << SYMBOL_BITS) | graph.sym[edge]
+        back.set_column(i, codes)
+
+    # The k cheapest cells of the last column, in (cost, state, rank) order
+    costs = column.reshape(-1)
+    finals = [cell for cell in np.argsort(costs, kind='stable')[:k].tolist() if costs[cell] < float('inf')]
+    if not finals:
+        return float('inf'), None
+
+    results = []
+    for cell in finals:
+        state, symbols = back.trace(cell, BASES)
+        results.append((float(costs[cell]), graph.states[state // k] + ''.join(symbols)))
+
+    if alternatives is not None:
+        alternatives.extend(results)
+    return results[0]
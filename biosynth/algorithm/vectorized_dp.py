@@ -0,0 +1,209 @@
+import math
+
+import numpy as np
+
+from biosynth.algorithm.backpointers import BackpointerTable
+from biosynth.algorithm.fsm import FORBIDDEN
+from biosynth.utils.cost_utils import BASES
+
+
+class PredecessorGraph:
+    """
+    Predecessor view of the compiled FSM arranged for column-at-a-time dynamic programming.
+
+    The incoming edges of every state are stored contiguously (CSR layout),
+    so that a DP column can be updated with a single gather followed by a
+    segmented min/argmin.
+
+    Attributes:
+        states (list): The FSM states, in id order.
+        indptr (np.ndarray): Edge offsets per target state (length ``|V| + 1``).
+        src (np.ndarray): Source state id of every edge.
+        sym (np.ndarray): Base index (into ``BASES``) consumed by every edge.
+        dst (np.ndarray): Target state id of every edge.
+        edge_key (np.ndarray): ``bigram_class(src) * 4 + sym`` of every edge, the
+            flat index into a ``16 x 4`` per-column cost matrix.
+        edge_code (np.ndarray): Packed ``BackpointerTable`` code of every edge.
+        bigram_states (np.ndarray): Ids of the two-letter states seeding column 2.
+    """
+
+    def __init__(self, fsm):
+        """
+        Builds the CSR predecessor arrays of ``fsm``.
+
+        Args:
+            fsm (FSM): The pattern-avoiding automaton.
+        """
+        compiled = fsm.compiled
+        self.states = compiled.states
+
+        # Edges in (source state, base) order, stably grouped by target state,
+        # which matches the predecessor order of the Python engine and
+        # therefore its tie-breaking.
+        src, sym = np.nonzero(compiled.transitions != FORBIDDEN)
+        dst = compiled.transitions[src, sym].astype(np.int64)
+        order = np.argsort(dst, kind='stable')
+        self.src = src[order]
+        self.sym = sym[order]
+        self.dst = dst[order]
+
+        counts = np.bincount(self.dst, minlength=len(self.states))
+        self.indptr = np.concatenate(([0], np.cumsum(counts)))
+
+        self.edge_key = compiled.state_bigram[self.src].astype(np.int64) * len(BASES) + self.sym
+        self.edge_code = BackpointerTable.encode(self.src, self.sym)
+
+        self.bigram_states = compiled.bigram_states.astype(np.int64)
+
+        # reduceat cannot express empty segments, so only reduce over states
+        # that have at least one incoming edge.
+        self.reachable = np.flatnonzero(counts > 0)
+        self.segment_starts = self.indptr[self.reachable]
+
+
+def fill_column(graph, prev, costs):
+    """
+    Computes one DP column from the previous one.
+
+    Args:
+        graph (PredecessorGraph): The CSR predecessor arrays.
+        prev (np.ndarray): Costs of column ``i - 1`` per state id.
+        costs (np.ndarray): Flat ``16 x 4`` costs of column ``i`` (see ``CostTable.column``).
+
+    Returns:
+        tuple: ``(column, best_edge)`` where ``best_edge`` holds the first
+        cheapest incoming edge per state, or -1 when the state is unreachable.
+    """
+    n_states = len(graph.states)
+    column = np.full(n_states, np.inf)
+    best_edge = np.full(n_states, -1, dtype=np.int64)
+
+    if len(graph.reachable) == 0:
+        return column, best_edge
+
+    candidates = prev[graph.src] + costs[graph.edge_key]
+    column[graph.reachable] = np.minimum.reduceat(candidates, graph.segment_starts)
+
+    # First edge reaching the segment minimum, mirroring the strict '<' scan.
+    is_best = candidates == column[graph.dst]
+    edge_ids = np.where(is_best, np.arange(len(candidates)), len(candidates))
+    best_edge[graph.reachable] = np.minimum.reduceat(edge_ids, graph.segment_starts)
+    best_edge[~np.isfinite(column)] = -1
+
+    return column, best_edge
+
+
+def initial_column(graph, cost_table):
+    """Return DP column 2: the cost of every two-letter state from the first two positions."""
+    column = np.full(len(graph.states), np.inf)
+    for v_id in graph.bigram_states:
+        v = graph.states[v_id]
+        column[v_id] = cost_table.initial[0, BASES.index(v[0])] + cost_table.initial[1, BASES.index(v[1])]
+    return column
+
+
+def back_codes(graph, best_edge, back):
+    """Translate the best incoming edge per state into packed codes of ``back``."""
+    codes = np.full(len(best_edge), back.none, dtype=back.table.dtype)
+    valid = best_edge >= 0
+    codes[valid] = graph.edge_code[best_edge[valid]]
+    return codes
+
+
+def eliminate_vectorized(target_sequence, fsm, cost_table):
+    """
+    Runs the elimination DP with NumPy column updates over integer state ids.
+
+    Args:
+        target_sequence (str): The input DNA sequence.
+        fsm (FSM): The pattern-avoiding automaton.
+        cost_table (CostTable): Precomputed costs per position, last bigram and base.
+
+    Returns:
+        tuple: ``(min_cost, optimized_seq)``; ``optimized_seq`` is ``None`` when
+        no sequence avoids the unwanted patterns.
+    """
+    n = len(target_sequence)
+    graph = PredecessorGraph(fsm)
+
+    if n < 2:
+        return float('inf'), None
+
+    column = initial_column(graph, cost_table)
+    back = BackpointerTable(n, len(graph.states))
+    for i in range(3, n + 1):
+        column, best_edge = fill_column(graph, column, cost_table.column(i))
+        back.set_column(i, back_codes(graph, best_edge, back))
+
+    final_state = int(np.argmin(column))
+    min_cost = float(column[final_state])
+    if min_cost == float('inf'):
+        return min_cost, None
+
+    first_state, symbols = back.trace(final_state, ''.join(BASES))
+    return min_cost, graph.states[first_state] + ''.join(symbols)
+
+
+def eliminate_low_memory(target_sequence, fsm, cost_table, checkpoint_interval=None):
+    """
+    Runs the vectorized elimination DP in memory proportional to ``sqrt(n) * |V|``.
+
+    The forward fill keeps only the rolling column and a checkpoint copy every
+    ``checkpoint_interval`` columns. The path is then recovered segment by
+    segment from the end: each segment is refilled from its checkpoint with a
+    backpointer table covering that segment only, and traced back to the
+    checkpoint. The extra cost is roughly one more forward pass; the result is
+    identical to :func:`eliminate_vectorized`.
+
+    Args:
+        target_sequence (str): The input DNA sequence.
+        fsm (FSM): The pattern-avoiding automaton.
+        cost_table (CostTable): Precomputed costs per position, last bigram and base.
+        checkpoint_interval (int): Columns between checkpoints; defaults to ``ceil(sqrt(n))``.
+
+    Returns:
+        tuple: ``(min_cost, optimized_seq)``; ``optimized_seq`` is ``None`` when
+        no sequence avoids the unwanted patterns.
+    """
+    n = len(target_sequence)
+    graph = PredecessorGraph(fsm)
+
+    if n < 2:
+        return float('inf'), None
+
+    interval = checkpoint_interval or max(1, math.isqrt(n - 1) + 1)
+
+    # Forward pass: rolling column plus a checkpoint at columns 2, 2 + k, 2 + 2k, ...
+    column = initial_column(graph, cost_table)
+    checkpoints = {2: column}
+    for i in range(3, n + 1):
+        column, _ = fill_column(graph, column, cost_table.column(i))
+        if (i - 2) % interval == 0 and i < n:
+            checkpoints[i] = column
+
+    final_state = int(np.argmin(column))
+    min_cost = float(column[final_state])
+    if min_cost == float('inf'):
+        return min_cost, None
+
+    # Backward pass: refill each segment from its checkpoint and trace it.
+    pieces = []
+    state = final_state
+    end = n
+    for start in sorted(checkpoints, reverse=True):
+        if start == end:
+            continue
+
+        column = checkpoints.pop(start)
+        back = BackpointerTable(end, len(graph.states), first_column=start + 1)
+        for i in range(start + 1, end + 1):
+            column, best_edge = fill_column(graph, column, cost_table.column(i))
+            back.set_column(i, back_codes(graph, best_edge, back))
+
+        state, symbols = back.trace(state, ''.join(BASES))
+        pieces.append(''.join(symbols))
+        end = start
+
+    pieces.append(graph.states[state])
+    pieces.reverse()
+    return min_cost, ''.join(pieces)
@@ -0,0 +1,141 @@
+import numpy as np
+
+from biosynth.utils.pattern_scanner import PatternScanner
+
+# Rounds of window growth before falling back to the full-sequence DP.
+MAX_ROUNDS = 8
+
+
+def find_hits(sequence, scanner):
+    """Return the 0-based ``(start, end)`` ranges of every occurrence found by ``scanner`` in ``sequence``."""
+    return sorted((start, end) for start, end, _ in scanner.scan(sequence))
+
+
+def align_window(start, end, coding_positions):
+    """
+    Widens ``start..end - 1`` so that it neither splits a codon nor starts at position 1.
+
+    A window starting at position 1 is extended to position 0, because the
+    first two positions of the sequence are charged differently from the rest.
+
+    Args:
+        start (int): First position of the window (0-based).
+        end (int): Position after the last one of the window.
+        coding_positions (list): Codon phase of every position (0 for non-coding).
+
+    Returns:
+        tuple: The aligned ``(start, end)``.
+    """
+    start -= max(abs(coding_positions[start]) - 1, 0)
+    if start < 2:
+        start = 0
+
+    phase = abs(coding_positions[end - 1])
+    if phase in (1, 2):
+        end += 3 - phase
+    return start, end
+
+
+def build_windows(hits, padding, coding_positions, windows=()):
+    """
+    Pads every hit, aligns it to codon boundaries and merges it into ``windows``.
+
+    Windows closer than ``padding`` positions to each other are merged, since
+    a pattern could otherwise straddle the gap between them.
+
+    Args:
+        hits (list): ``(start, end)`` ranges of pattern occurrences.
+        padding (int): Number of positions added on both sides of each hit.
+        coding_positions (list): Codon phase of every position (0 for non-coding).
+        windows (iterable): Already existing windows to merge with.
+
+    Returns:
+        list: Disjoint, sorted ``(start, end)`` windows.
+    """
+    n = len(coding_positions)
+    candidates = list(windows)
+    for start, end in hits:
+        candidates.append(align_window(max(start - padding, 0), min(end + padding, n), coding_positions))
+
+    merged = []
+    for start, end in sorted(candidates):
+        if merged and start < merged[-1][1] + padding:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def eliminate_windowed(target_sequence, coding_positions, fsm, cost_table, engine):
+    """
+    Runs the elimination DP only around the occurrences of the unwanted patterns.
+
+    Every occurrence is padded by the longest pattern on both sides and
+    aligned to codon boundaries; each window is optimized on its own with
+    ``engine`` and the results are stitched into the untouched sequence.
+
+    A window optimum ignores its flanks, so the sum of the window optima plus
+    the cheapest cost of every position outside the windows is a lower bound
+    on the full DP. The stitched sequence is accepted only when it reaches
+    that bound and contains no occurrence; new occurrences at window edges
+    grow the windows instead. When the bound cannot be met (for instance when
+    unchanged codons still carry a codon-usage cost) or the windows keep
+    growing, the full DP is run instead, so the cost always equals that of
+    the full DP.
+
+    The FSM only tracks states of two or more bases, so, as in the full DP,
+    patterns shorter than three bases are not enforced.
+
+    Args:
+        target_sequence (str): The input DNA sequence.
+        coding_positions (list): Codon phase of every position (0 for non-coding).
+        fsm (FSM): The pattern-avoiding automaton.
+        cost_table (CostTable): Precomputed costs per position, last bigram and base.
+        engine (function): Full-sequence engine ``(sequence, fsm, cost_table) -> (min_cost, seq)``.
+
+    Returns:
+        tuple: ``(min_cost, optimized_seq)``; ``optimized_seq`` is ``None`` when
+        no sequence avoids the unwanted patterns.
+    """
+    patterns = [p for p in fsm.unwanted_patterns if len(p) > 2]
+    if not patterns or len(target_sequence) < 2:
+        return engine(target_sequence, fsm, cost_table)
+
+    padding = max(len(p) for p in patterns)
+    scanner = PatternScanner.for_patterns(patterns)
+    slack = cost_table.position_costs(target_sequence) - cost_table.position_minimums()
+
+    windows = build_windows(find_hits(target_sequence, scanner), padding, coding_positions)
+    solved = {}
+    for _ in range(MAX_ROUNDS):
+        # Positions outside the windows keep their original bases, which must be optimal there
+        outside = np.ones(len(target_sequence), dtype=bool)
+        for start, end in windows:
+            outside[start:end] = False
+        if not np.all(slack[outside] <= 0):
+            break
+
+        pieces = []
+        last = 0
+        for start, end in windows:
+            if (start, end) not in solved:
+                solved[(start, end)] = engine(target_sequence[start:end], fsm, cost_table.window(start, end))
+
+            window_cost, window_seq = solved[(start, end)]
+            if window_seq is None:
+                # Even ignoring the flanks this stretch cannot avoid the patterns
+                return window_cost, None
+
+            pieces.append(target_sequence[last:start])
+            pieces.append(window_seq)
+            last = end
+        pieces.append(target_sequence[last:])
+        optimized_seq = ''.join(pieces)
+
+        hits = find_hits(optimized_seq, scanner)
+        if not hits:
+            return cost_table.path_cost(optimized_seq), optimized_seq
+
+        windows = build_windows(hits, padding, coding_positions, windows)
+
+    return engine(target_sequence, fsm, cost_table)
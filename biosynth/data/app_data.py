@@ -12,6 +12,7 @@ class InputData:
 
     unwanted_patterns = None
     unwanted_patterns_occurrences = None
+    both_strands = False
 
     start_codon_identified = None
     coding_indexes = None
@@ -25,6 +26,7 @@ class InputData:
         InputData.cleaned_dna_sequence = None
         InputData.unwanted_patterns = None
         InputData.unwanted_patterns_occurrences = None
+        InputData.both_strands = False
         InputData.coding_indexes = None
         InputData.coding_positions = None
 
@@ -70,13 +72,41 @@ class CostData:
 
         CostData.optimized_codon = True
 
+class EngineData:
+    """Holds the dynamic-programming engine selection used by the elimination algorithm."""
+
+    engine = "python"
+    low_memory = False
+    windowed = False
+    fsm_cache = False
+    minimize_fsm = False
+    coding_mode = "full"
+    top_k = 1
+    result_cache = False
+    marginals = False
+
+    @staticmethod
+    def reset():
+        """Restore the engine selection and options to their defaults."""
+        EngineData.engine = "python"
+        EngineData.low_memory = False
+        EngineData.windowed = False
+        EngineData.fsm_cache = False
+        EngineData.minimize_fsm = False
+        EngineData.coding_mode = "full"
+        EngineData.top_k = 1
+        EngineData.result_cache = False
+        EngineData.marginals = False
+
 class EliminationData:
-    """Holds elimination-algorithm outputs: process info, cost contributions, substitutions, and min cost."""
+    """Holds elimination-algorithm outputs: process info, cost contributions, substitutions, min cost, alternatives."""
 
     info = None
     cost_contribution = None
     cost_substitution = None
     min_cost = None
+    alternatives = None
+    marginal_costs = None
 
 
 class OutputData:
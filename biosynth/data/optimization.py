@@ -0,0 +1,132 @@
+from dataclasses import dataclass, field
+
+from biosynth.data.app_data import InputData, CostData, EngineData, EliminationData, OutputData
+from biosynth.utils.cost_utils import with_reverse_complements
+
+
+@dataclass
+class OptimizationRequest:
+    """Everything one optimization needs: the sequence, patterns, codon table, costs and engine options.
+
+    Requests are plain values, so any number of them can be optimized at
+    once in threads or processes; the ``InputData``/``CostData``/``EngineData``
+    singletons are only read by :meth:`from_app_data` for the CLI and GUI.
+
+    Attributes:
+        sequence: The DNA sequence, optionally with a ``*`` before the start codon.
+        unwanted_patterns: The patterns to eliminate.
+        codon_usage: Normalized codon usage costs (see ``normalize_codon_usage``).
+        codon_usage_filename: Name of the codon usage file, shown in the descriptions.
+        alpha: Transition substitution cost in non-coding sites.
+        beta: Transversion substitution cost in non-coding sites.
+        w: Non-synonymous substitution cost in coding regions.
+        optimized_codon: Whether synonymous codons are charged by codon usage.
+        both_strands: Also eliminate the reverse complement of every pattern.
+        engine, low_memory, windowed, fsm_cache, minimize_fsm, coding_mode, top_k, result_cache, marginals: DP
+            engine options, as in ``EngineData``.
+    """
+
+    sequence: str
+    unwanted_patterns: frozenset
+    codon_usage: dict
+    codon_usage_filename: str = None
+    alpha: float = 1.0
+    beta: float = 2.0
+    w: float = 100.0
+    optimized_codon: bool = True
+    both_strands: bool = False
+    engine: str = "python"
+    low_memory: bool = False
+    windowed: bool = False
+    fsm_cache: bool = False
+    minimize_fsm: bool = False
+    coding_mode: str = "full"
+    top_k: int = 1
+    result_cache: bool = False
+    marginals: bool = False
+
+    def __post_init__(self):
+        self.unwanted_patterns = frozenset(self.unwanted_patterns or ())
+
+    @classmethod
+    def from_app_data(cls, sequence=None):
+        """Return the request described by the current app data, for ``sequence`` or ``InputData.dna_sequence``."""
+        return cls(
+            sequence=InputData.dna_sequence if sequence is None else sequence,
+            unwanted_patterns=InputData.unwanted_patterns,
+            codon_usage=CostData.codon_usage,
+            codon_usage_filename=CostData.codon_usage_filename,
+            alpha=CostData.alpha,
+            beta=CostData.beta,
+            w=CostData.w,
+            optimized_codon=CostData.optimized_codon,
+            both_strands=InputData.both_strands,
+            engine=EngineData.engine,
+            low_memory=EngineData.low_memory,
+            windowed=EngineData.windowed,
+            fsm_cache=EngineData.fsm_cache,
+            minimize_fsm=EngineData.minimize_fsm,
+            coding_mode=EngineData.coding_mode,
+            top_k=EngineData.top_k,
+            result_cache=EngineData.result_cache,
+            marginals=EngineData.marginals,
+        )
+
+    def patterns_to_eliminate(self, unwanted_patterns=None):
+        """Return ``unwanted_patterns`` (the request's by default), with reverse complements with ``both_strands``."""
+        if unwanted_patterns is None:
+            unwanted_patterns = self.unwanted_patterns
+        if self.both_strands:
+            return with_reverse_complements(unwanted_patterns)
+        return set(unwanted_patterns)
+
+
+@dataclass
+class OptimizationResult:
+    """The outcome of one optimization.
+
+    Attributes:
+        cleaned_sequence: The sequence without the ``*`` marker.
+        start_codon_identified: Whether a ``*``-marked start codon was found.
+        coding_positions: Per-base codon-phase array (0 for non-coding).
+        coding_indexes: ``(start, end)`` of the coding region, or ``None``.
+        unwanted_patterns_occurrences: Occurrence rows of the patterns in the input.
+        info: Human-readable description of the elimination.
+        cost_contribution: Change rows with a positive cost.
+        cost_substitution: Free substitution rows.
+        optimized_sequence: The optimized sequence, or ``None`` when no valid sequence exists.
+        min_cost: Cost of the optimized sequence (``inf`` when none exists).
+        alternatives: Rank, cost, changed bases and sequence of the ``top_k`` cheapest sequences, when
+            more than one was requested.
+        marginal_costs: With ``marginals``, the cheapest total cost with each base (in ``BASES`` order)
+            forced at each position, as ``n`` rows of four; ``None`` otherwise.
+    """
+
+    cleaned_sequence: str
+    start_codon_identified: bool
+    coding_positions: list
+    coding_indexes: tuple = None
+    unwanted_patterns_occurrences: list = None
+    info: str = None
+    cost_contribution: list = field(default_factory=list)
+    cost_substitution: list = field(default_factory=list)
+    optimized_sequence: str = None
+    min_cost: float = None
+    alternatives: list = field(default_factory=list)
+    marginal_costs: list = None
+
+    def to_app_data(self):
+        """Publish the result to ``InputData``/``EliminationData``/``OutputData`` for the report and UI."""
+        InputData.cleaned_dna_sequence = self.cleaned_sequence
+        InputData.start_codon_identified = self.start_codon_identified
+        InputData.coding_positions = self.coding_positions
+        InputData.coding_indexes = self.coding_indexes
+        InputData.unwanted_patterns_occurrences = self.unwanted_patterns_occurrences
+
+        EliminationData.info = self.info
+        EliminationData.cost_contribution = self.cost_contribution
+        EliminationData.cost_substitution = self.cost_substitution
+        EliminationData.min_cost = self.min_cost
+        EliminationData.alternatives = self.alternatives
+        EliminationData.marginal_costs = self.marginal_costs
+        OutputData.optimized_sequence = self.optimized_sequence
@@ -0,0 +1,162 @@
+import os
+import re
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+
+from biosynth.algorithm.eliminate_sequence import EliminationController
+from biosynth.algorithm.fsm import FSM
+from biosynth.algorithm.optimize import analyze, optimize
+from biosynth.data.app_data import InputData, OutputData
+from biosynth.data.optimization import OptimizationRequest
+from biosynth.executions.execution_utils import is_valid_dna
+from biosynth.utils.cost_utils import EliminationScorerConfig
+from biosynth.utils.file_utils import FastaReader, create_dir, output_dir
+from biosynth.utils.logger import Logger
+
+RESULT_COLUMNS = ("Record", "Length", "Status", "Cost", "Changes", "Optimized_Sequence")
+
+# Records submitted ahead of the one being written, per worker
+_PREFETCH = 4
+
+# Per-process state installed by _init_worker
+_worker = {}
+
+
+def _init_worker(request, compiled, report_dir, file_date):
+    """Install the shared request and the prebuilt automaton in a worker process."""
+    _worker["request"] = request
+    _worker["fsm"] = FSM(request.patterns_to_eliminate(), EliminationScorerConfig().alphabet, compiled=compiled)
+    _worker["report_dir"] = report_dir
+    _worker["file_date"] = file_date
+
+
+def _error_status(prefix, error):
+    """Return the Status of a record that failed with ``error``, on a single tab-free line."""
+    return f"{prefix}: {' '.join(str(error).split()) or type(error).__name__}"
+
+
+def _optimize_record(record):
+    """Optimize a single FASTA record with the worker's automaton and return its result row.
+
+    Any error is reported in the Status column of the record, so that one
+    failing record does not abort the rest of the batch.
+    """
+    record_id, sequence = record
+    row = dict.fromkeys(RESULT_COLUMNS, "")
+    row.update(Record=record_id, Length=len(sequence))
+
+    if not sequence or not is_valid_dna(sequence):
+        row["Status"] = "invalid sequence"
+        return row
+
+    request = replace(_worker["request"], sequence=sequence)
+    try:
+        analysis = analyze(request)
+    except ValueError as e:
+        row["Status"] = _error_status("start codon validation failed", e)
+        return row
+
+    try:
+        result = optimize(request, fsm=_worker["fsm"], analysis=analysis)
+    except Exception as e:
+        row["Status"] = _error_status("optimization failed", e)
+        return row
+
+    if result.optimized_sequence is None:
+        row["Status"] = "no valid sequence"
+        return row
+
+    changes = len(result.cost_contribution) + len(result.cost_substitution)
+    row.update(Status="optimized" if changes else "unchanged", Cost=f"{result.min_cost:g}", Changes=changes,
+               Optimized_Sequence=result.optimized_sequence)
+
+    if _worker["report_dir"] is not None:
+        # The report is rendered from the app data of this process
+        InputData.unwanted_patterns = request.unwanted_patterns
+        result.to_app_data()
+
+        # Imported here so that batches without reports never load the template engine
+        from biosynth.report.report_builder import ReportBuilder
+        safe_id = re.sub(r'[^\w.-]', '_', record_id)
+        try:
+            ReportBuilder(costs=request).create_report(f"{_worker['file_date']}_{safe_id}", _worker["report_dir"])
+        except Exception as e:
+            row["Status"] = _error_status("report failed", e)
+
+    return row
+
+
+class BatchController:
+    """Optimizes every record of a multi-record FASTA file with one shared automaton and codon table."""
+
+    def __init__(self, fasta_path, jobs=None, reports=False):
+        self.fasta_path = fasta_path
+        self.jobs = jobs or os.cpu_count() or 1
+        self.reports = reports
+
+    def run(self):
+        """Stream the records of the FASTA file through the elimination and write the results.
+
+        The ``OptimizationRequest`` of the app data is built once, and so is
+        its automaton (through the cache and minimization options); both are
+        shipped to ``jobs`` worker processes, which only vary the sequence of
+        the request per record. Records are read lazily and submitted a few
+        at a time per worker. One row per record is written, in input order,
+        to a tab-separated ``Batch-Results_<date>.tsv`` in the output
+        directory, and with ``reports`` an HTML report is written per
+        optimized record. The result cache is not used: a batch of distinct
+        records would only fill it with one entry per record and evict the
+        results of interactive runs.
+
+        Returns:
+            The path of the consolidated results file.
+        """
+        request = replace(OptimizationRequest.from_app_data(sequence=""), result_cache=False)
+        fsm, _ = EliminationController.build_fsm(request.patterns_to_eliminate(), request)
+
+        file_date = datetime.today().strftime("%d-%b-%Y_%H-%M-%S")
+        results_dir = output_dir(OutputData.output_path)
+        create_dir(results_dir)
+        results_path = results_dir / f"Batch-Results_{file_date}.tsv"
+
+        report_dir = None
+        if self.reports:
+            report_dir = OutputData.output_path or str(Path.home() / 'Downloads')
+
+        Logger.info(f"Batch of {self.fasta_path}: {len(fsm.compiled)} automaton states, {self.jobs} worker(s).")
+
+        initargs = (request, fsm.compiled, report_dir, file_date)
+        records = FastaReader(self.fasta_path).read_records()
+
+        statuses = Counter()
+        with open(results_path, 'w', encoding='utf-8') as file:
+            file.write('\t'.join(RESULT_COLUMNS) + '\n')
+            for row in self._results(records, initargs):
+                file.write('\t'.join(str(row[column]) for column in RESULT_COLUMNS) + '\n')
+                statuses[row["Status"]] += 1
+                Logger.info(f"{row['Record']}: {row['Status']}")
+
+        Logger.space()
+        Logger.info(", ".join(f"{count} {status}" for status, count in sorted(statuses.items())) or "No records found.")
+        Logger.critical("The batch results can be found in the following path:\n")
+        Logger.notice(f"{results_path}\n")
+        return str(results_path)
+
+    def _results(self, records, initargs):
+        """Yield the result rows of ``records`` in input order, in a process pool when ``jobs > 1``."""
+        if self.jobs == 1:
+            _init_worker(*initargs)
+            yield from map(_optimize_record, records)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker, initargs=initargs) as pool:
+            pending = deque()
+            for record in records:
+                pending.append(pool.submit(_optimize_record, record))
+                if len(pending) >= self.jobs * _PREFETCH:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
@@ -1,7 +1,8 @@
 import sys
-from biosynth.data.app_data import InputData, CostData, OutputData
+from biosynth.data.app_data import InputData, CostData, EngineData, OutputData
 from biosynth.executions.controllers.command_controller import CommandController
-from biosynth.executions.execution_utils import is_valid_input, is_valid_cost
+from biosynth.executions.execution_utils import is_valid_input, is_valid_cost, is_valid_shared_input, \
+    is_valid_top_k
 from biosynth.utils.file_utils import SequenceReader, PatternReader, CodonUsageReader
 from biosynth.utils.input_utils import ArgumentParser
 from biosynth.utils.cost_utils import normalize_codon_usage
@@ -19,21 +20,30 @@ class CLIController:
 
         Parses CLI arguments, reads the sequence/patterns/codon-usage files,
         validates inputs and cost parameters, populates the shared
-        ``InputData``/``CostData``/``OutputData`` state (including optional
-        overrides for alpha/beta/w, optimized codon flag, and output path),
-        and finally delegates execution to ``CommandController``. Exits with
-        code 2 on validation failure.
+        ``InputData``/``CostData``/``EngineData``/``OutputData`` state (including
+        optional overrides for alpha/beta/w, optimized codon flag, output path,
+        DP engine, low-memory and windowed modes, automaton and result caches,
+        automaton minimization, coding mode, top-k),
+        and finally delegates execution to ``CommandController``, to
+        ``BatchController`` when ``--batch`` names a FASTA file in place of the
+        sequence file, or to ``SweepController`` when ``--sweep`` gives a grid
+        of cost settings. Exits with code 2 on validation failure.
         """
         parser = ArgumentParser()
 
         _, s_path, p_path, c_path, o_path, alpha, beta, w, optimized_codon = parser.parse_args(self.argv)
 
-        seq = SequenceReader(s_path).read_sequence()
+        batch = parser.options.batch
+
+        seq = None if batch is not None else SequenceReader(s_path).read_sequence()
         unwanted_patterns = PatternReader(p_path).read_patterns()
         codon_usage_table = CodonUsageReader(c_path).read_codon_usage()
         codon_usage_file_name = CodonUsageReader(c_path).get_filename()
 
-        if not is_valid_input(seq, unwanted_patterns, codon_usage_table):
+        if batch is not None:
+            if not is_valid_shared_input(unwanted_patterns, codon_usage_table):
+                sys.exit(2)
+        elif not is_valid_input(seq, unwanted_patterns, codon_usage_table):
             sys.exit(2)
 
         InputData.dna_sequence = seq
@@ -54,12 +64,59 @@ class CLIController:
         if not is_valid_cost(CostData.alpha, CostData.beta, CostData.w):
             sys.exit(2)
 
+        sweep = parser.options.sweep
+        if sweep is not None:
+            if batch is not None:
+                Logger.error("--sweep optimizes a single sequence and cannot be combined with --batch.")
+                sys.exit(2)
+            for setting in sweep:
+                costs = {"alpha": CostData.alpha, "beta": CostData.beta, "w": CostData.w}
+                costs.update((name, value) for name, value in setting.items() if name in costs)
+                if not is_valid_cost(**costs):
+                    sys.exit(2)
+
         if optimized_codon is not None:
             CostData.optimized_codon = optimized_codon
 
         if o_path is not None:
             OutputData.output_path = o_path
 
+        if parser.options.engine is not None:
+            EngineData.engine = parser.options.engine
+
+        if parser.options.low_memory:
+            EngineData.low_memory = True
+
+        if parser.options.windowed:
+            EngineData.windowed = True
+
+        EngineData.fsm_cache = not parser.options.no_fsm_cache
+        EngineData.result_cache = not parser.options.no_cache
+
+        if parser.options.minimize_fsm:
+            EngineData.minimize_fsm = True
+
+        if parser.options.coding_mode is not None:
+            EngineData.coding_mode = parser.options.coding_mode
+
+        if parser.options.top_k is not None:
+            if not is_valid_top_k(parser.options.top_k):
+                sys.exit(2)
+            EngineData.top_k = parser.options.top_k
+
+        if parser.options.both_strands:
+            InputData.both_strands = True
+
+        if batch is not None:
+            from biosynth.executions.controllers.batch_controller import BatchController
+            BatchController(batch, parser.options.jobs, parser.options.batch_reports).run()
+            return
+
+        if sweep is not None:
+            from biosynth.executions.controllers.sweep_controller import SweepController
+            SweepController(sweep).run()
+            return
+
         controller = CommandController()
         controller.run()
 
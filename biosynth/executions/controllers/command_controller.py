@@ -1,13 +1,13 @@
+import json
 import sys
 from datetime import datetime
 from tabulate import tabulate
 
+from biosynth.algorithm.optimize import analyze, optimize
 from biosynth.data.app_data import InputData, EliminationData, OutputData
+from biosynth.data.optimization import OptimizationRequest
 from biosynth.executions.controllers.ui.theme import HEADINGS
-from biosynth.executions.execution_utils import eliminate_unwanted_patterns
-from biosynth.report.report_builder import ReportBuilder
 from biosynth.utils.display_utils import SequenceUtils
-from biosynth.utils.coding_region import CodingRegionLocator
 from biosynth.utils.file_utils import save_file
 from biosynth.utils.logger import Logger
 from biosynth.utils.spinner import run_with_spinner
@@ -33,12 +33,13 @@ app_icon_text = """
 class CommandController:
     """Orchestrates the core elimination workflow shared by the CLI and debug entry points."""
 
-    def run(self):
-        """Execute the full elimination pipeline against the populated app data.
+    def run(self, request=None):
+        """Execute the full elimination pipeline for ``request``.
 
-        Validates the input sequence, detects the start codon and coding
-        regions, logs the target sequence and unwanted-pattern occurrences,
-        runs the elimination algorithm with a progress spinner, prints
+        Validates the input sequence of ``request`` (by default the
+        ``OptimizationRequest`` described by the app data), detects the start codon and coding regions, logs the
+        target sequence and unwanted-pattern occurrences, runs ``optimize``
+        with a progress spinner, publishes the result to the app data, prints
         detailed cost contributions and substitutions, then writes the HTML
         report and the optimized-sequence/cost text files to the configured
         output path. Exits with code 3 if the input sequence is missing or
@@ -46,21 +47,22 @@ class CommandController:
         """
         Logger.notice(app_icon_text)
 
-        if not InputData.dna_sequence:
+        if request is None:
+            request = OptimizationRequest.from_app_data()
+
+        if not request.sequence:
             Logger.error("The input sequence is empty, please try again")
             sys.exit(3)
 
         try:
-            # Check for start codon
-            InputData.start_codon_identified, InputData.cleaned_dna_sequence = CodingRegionLocator.find_start_codon(InputData.dna_sequence)
+            # Check for start codon and extract coding regions
+            analysis = analyze(request)
         except ValueError as e:
             Logger.error(f"Start codon validation failed: {e}")
             InputData.reset()
             sys.exit(3)
 
-        # Extract coding regions
-        InputData.coding_positions, InputData.coding_indexes = CodingRegionLocator.get_coding_and_non_coding_regions_positions(
-            InputData.cleaned_dna_sequence, InputData.start_codon_identified)
+        analysis.to_app_data()
 
         Logger.debug(f"{format_text_bold_for_output(HEADINGS.target_sequence + ':')}")
 
@@ -79,18 +81,14 @@ class CommandController:
 
         # Print the list of unwanted patterns
         Logger.debug(f"{format_text_bold_for_output(HEADINGS.unwanted_patterns + ':')}")
-        Logger.info(f"{SequenceUtils.get_patterns(InputData.unwanted_patterns)}")
+        Logger.info(f"{SequenceUtils.get_patterns(request.unwanted_patterns)}")
         Logger.space()
 
-        if InputData.unwanted_patterns:
-            InputData.unwanted_patterns_occurrences = SequenceUtils.get_pattern_occurrences(
-                    InputData.cleaned_dna_sequence, InputData.unwanted_patterns)
-
+        if request.unwanted_patterns:
             per_line = 6
             rows_for_print = [
                 {
-                    "Pattern": row["Pattern"],
-                    "Count": row["Count"],
+                    **row,
                     "Positions": ",\n".join(
                         ", ".join(row["Positions"][i:i + per_line])
                         for i in range(0, len(row["Positions"]), per_line)
@@ -103,7 +101,7 @@ class CommandController:
                 rows_for_print,
                 headers="keys",
                 tablefmt="fancy_grid",
-                colalign=("left", "left", "left"),
+                colalign=("left",) * len(rows_for_print[0]),
             )
 
             Logger.debug(format_text_bold_for_output(HEADINGS.unwanted_pattern_occurrences + ':'))
@@ -113,13 +111,13 @@ class CommandController:
         # Eliminate unwanted patterns — show a spinner with elapsed-time
         # counter while the algorithm runs so the terminal doesn't look
         # frozen on long sequences.
-        run_with_spinner(
+        result = run_with_spinner(
             "Computation in progress. This may take a few moments for long sequences",
-            eliminate_unwanted_patterns,
-            InputData.cleaned_dna_sequence,
-            InputData.unwanted_patterns,
-            InputData.coding_positions,
+            optimize,
+            request,
+            analysis=analysis,
         )
+        result.to_app_data()
 
         Logger.notice(format_text_bold_for_output('\n' + '_' * 90 + '\n'))
         Logger.info(EliminationData.info)
@@ -153,8 +151,21 @@ class CommandController:
 
         Logger.space()
 
-        # Save the results
-        report = ReportBuilder()
+        if EliminationData.alternatives:
+            alternative_sequences = tabulate(
+                [{key: row[key] for key in ("Rank", "Cost", "Changed_Bases")} for row in EliminationData.alternatives],
+                headers="keys",
+                tablefmt="fancy_grid",
+                colalign=("left", "left", "left")
+            )
+
+            Logger.debug(format_text_bold_for_output(HEADINGS.alternative_sequences + ':'))
+            Logger.info(alternative_sequences)
+            Logger.space()
+
+        # Save the results; the template engine is only loaded once a report is rendered
+        from biosynth.report.report_builder import ReportBuilder
+        report = ReportBuilder(costs=request)
 
         Logger.critical("The final report and optimized sequence can be found in the following paths:\n")
         file_date = datetime.today().strftime("%d-%b-%Y_%H-%M-%S")
@@ -172,4 +183,16 @@ class CommandController:
         filename = f"Cost-Substitution_{file_date}.txt"
         path = save_file(detailed_cost_substitutions, filename, OutputData.output_path)
         Logger.notice(path)
+
+        if EliminationData.alternatives:
+            records = [f">rank_{row['Rank']} cost={row['Cost']} changed_bases={row['Changed_Bases']}\n{row['Sequence']}"
+                       for row in EliminationData.alternatives]
+            filename = f"Alternative-Sequences_{file_date}.fasta"
+            path = save_file('\n'.join(records) + '\n', filename, OutputData.output_path)
+            Logger.notice(path)
+
+            filename = f"Alternative-Sequences_{file_date}.json"
+            path = save_file(json.dumps(EliminationData.alternatives, indent=2) + '\n', filename,
+                             OutputData.output_path)
+            Logger.notice(path)
         Logger.space()
\ No newline at end of file
@@ -0,0 +1,49 @@
+import argparse
+import sys
+
+from biosynth.algorithm.fsm import FSM
+from biosynth.algorithm.fsm_cache import store_fsm
+from biosynth.data.optimization import OptimizationRequest
+from biosynth.executions.execution_utils import is_valid_patterns
+from biosynth.utils.cost_utils import EliminationScorerConfig
+from biosynth.utils.file_utils import PatternReader
+from biosynth.utils.logger import Logger
+
+
+class CompilePatternsController:
+    """Controller for ``biosynth compile-patterns``, which pre-warms the on-disk automaton cache."""
+
+    def __init__(self, argv):
+        self.argv = argv
+
+    def execute(self):
+        """Compile and cache the automaton of every given pattern file.
+
+        Each file is read like the ``-p`` option of the main command, its
+        automaton is built and written to the cache, and the state count and
+        cache entry are reported. With ``--both-strands`` the automaton also
+        avoids the reverse complements, as for a run with that option, so the
+        cache entry is the one that run loads. Exits with code 2 on invalid
+        patterns.
+        """
+        parser = argparse.ArgumentParser(
+            prog="biosynth compile-patterns",
+            description="Compile unwanted-pattern files into the on-disk automaton cache.",
+        )
+        parser.add_argument("pattern_files", metavar="FILE", nargs="+", help="Unwanted patterns file.")
+        parser.add_argument("--both-strands", action="store_true", default=False,
+                            help="Also eliminate the reverse complement of every unwanted pattern.")
+        args = parser.parse_args(self.argv)
+
+        alphabet = EliminationScorerConfig().alphabet
+        for path in args.pattern_files:
+            unwanted_patterns = PatternReader(path).read_patterns()
+            if not unwanted_patterns or not is_valid_patterns(unwanted_patterns):
+                Logger.error(f"Invalid unwanted patterns format in file:\n{path}")
+                sys.exit(2)
+
+            request = OptimizationRequest(sequence="", unwanted_patterns=unwanted_patterns, codon_usage={},
+                                          both_strands=args.both_strands)
+            fsm = FSM(request.patterns_to_eliminate(), alphabet)
+            cache_file = store_fsm(fsm)
+            Logger.info(f"{path}: {len(unwanted_patterns)} patterns, {len(fsm.compiled)} states -> {cache_file}")
@@ -1,6 +1,6 @@
 from biosynth.data.app_data import InputData, CostData
-from biosynth.executions.controllers.command_controller import CommandController
 from biosynth.executions.controllers.gui_controller import GUIController
+from biosynth.executions.controllers.sweep_controller import SweepController
 from biosynth.executions.execution_utils import is_valid_input, is_valid_cost
 from biosynth.settings.codon_usage_settings import C
 from biosynth.settings.pattern_settings import P
@@ -8,7 +8,7 @@ from biosynth.settings.sequence_settings import S
 from biosynth.utils.logger import Logger
 
 class DebugController:
-    """Development-only controller that runs the pipeline twice using hardcoded debug settings."""
+    """Development-only controller that compares both codon modes on hardcoded debug settings."""
 
     @staticmethod
     def execute():
@@ -17,9 +17,9 @@ class DebugController:
         Loads the hardcoded sequence, patterns, and codon-usage from
         ``biosynth.settings``, validates them along with fixed cost
         parameters (alpha=1.02, beta=1.98, w=99.96), populates the shared
-        ``InputData``/``CostData`` state, and then invokes
-        ``CommandController.run`` twice - once with ``optimized_codon=False``
-        and once with ``optimized_codon=True`` - to compare both modes.
+        ``InputData``/``CostData`` state, and then runs a ``SweepController``
+        over both values of ``optimized_codon``, which optimizes the two
+        modes in one pass and prints them side by side.
         Returns early without running if any validation step fails.
         """
         if not is_valid_input(S, P, C):
@@ -40,14 +40,7 @@ class DebugController:
         CostData.beta = beta
         CostData.w = w
 
-        Logger.critical("Starting DebugController execution with optimized_codon = False ...")
-        CostData.optimized_codon = False
-        controller = CommandController()
-        controller.run()
-
-        Logger.critical("Starting DebugController execution with optimized_codon = True ...")
-        CostData.optimized_codon = True
-        controller = CommandController()
-        controller.run()
+        Logger.critical("Starting DebugController execution with optimized_codon = False and True ...")
+        SweepController([{"optimized_codon": False}, {"optimized_codon": True}]).run()
 
         return
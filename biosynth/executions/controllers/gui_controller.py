@@ -4,6 +4,7 @@ import sys
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QApplication
 
+from biosynth.data.app_data import EngineData
 from biosynth.executions.controllers.ui.theme import global_app_qss
 from biosynth.executions.controllers.ui.windows import BaseWindow
 from biosynth.utils.file_utils import resource_path
@@ -18,10 +19,13 @@ class GUIController:
     def execute():
         """Launch the Qt application.
 
-        Creates the ``QApplication``, instantiates the main ``BaseWindow``,
-        applies the BioSynth icon and global stylesheet, and enters the Qt
-        event loop. Calls ``sys.exit`` with the loop's return code.
+        Enables the on-disk automaton and result caches, creates the ``QApplication``,
+        instantiates the main ``BaseWindow``, applies the BioSynth icon and
+        global stylesheet, and enters the Qt event loop. Calls ``sys.exit`` with the loop's return code.
         """
+        EngineData.fsm_cache = True
+        EngineData.result_cache = True
+
         app = QApplication(sys.argv)
         ex = BaseWindow()
         ex.show()
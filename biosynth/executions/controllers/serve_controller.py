@@ -0,0 +1,53 @@
+import argparse
+import os
+import sys
+
+from biosynth.executions.service import OptimizationServer, UnixOptimizationServer, CACHE_SIZE
+from biosynth.executions.service_client import DEFAULT_HOST, DEFAULT_PORT
+from biosynth.utils.logger import Logger
+
+
+class ServeController:
+    """Controller for ``biosynth serve``, which runs the local JSON optimization service."""
+
+    def __init__(self, argv):
+        self.argv = argv
+
+    def execute(self):
+        """Serve optimization jobs until interrupted.
+
+        Listens on ``--host``/``--port`` or on the Unix socket ``--socket``
+        and runs the jobs on ``--jobs`` worker processes, each keeping its
+        compiled automata and normalized codon tables in an LRU cache.
+        """
+        parser = argparse.ArgumentParser(
+            prog="biosynth serve",
+            description="Run a local JSON optimization service with warm automaton and codon table caches.",
+        )
+        parser.add_argument("--host", default=DEFAULT_HOST, help=f"Address to listen on (default {DEFAULT_HOST}).")
+        parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to listen on (default {DEFAULT_PORT}).")
+        parser.add_argument("--socket", metavar="PATH", default=None, help="Listen on a Unix socket instead of TCP.")
+        parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                            help="Number of worker processes (default: the number of CPUs).")
+        args = parser.parse_args(self.argv)
+
+        try:
+            if args.socket:
+                server = UnixOptimizationServer(args.socket, jobs=args.jobs)
+                address = args.socket
+            else:
+                server = OptimizationServer((args.host, args.port), jobs=args.jobs)
+                address = "http://{}:{}".format(*server.server_address[:2])
+        except OSError as e:
+            Logger.error(f"Cannot start the BioSynth service: {e}")
+            sys.exit(2)
+
+        Logger.info(f"BioSynth service listening on {address} with {args.jobs} worker(s), "
+                    f"caching up to {CACHE_SIZE} automata and codon tables per worker.")
+        Logger.info("POST jobs to /optimize, GET /health for the cache statistics. Press Ctrl+C to stop.")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            Logger.info("\nBioSynth service stopped.")
+        finally:
+            server.server_close()
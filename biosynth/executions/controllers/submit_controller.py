@@ -0,0 +1,89 @@
+import argparse
+import json
+import sys
+
+from biosynth.executions.service_client import DEFAULT_HOST, DEFAULT_PORT, request_service
+from biosynth.utils.file_utils import SequenceReader, PatternReader, CodonUsageReader
+from biosynth.utils.logger import Logger
+
+
+class SubmitController:
+    """Controller for ``biosynth submit``, the client of a running ``biosynth serve`` service."""
+
+    def __init__(self, argv):
+        self.argv = argv
+
+    def execute(self):
+        """Send one job to the service and print or save its result.
+
+        The input files are read like the options of the main command and
+        sent with the optional cost and engine options; the optimized
+        sequence and cost are printed, and ``-o`` writes the full JSON result.
+        Exits with code 2 when the service rejects the job and 3 when it
+        cannot be reached.
+        """
+        parser = argparse.ArgumentParser(
+            prog="biosynth submit",
+            description="Submit an optimization job to a running 'biosynth serve' service.",
+        )
+        parser.add_argument("-s", "--target_sequence", metavar="PATH", required=True, help="Sequence file.")
+        parser.add_argument("-p", "--unwanted_patterns", metavar="PATH", required=True, help="Unwanted patterns file.")
+        parser.add_argument("-c", "--codon_usage", metavar="PATH", required=True, help="Codon usage table file.")
+        parser.add_argument("-a", "--alpha", type=float, default=None, help="Transition substitution cost.")
+        parser.add_argument("-b", "--beta", type=float, default=None, help="Transversion substitution cost.")
+        parser.add_argument("-w", "--non_synonymous_w", type=float, default=None,
+                            help="Non-synonymous substitution cost.")
+        parser.add_argument("-oc", "--optimized_codon", choices=("yes", "no"), default=None,
+                            help="Enable/Disable codon optimization based on codon usage.")
+        parser.add_argument("-e", "--engine", choices=("python", "vectorized", "codon", "astar"), default=None,
+                            help="Dynamic-programming engine.")
+        parser.add_argument("--coding-mode", choices=("full", "synonymous-only", "auto"), default=None,
+                            help="Candidate codons in coding regions.")
+        parser.add_argument("-k", "--top-k", type=int, default=None,
+                            help="Also return the k cheapest distinct sequences.")
+        parser.add_argument("--both-strands", action="store_true", default=False,
+                            help="Also eliminate the reverse complement of every unwanted pattern.")
+        parser.add_argument("--no-cache", action="store_true", default=False,
+                            help="Re-run the optimization instead of reusing a cached result.")
+        parser.add_argument("-o", "--output", metavar="PATH", default=None, help="Write the JSON result to PATH.")
+        parser.add_argument("--host", default=DEFAULT_HOST, help=f"Service address (default {DEFAULT_HOST}).")
+        parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Service port (default {DEFAULT_PORT}).")
+        parser.add_argument("--socket", metavar="PATH", default=None, help="Service Unix socket.")
+        args = parser.parse_args(self.argv)
+
+        job = {
+            "sequence": SequenceReader(args.target_sequence).read_sequence(),
+            "unwanted_patterns": sorted(PatternReader(args.unwanted_patterns).read_patterns()),
+            "codon_usage": CodonUsageReader(args.codon_usage).read_codon_usage(),
+        }
+        for name, value in (("alpha", args.alpha), ("beta", args.beta), ("w", args.non_synonymous_w),
+                            ("engine", args.engine), ("coding_mode", args.coding_mode), ("top_k", args.top_k)):
+            if value is not None:
+                job[name] = value
+        if args.optimized_codon is not None:
+            job["optimized_codon"] = args.optimized_codon == "yes"
+        if args.both_strands:
+            job["both_strands"] = True
+        if args.no_cache:
+            job["result_cache"] = False
+
+        try:
+            result = request_service("POST", "/optimize", job, host=args.host, port=args.port,
+                                     socket_path=args.socket)
+        except ValueError as e:
+            Logger.error(f"The job was rejected: {e}")
+            sys.exit(2)
+        except OSError as e:
+            Logger.error(f"Cannot reach the BioSynth service: {e}")
+            sys.exit(3)
+
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as fh:
+                json.dump(result, fh, indent=2)
+
+        if result["optimized_sequence"] is None:
+            Logger.warning("No valid sequence found that avoids the unwanted patterns.")
+        else:
+            Logger.info(result["optimized_sequence"])
+            Logger.info(f"Cost: {result['min_cost']:.10g}")
+        return result
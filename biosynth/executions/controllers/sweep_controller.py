@@ -0,0 +1,82 @@
+import sys
+from dataclasses import replace
+from datetime import datetime
+
+from tabulate import tabulate
+
+from biosynth.algorithm.optimize import analyze, sweep
+from biosynth.data.app_data import OutputData
+from biosynth.data.optimization import OptimizationRequest
+from biosynth.utils.file_utils import create_dir, output_dir
+from biosynth.utils.logger import Logger
+from biosynth.utils.spinner import run_with_spinner
+
+RESULT_COLUMNS = ("Alpha", "Beta", "W", "Optimized_Codon", "Status", "Cost", "Changes", "Changed_Bases")
+
+
+def _result_row(request, result):
+    """Return the comparison row of one setting of the sweep."""
+    row = dict.fromkeys(RESULT_COLUMNS, "")
+    row.update(Alpha=f"{request.alpha:g}", Beta=f"{request.beta:g}", W=f"{request.w:g}",
+               Optimized_Codon=request.optimized_codon)
+
+    if result.optimized_sequence is None:
+        row["Status"] = "no valid sequence"
+        return row
+
+    changes = len(result.cost_contribution) + len(result.cost_substitution)
+    changed_bases = sum(a != b for a, b in zip(result.cleaned_sequence, result.optimized_sequence))
+    row.update(Status="optimized" if changes else "unchanged", Cost=f"{result.min_cost:g}", Changes=changes,
+               Changed_Bases=changed_bases)
+    return row
+
+
+class SweepController:
+    """Optimizes one sequence under a grid of cost settings and compares the outcomes."""
+
+    def __init__(self, settings):
+        self.settings = settings
+
+    def run(self):
+        """Optimize the sequence of the app data once per setting and write the comparison table.
+
+        Every setting overrides some of ``alpha``, ``beta``, ``w`` and
+        ``optimized_codon`` of the ``OptimizationRequest`` of the app data.
+        The sequence is analyzed once, and all settings share one automaton
+        and one DP pass. One row per setting, with its cost and number of
+        changes, is printed and written in grid order to a tab-separated
+        ``Sweep-Results_<date>.tsv`` in the output directory. Exits with code
+        3 if start-codon validation fails.
+
+        Returns:
+            The path of the comparison file.
+        """
+        request = OptimizationRequest.from_app_data()
+        requests = [replace(request, **setting) for setting in self.settings]
+
+        try:
+            analysis = analyze(request)
+        except ValueError as e:
+            Logger.error(f"Start codon validation failed: {e}")
+            sys.exit(3)
+
+        Logger.info(f"Sweep of {len(requests)} cost setting(s).")
+        results = run_with_spinner("Computation in progress. This may take a few moments for long sequences",
+                                   sweep, requests, analysis=analysis)
+        rows = [_result_row(r, result) for r, result in zip(requests, results)]
+
+        Logger.info(tabulate(rows, headers="keys", tablefmt="fancy_grid"))
+        Logger.space()
+
+        file_date = datetime.today().strftime("%d-%b-%Y_%H-%M-%S")
+        results_dir = output_dir(OutputData.output_path)
+        create_dir(results_dir)
+        results_path = results_dir / f"Sweep-Results_{file_date}.tsv"
+        with open(results_path, 'w', encoding='utf-8') as file:
+            file.write('\t'.join(RESULT_COLUMNS) + '\n')
+            for row in rows:
+                file.write('\t'.join(str(row[column]) for column in RESULT_COLUMNS) + '\n')
+
+        Logger.critical("The sweep results can be found in the following path:\n")
+        Logger.notice(f"{results_path}\n")
+        return str(results_path)
@@ -233,6 +233,7 @@ class Labels:
     spin_beta: str = "Transversion substitution cost"
     spin_w: str = "Non-synonymous substitution cost"
     toggle_optimized_codon: str = "Enable codon optimization"
+    toggle_both_strands: str = "Eliminate patterns on both strands"
 
     report_available: str = "Elimination report is now available"
     tab_coding_region: str = "Coding Region Criteria"
@@ -240,6 +241,16 @@ class Labels:
     tab_cost_contribution: str = "Cost Substitutions"
     tab_cost_substitution: str = "Zero-Cost Substitution"
 
+    base_lock_compute: str = "Explore base locking"
+    base_lock_hint: str = "Computes the cheapest cost with each base forced at each position."
+    base_lock_prompt: str = "Force base"
+    base_lock_position: str = "at position"
+    base_lock: str = "Lock"
+    base_unlock: str = "Unlock"
+    base_lock_query: str = "{base} at position {position}: best cost {cost} ({extra})"
+    base_lock_impossible: str = "{base} at position {position}: every sequence would contain an unwanted pattern"
+    base_lock_summary: str = "{count} locked base(s): best cost {bound}{cost}"
+
     busy_message: str = "Computation in progress.\nThis may take a few moments for long sequences."
     elimination_failed: str = "Elimination failed"
 
@@ -267,6 +278,8 @@ class Headings:
     elimination_process: str = "Elimination Process"
     detailed_cost_contributions: str = "List of substitutions (relative to optimal sequence)"
     detailed_cost_substitutions: str = "List of zero-cost substitutions (relative to original sequence)"
+    alternative_sequences: str = "Alternative sequences (cheapest first)"
+    base_locking: str = "Base locking"
     coding_region_identified: str = "A coding region was identified in the original sequence at positions {start} - {end}"
 
 # Module-level singletons — import these instead of instantiating.
@@ -18,31 +18,32 @@ and a ``run()`` slot. Use the standard Qt pattern::
 
 from PyQt5.QtCore import QObject, pyqtSignal
 
-from biosynth.executions.execution_utils import eliminate_unwanted_patterns
+from biosynth.algorithm.optimize import optimize
 
 
 class EliminationWorker(QObject):
-    """Runs ``eliminate_unwanted_patterns`` off the UI thread."""
+    """Runs ``optimize`` on an ``OptimizationRequest`` off the UI thread.
 
-    finished = pyqtSignal()
+    Passing the ``DPCheckpoints`` of the previous run lets the DP resume
+    from the first edited position instead of recomputing every column.
+    """
+
+    finished = pyqtSignal(object)
     failed = pyqtSignal(str)
 
-    def __init__(self, sequence, patterns, coding_positions):
+    def __init__(self, request, checkpoints=None):
         super().__init__()
-        self._sequence = sequence
-        self._patterns = patterns
-        self._coding_positions = coding_positions
+        self._request = request
+        self._checkpoints = checkpoints
 
     def run(self):
         """Execute the elimination on the worker thread.
 
-        Emits ``finished`` on success or ``failed`` with the error message
-        if the underlying computation raises.
+        Emits ``finished`` with the ``OptimizationResult`` on success or
+        ``failed`` with the error message if the underlying computation
+        raises. The app data is left for the UI thread to update.
         """
         try:
-            eliminate_unwanted_patterns(
-                self._sequence, self._patterns, self._coding_positions
-            )
-            self.finished.emit()
+            self.finished.emit(optimize(self._request, checkpoints=self._checkpoints))
         except Exception as e:  # pragma: no cover - surfaced to the UI
             self.failed.emit(str(e))
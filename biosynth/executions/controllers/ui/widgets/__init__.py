@@ -1,10 +1,12 @@
 """Custom Qt widgets used by the BioSynth GUI.
 
 Custom widgets (toggles, drop targets, the floating scroll indicator) live
-in :mod:`custom`. The tabbed help dialog lives in :mod:`info_dialog`. All
-are re-exported here.
+in :mod:`custom`. The tabbed help dialog lives in :mod:`info_dialog`, and
+the base-locking panel of the results page in :mod:`base_lock`. All are
+re-exported here.
 """
 
+from biosynth.executions.controllers.ui.widgets.base_lock import BaseLockPanel
 from biosynth.executions.controllers.ui.widgets.busy_dialog import BusyDialog
 from biosynth.executions.controllers.ui.widgets.custom import (
     CircularButton,
@@ -16,6 +18,7 @@ from biosynth.executions.controllers.ui.widgets.custom import (
 from biosynth.executions.controllers.ui.widgets.info_dialog import InfoDialog
 
 __all__ = [
+    "BaseLockPanel",
     "BusyDialog",
     "CircularButton",
     "DropTableWidget",
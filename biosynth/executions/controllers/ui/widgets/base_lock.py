@@ -0,0 +1,96 @@
+"""Panel for forcing bases of the optimized sequence.
+
+Shows, for a chosen position and base, the cheapest total cost with that
+base forced there, and keeps a set of locked bases. Every update is a
+lookup in the marginal costs of the last optimization, so nothing is
+re-optimized while the user explores.
+"""
+
+from PyQt5.QtWidgets import QComboBox, QHBoxLayout, QLabel, QPushButton, QSpinBox, QVBoxLayout, QWidget
+
+from biosynth.algorithm.marginals import MarginalCosts
+from biosynth.executions.controllers.ui.theme import LABELS, SIZES
+from biosynth.utils.cost_utils import BASES
+from biosynth.utils.descriptions import format_cost
+
+
+class BaseLockPanel(QWidget):
+    """Position/base picker with lock toggling, backed by :class:`MarginalCosts`."""
+
+    def __init__(self, marginal_costs, optimized_sequence, parent=None):
+        super().__init__(parent)
+        self.marginals = MarginalCosts(marginal_costs)
+        self.optimized_sequence = optimized_sequence
+        self.locks = {}
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        row = QHBoxLayout()
+        layout.addLayout(row)
+        row.addWidget(QLabel(LABELS.base_lock_prompt))
+
+        self.base_box = QComboBox()
+        self.base_box.addItems(BASES)
+        row.addWidget(self.base_box)
+
+        row.addWidget(QLabel(LABELS.base_lock_position))
+        self.position_box = QSpinBox()
+        self.position_box.setRange(1, max(len(self.marginals), 1))
+        self.position_box.setFixedSize(SIZES.spinbox_w, SIZES.spinbox_h)
+        row.addWidget(self.position_box)
+
+        self.lock_button = QPushButton(LABELS.base_lock)
+        self.lock_button.setFixedSize(SIZES.button_medium_w, SIZES.button_h)
+        self.lock_button.clicked.connect(self.toggle_lock)
+        row.addWidget(self.lock_button)
+        row.addStretch()
+
+        self.query_label = QLabel()
+        layout.addWidget(self.query_label)
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+
+        self.position_box.valueChanged.connect(self._on_position_changed)
+        self.base_box.currentTextChanged.connect(self.refresh)
+        self._on_position_changed(self.position_box.value())
+
+    def _on_position_changed(self, position):
+        # Start from the locked base, or the optimized one
+        base = self.locks.get(position - 1, self.optimized_sequence[position - 1])
+        self.base_box.blockSignals(True)
+        self.base_box.setCurrentText(base)
+        self.base_box.blockSignals(False)
+        self.refresh()
+
+    def toggle_lock(self):
+        """Lock the selected base at the selected position, or unlock that position."""
+        position = self.position_box.value() - 1
+        if self.locks.get(position) == self.base_box.currentText():
+            del self.locks[position]
+        else:
+            self.locks[position] = self.base_box.currentText()
+        self.refresh()
+
+    def refresh(self):
+        """Update the query and lock summary labels from the marginal costs."""
+        position = self.position_box.value() - 1
+        base = self.base_box.currentText()
+        cost = self.marginals.cost(position, base)
+        if cost == float('inf'):
+            self.query_label.setText(LABELS.base_lock_impossible.format(base=base, position=position + 1))
+        else:
+            extra = self.marginals.extra_cost(position, base)
+            self.query_label.setText(LABELS.base_lock_query.format(
+                base=base, position=position + 1, cost=format_cost(cost),
+                extra="free" if extra <= self.marginals.tolerance else f"+{format_cost(extra)}"))
+
+        locked = self.locks.get(position) == base
+        self.lock_button.setText(LABELS.base_unlock if locked else LABELS.base_lock)
+        if self.locks:
+            bound = self.marginals.locked_cost(self.locks)
+            self.summary_label.setText(LABELS.base_lock_summary.format(
+                count=len(self.locks), bound="" if len(self.locks) == 1 else "at least ",
+                cost=format_cost(bound)))
+        else:
+            self.summary_label.setText("")
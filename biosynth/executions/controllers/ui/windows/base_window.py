@@ -1,7 +1,11 @@
+from dataclasses import replace
+
 from PyQt5.QtCore import QThread
 from PyQt5.QtWidgets import QMainWindow, QMessageBox, QStackedWidget
 
-from biosynth.data.app_data import CostData, InputData
+from biosynth.algorithm.incremental import DPCheckpoints
+from biosynth.data.app_data import CostData, EliminationData, InputData
+from biosynth.data.optimization import OptimizationRequest
 from biosynth.executions.controllers.ui.theme import LABELS, SIZES, TITLES
 from biosynth.executions.controllers.ui.utils import EliminationWorker, GuiValidator
 from biosynth.executions.controllers.ui.widgets import BusyDialog
@@ -22,6 +26,9 @@ class BaseWindow(QMainWindow):
         self._busy_dialog = None
         self._elim_thread = None
         self._elim_worker = None
+        self._marginals_ready = None
+        # Forward DP state of the last run, resumed when the sequence is edited and rerun
+        self._checkpoints = DPCheckpoints()
         self.init_ui()
 
     def init_ui(self):
@@ -60,28 +67,42 @@ class BaseWindow(QMainWindow):
 
     def switch_to_results_window(self):
         """Display the results page (step 4)."""
-        self._show_page(ResultsWindow(self.show_elimination_window))
+        self._show_page(ResultsWindow(self.show_elimination_window, self.compute_marginal_costs))
 
     def switch_to_elimination_window(self):
         """Run the elimination algorithm on a worker thread.
 
         Stays on the current page (SettingsWindow) and shows a modal busy
         dialog while the algorithm runs. Only when the worker emits
-        ``finished`` does the UI transition to :class:`EliminationWindow`.
+        ``finished`` does the UI publish the result to the app data and
+        transition to :class:`EliminationWindow`.
+        """
+        self._run_worker(OptimizationRequest.from_app_data(), self._on_elimination_finished)
+
+    def compute_marginal_costs(self, on_ready):
+        """Compute the marginal costs of the last result on a worker thread, for the base-lock panel.
+
+        Only run when the results page asks for them: the optimization is
+        rerun with ``marginals`` on the checkpoints of the last run, so the DP
+        columns are reused and mostly the marginal pass is computed. The costs
+        are published to ``EliminationData.marginal_costs`` and passed to
+        ``on_ready``.
         """
+        self._marginals_ready = on_ready
+        request = replace(OptimizationRequest.from_app_data(), marginals=True)
+        self._run_worker(request, self._on_marginals_finished)
+
+    def _run_worker(self, request, on_finished):
+        """Run ``request`` on a worker thread behind a modal busy dialog and pass the result to ``on_finished``."""
         self._busy_dialog = BusyDialog(parent=self, message=LABELS.busy_message)
         self._busy_dialog.show()
 
         self._elim_thread = QThread(self)
-        self._elim_worker = EliminationWorker(
-            InputData.cleaned_dna_sequence,
-            InputData.unwanted_patterns,
-            InputData.coding_positions,
-        )
+        self._elim_worker = EliminationWorker(request, self._checkpoints)
         self._elim_worker.moveToThread(self._elim_thread)
 
         self._elim_thread.started.connect(self._elim_worker.run)
-        self._elim_worker.finished.connect(self._on_elimination_finished)
+        self._elim_worker.finished.connect(on_finished)
         self._elim_worker.failed.connect(self._on_elimination_failed)
         self._elim_worker.finished.connect(self._elim_thread.quit)
         self._elim_worker.failed.connect(self._elim_thread.quit)
@@ -95,10 +116,18 @@ class BaseWindow(QMainWindow):
             self._busy_dialog.close()
             self._busy_dialog = None
 
-    def _on_elimination_finished(self):
+    def _on_elimination_finished(self, result):
+        result.to_app_data()
         self._close_busy_dialog()
         self.show_elimination_window()
 
+    def _on_marginals_finished(self, result):
+        EliminationData.marginal_costs = result.marginal_costs
+        self._close_busy_dialog()
+        on_ready, self._marginals_ready = self._marginals_ready, None
+        if result.marginal_costs is not None:
+            on_ready(result.marginal_costs)
+
     def _on_elimination_failed(self, error_message: str):
         self._close_busy_dialog()
         QMessageBox.critical(
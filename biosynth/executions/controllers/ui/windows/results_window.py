@@ -13,6 +13,7 @@ from PyQt5.QtWidgets import (
     QSizePolicy,
     QSpacerItem,
     QVBoxLayout,
+    QWidget,
 )
 
 from biosynth.data.app_data import EliminationData, InputData, OutputData
@@ -30,7 +31,7 @@ from biosynth.executions.controllers.ui.utils import (
     add_text_edit_html,
     create_table_from_data,
 )
-from biosynth.executions.controllers.ui.widgets import CircularButton, InfoDialog
+from biosynth.executions.controllers.ui.widgets import BaseLockPanel, CircularButton, InfoDialog
 from biosynth.executions.controllers.ui.windows.wizard_page import WizardPage
 from biosynth.executions.execution_utils import initialize_report, mark_non_equal_codons
 
@@ -58,12 +59,15 @@ def show_preview_report(report_local_file_path):
 class ResultsWindow(WizardPage):
     """Final wizard page — shows the optimized sequence and report actions."""
 
-    def __init__(self, back_to_elimination_callback):
+    def __init__(self, back_to_elimination_callback, compute_marginals_callback=None):
         super().__init__(
             back_callback=back_to_elimination_callback,
             next_callback=quit_app,
             next_label=LABELS.done,
         )
+        self.compute_marginals_callback = compute_marginals_callback
+        self.base_lock_layout = None
+        self.base_lock_prompt = None
         self.report = None
         self.status_label = None
         self.fade_in_animation = None
@@ -114,12 +118,38 @@ class ResultsWindow(WizardPage):
             self.update_status,
         )
 
+        if OutputData.optimized_sequence and (EliminationData.marginal_costs or self.compute_marginals_callback):
+            middle_layout.addWidget(QLabel(f"<h3>{HEADINGS.base_locking}:</h3>"))
+            self.base_lock_layout = QVBoxLayout()
+            middle_layout.addLayout(self.base_lock_layout)
+            if EliminationData.marginal_costs:
+                self.show_base_lock_panel(EliminationData.marginal_costs)
+            else:
+                # The marginal costs take another pass over the DP, so they are only computed on request
+                self.base_lock_prompt = QWidget()
+                prompt_layout = QHBoxLayout(self.base_lock_prompt)
+                prompt_layout.setContentsMargins(0, 0, 0, 0)
+                compute_button = QPushButton(LABELS.base_lock_compute)
+                compute_button.setFixedSize(SIZES.button_xlarge_w, SIZES.button_h)
+                compute_button.clicked.connect(lambda: self.compute_marginals_callback(self.show_base_lock_panel))
+                prompt_layout.addWidget(compute_button)
+                prompt_layout.addWidget(QLabel(LABELS.base_lock_hint))
+                prompt_layout.addStretch()
+                self.base_lock_layout.addWidget(self.base_lock_prompt)
+
         layout.addSpacerItem(
             QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
         )
 
         self._prompt_report(middle_layout, file_date)
 
+    def show_base_lock_panel(self, marginal_costs):
+        """Show the :class:`BaseLockPanel` of ``marginal_costs`` in place of the compute button."""
+        if self.base_lock_prompt is not None:
+            self.base_lock_prompt.deleteLater()
+            self.base_lock_prompt = None
+        self.base_lock_layout.addWidget(BaseLockPanel(marginal_costs, OutputData.optimized_sequence))
+
     def _init_floating_status(self, parent_widget):
         self.status_label = QLabel(parent_widget)
         self.status_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
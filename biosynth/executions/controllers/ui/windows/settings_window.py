@@ -352,7 +352,8 @@ class SettingsWindow(WizardPage):
             return
 
         rows = SequenceUtils.get_pattern_occurrences(
-            InputData.cleaned_dna_sequence, InputData.unwanted_patterns
+            InputData.cleaned_dna_sequence, InputData.unwanted_patterns,
+            both_strands=InputData.both_strands,
         )
         InputData.unwanted_patterns_occurrences = rows
         if not any(row["Count"] for row in rows):
@@ -364,8 +365,10 @@ class SettingsWindow(WizardPage):
 
         table = QTableWidget()
         table.setFont(_monospace_font())
-        table.setColumnCount(3)
-        table.setHorizontalHeaderLabels(["Pattern", "Count", "Positions"])
+        headers = [key for key in rows[0]]
+        positions_col = len(headers) - 1
+        table.setColumnCount(len(headers))
+        table.setHorizontalHeaderLabels(headers)
 
         table.setRowCount(len(rows))
 
@@ -378,10 +381,11 @@ class SettingsWindow(WizardPage):
             pattern_item.setFlags(pattern_item.flags() & ~Qt.ItemIsEditable)
             table.setItem(r, 0, pattern_item)
 
-            count_item = QTableWidgetItem(str(row["Count"]))
-            count_item.setTextAlignment(left_align)
-            count_item.setFlags(count_item.flags() & ~Qt.ItemIsEditable)
-            table.setItem(r, 1, count_item)
+            for c, key in enumerate(headers[1:positions_col], start=1):
+                item = QTableWidgetItem(str(row[key]))
+                item.setTextAlignment(left_align)
+                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+                table.setItem(r, c, item)
 
             cell_widget = QWidget()
             flow = _FlowLayout(cell_widget, margin=6, spacing=4)
@@ -395,13 +399,13 @@ class SettingsWindow(WizardPage):
             else:
                 flow.addWidget(QLabel("—"))
 
-            table.setCellWidget(r, 2, cell_widget)
+            table.setCellWidget(r, positions_col, cell_widget)
             pattern_labels.append((r, cell_widget))
 
         header = table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.Stretch)
+        for c in range(positions_col):
+            header.setSectionResizeMode(c, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(positions_col, QHeaderView.Stretch)
         header.setDefaultAlignment(left_align)
         table.setVerticalScrollMode(QTableWidget.ScrollPerPixel)
         table.setHorizontalScrollMode(QTableWidget.ScrollPerPixel)
@@ -418,7 +422,7 @@ class SettingsWindow(WizardPage):
 
         def resize_rows():
             """Resize each row to fit its wrapped chip flow at the current column width."""
-            col_w = table.columnWidth(2) - 12  # subtract flow margins
+            col_w = table.columnWidth(positions_col) - 12  # subtract flow margins
             if col_w <= 0:
                 return
             for row_idx, widget in pattern_labels:
@@ -430,7 +434,7 @@ class SettingsWindow(WizardPage):
                 table.setRowHeight(row_idx, max(SIZES.table_row_default_h, h + 12))
 
         header.sectionResized.connect(
-            lambda idx, *_: resize_rows() if idx == 2 else None
+            lambda idx, *_: resize_rows() if idx == positions_col else None
         )
         QTimer.singleShot(0, resize_rows)
 
@@ -9,7 +9,7 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-from biosynth.data.app_data import CostData, UploadData
+from biosynth.data.app_data import CostData, InputData, UploadData
 from biosynth.executions.controllers.ui.theme import LABELS, MARGINS, SIZES, TITLES
 from biosynth.executions.controllers.ui.utils import (
     add_button,
@@ -137,6 +137,11 @@ class UploadWindow(QWidget):
             callback=lambda val: setattr(CostData, 'optimized_codon', val),
             args=(LABELS.toggle_optimized_codon,), alignment=Qt.AlignCenter,
         )
+        self.both_strands_toggle = add_toggle(
+            custom_scores_layout, default_value=InputData.both_strands,
+            callback=lambda val: setattr(InputData, 'both_strands', val),
+            args=(LABELS.toggle_both_strands,), alignment=Qt.AlignCenter,
+        )
 
         custom_scores_layout.addStretch(1)
 
@@ -168,6 +173,8 @@ class UploadWindow(QWidget):
         self.w_spinbox.setValue(CostData.w)
 
         self.optimized_codon_toggle.setChecked(CostData.optimized_codon)
+        InputData.both_strands = False
+        self.both_strands_toggle.setChecked(InputData.both_strands)
 
     def get_input_data(self):
         """Return the current ``(dna, patterns, codon_usage)`` tuple from UploadData."""
@@ -1,6 +1,7 @@
 from biosynth.algorithm.eliminate_sequence import EliminationController
+from biosynth.algorithm.top_k import MAX_TOP_K
 from biosynth.data.app_data import EliminationData, OutputData
-from biosynth.report.report_builder import ReportBuilder
+from biosynth.utils.cost_utils import IUPAC_CODES
 from biosynth.utils.display_utils import SequenceUtils
 from biosynth.utils.logger import Logger
 
@@ -12,8 +13,8 @@ def is_valid_dna(sequence):
 
 
 def is_valid_patterns(patterns):
-    """Return ``True`` if every pattern contains only A/T/C/G/U bases (case-insensitive)."""
-    valid_bases = set('ATCGU')
+    """Return ``True`` if every pattern contains only A/T/C/G/U bases or IUPAC codes (case-insensitive)."""
+    valid_bases = set('U') | set(IUPAC_CODES)
     for pattern in patterns:
         if not all(base in valid_bases for base in pattern.upper()):
             return False
@@ -68,6 +69,19 @@ def is_valid_input(sequence, unwanted_patterns, codon_usage_table):
         Logger.error(f"Invalid sequence format in file.")
         return False
 
+    return is_valid_shared_input(unwanted_patterns, codon_usage_table)
+
+
+def is_valid_shared_input(unwanted_patterns, codon_usage_table):
+    """Validate the unwanted patterns and codon usage table, which a batch shares across all records.
+
+    Args:
+        unwanted_patterns: Iterable of pattern strings to eliminate.
+        codon_usage_table: Codon usage mapping to validate.
+
+    Returns:
+        True if both inputs are present and well-formed, otherwise False.
+    """
     if unwanted_patterns is None:
         Logger.error(f"Unwanted Patterns file is missing.")
         return False
@@ -133,6 +147,22 @@ def is_valid_cost(alpha=None, beta=None, w=None):
 
     return True
 
+
+def is_valid_top_k(top_k):
+    """Validate the number of alternative sequences to report.
+
+    Args:
+        top_k: Number of cheapest sequences; an integer from 1 to ``MAX_TOP_K``.
+
+    Returns:
+        True if the value is in range, otherwise False.
+    """
+    if isinstance(top_k, bool) or not isinstance(top_k, int) or not 1 <= top_k <= MAX_TOP_K:
+        Logger.error(f"Invalid top-k value: k = {top_k}. Must be an integer from 1 to {MAX_TOP_K}.")
+        return False
+
+    return True
+
 import time
 
 def eliminate_unwanted_patterns(seq, unwanted_patterns, coding_positions):
@@ -155,5 +185,6 @@ def mark_non_equal_codons(input_seq, optimized_seq, coding_positions):
 
 def initialize_report():
     """Construct and return a fresh ``ReportBuilder`` initialized from current app data."""
+    from biosynth.report.report_builder import ReportBuilder
     report = ReportBuilder()
     return report
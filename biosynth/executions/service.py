@@ -0,0 +1,225 @@
+import json
+import math
+import os
+import socketserver
+import stat
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from biosynth.algorithm.eliminate_sequence import EliminationController
+from biosynth.algorithm.optimize import optimize
+from biosynth.data.optimization import OptimizationRequest
+from biosynth.executions.execution_utils import is_valid_dna, is_valid_patterns, is_valid_codon_usage, \
+    is_valid_cost, is_valid_top_k
+from biosynth.utils.cost_utils import normalize_codon_usage
+
+# Compiled automata and normalized codon tables kept per worker process
+CACHE_SIZE = 32
+
+# Request fields passed through to OptimizationRequest unchanged
+_OPTIONS = ("alpha", "beta", "w", "optimized_codon", "both_strands", "engine", "low_memory", "windowed",
+            "minimize_fsm", "coding_mode", "top_k", "result_cache", "marginals")
+
+ENGINES = ("python", "vectorized", "codon", "astar")
+CODING_MODES = ("full", "synonymous-only", "auto")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _codon_table(codon_usage_items):
+    return normalize_codon_usage(dict(codon_usage_items))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _automaton(unwanted_patterns, both_strands, minimize_fsm):
+    request = OptimizationRequest(sequence="", unwanted_patterns=unwanted_patterns, codon_usage=None,
+                                  both_strands=both_strands, fsm_cache=True, minimize_fsm=minimize_fsm)
+    fsm, _ = EliminationController.build_fsm(request.patterns_to_eliminate(), request)
+    return fsm
+
+
+def parse_job(job):
+    """
+    Converts a decoded JSON job into an :class:`OptimizationRequest`.
+
+    The job holds ``sequence``, ``unwanted_patterns`` (a list), the raw
+    ``codon_usage`` frequencies (codon to frequency) and optionally any of
+    ``alpha``, ``beta``, ``w``, ``optimized_codon``, ``both_strands``,
+    ``engine``, ``low_memory``, ``windowed``, ``minimize_fsm``,
+    ``coding_mode``, ``top_k``, ``result_cache`` (on unless false) and
+    ``marginals``. The
+    codon table is normalized through the cache.
+
+    Raises:
+        ValueError: If a field is missing or invalid.
+    """
+    if not isinstance(job, dict):
+        raise ValueError("The job must be a JSON object.")
+
+    sequence = job.get("sequence")
+    if not isinstance(sequence, str) or not sequence or not is_valid_dna(sequence):
+        raise ValueError("Invalid sequence.")
+
+    patterns = job.get("unwanted_patterns")
+    if not isinstance(patterns, list) or not patterns or not all(isinstance(p, str) for p in patterns) \
+            or not is_valid_patterns(patterns):
+        raise ValueError("Invalid unwanted patterns.")
+
+    codon_usage = job.get("codon_usage")
+    if not isinstance(codon_usage, dict) or not is_valid_codon_usage(codon_usage):
+        raise ValueError("Invalid codon usage table.")
+
+    unknown = set(job) - {"sequence", "unwanted_patterns", "codon_usage"} - set(_OPTIONS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}.")
+
+    options = {"result_cache": True}
+    options.update((name, job[name]) for name in _OPTIONS if name in job)
+    request = OptimizationRequest(sequence=sequence.upper().replace("U", "T"),
+                                  unwanted_patterns={p.upper().replace("U", "T") for p in patterns},
+                                  codon_usage=_codon_table(tuple(sorted(codon_usage.items()))),
+                                  **options)
+
+    if not is_valid_cost(request.alpha, request.beta, request.w):
+        raise ValueError("Invalid cost parameters.")
+    if request.engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {request.engine}.")
+    if request.coding_mode not in CODING_MODES:
+        raise ValueError(f"Unknown coding mode: {request.coding_mode}.")
+    if not is_valid_top_k(request.top_k):
+        raise ValueError("Invalid top-k value.")
+    return request
+
+
+def run_job(job):
+    """
+    Optimizes one decoded JSON job with the cached automaton of its patterns.
+
+    Returns:
+        dict: The JSON-ready :class:`OptimizationResult`; infinite costs in ``min_cost`` and
+        ``marginal_costs`` become ``None``.
+
+    Raises:
+        ValueError: If the job is invalid or its start codon cannot be validated.
+    """
+    request = parse_job(job)
+    fsm = _automaton(request.unwanted_patterns, request.both_strands, request.minimize_fsm)
+    result = asdict(optimize(request, fsm=fsm))
+    if result["min_cost"] is not None and math.isinf(result["min_cost"]):
+        result["min_cost"] = None
+    if result["marginal_costs"] is not None:
+        result["marginal_costs"] = [[None if math.isinf(cost) else cost for cost in row]
+                                    for row in result["marginal_costs"]]
+    return result
+
+
+def cache_stats():
+    """Return the hit/miss counters of the automaton and codon table caches."""
+    return {name: cache.cache_info()._asdict() for name, cache in
+            (("automata", _automaton), ("codon_tables", _codon_table))}
+
+
+class _JobHandler(BaseHTTPRequestHandler):
+    """JSON endpoints: ``POST /optimize`` runs a job, ``GET /health`` reports the caches."""
+
+    def do_GET(self):
+        if self.path != "/health":
+            self._reply(404, {"error": "Not found."})
+            return
+        self._reply(200, {"status": "ok", "jobs": self.server.jobs, "cache": self.server.stats()})
+
+    def do_POST(self):
+        if self.path != "/optimize":
+            self._reply(404, {"error": "Not found."})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            job = json.loads(self.rfile.read(length) or b"null")
+            result = self.server.submit(job)
+        except (ValueError, json.JSONDecodeError) as e:
+            self._reply(400, {"error": str(e)})
+            return
+        except Exception as e:
+            self._reply(500, {"error": str(e)})
+            return
+        self._reply(200, result)
+
+    def _reply(self, status, body):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def address_string(self):
+        # Unix-socket peers have no host address
+        return self.client_address[0] if self.client_address else "local"
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _ServiceMixin:
+    """Runs the jobs of the server inline (``jobs == 1``) or on a process pool with its own caches."""
+
+    daemon_threads = True
+
+    def _init_service(self, jobs):
+        self.jobs = jobs
+        self.pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+
+    def submit(self, job):
+        if self.pool is None:
+            return run_job(job)
+        return self.pool.submit(run_job, job).result()
+
+    def stats(self):
+        if self.pool is None:
+            return cache_stats()
+        return self.pool.submit(cache_stats).result()
+
+    def server_close(self):
+        super().server_close()
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+
+class OptimizationServer(_ServiceMixin, ThreadingHTTPServer):
+    """Local HTTP JSON optimization service on a TCP address."""
+
+    def __init__(self, address, jobs=1):
+        super().__init__(address, _JobHandler)
+        self._init_service(jobs)
+
+
+class UnixOptimizationServer(_ServiceMixin, socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Local HTTP JSON optimization service on a Unix socket."""
+
+    def __init__(self, path, jobs=1):
+        """
+        Binds the socket at ``path``, replacing the stale socket of a previous server.
+
+        Raises:
+            FileExistsError: If ``path`` exists and is not a socket.
+        """
+        if _is_socket(path):
+            os.unlink(path)
+        elif os.path.lexists(path):
+            raise FileExistsError(f"{path} exists and is not a socket.")
+        super().__init__(path, _JobHandler)
+        self._init_service(jobs)
+
+    def server_close(self):
+        super().server_close()
+        if _is_socket(self.server_address):
+            os.unlink(self.server_address)
+
+
+def _is_socket(path):
+    """Return whether ``path`` is a socket, without following a symbolic link."""
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except FileNotFoundError:
+        return False
@@ -0,0 +1,57 @@
+import http.client
+import json
+import socket
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix socket."""
+
+    def __init__(self, path, timeout=None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def request_service(method, path, body=None, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, timeout=None):
+    """
+    Sends one JSON request to a running ``biosynth serve`` service.
+
+    Args:
+        method (str): ``GET`` or ``POST``.
+        path (str): The endpoint, ``/optimize`` or ``/health``.
+        body (dict): The JSON body of a ``POST``.
+        host (str), port (int): The TCP address of the service.
+        socket_path (str): The Unix socket of the service; takes precedence over ``host``/``port``.
+        timeout (float): Socket timeout in seconds, or ``None`` to wait for the job.
+
+    Returns:
+        dict: The decoded JSON response.
+
+    Raises:
+        ValueError: If the service rejects the request.
+        OSError: If the service cannot be reached.
+    """
+    if socket_path:
+        connection = _UnixHTTPConnection(socket_path, timeout=timeout)
+    else:
+        connection = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    try:
+        payload = None if body is None else json.dumps(body)
+        connection.request(method, path, body=payload, headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        reply = json.loads(response.read() or b"{}")
+    finally:
+        connection.close()
+
+    if response.status != 200:
+        raise ValueError(reply.get("error", f"The service answered with status {response.status}."))
+    return reply
@@ -5,7 +5,7 @@ from pathlib import Path
 import jinja2
 
 # Application-specific data and utilities
-from biosynth.data.app_data import InputData, EliminationData, OutputData
+from biosynth.data.app_data import InputData, CostData, EliminationData, OutputData
 from biosynth.executions.controllers.ui.theme import HEADINGS
 from biosynth.utils.display_utils import SequenceUtils
 from biosynth.utils.coding_region import CodingRegionLocator
@@ -50,7 +50,9 @@ class ReportBuilder:
     """Builds the final HTML report from app data and writes/exports it to disk."""
 
     # Controller responsible for constructing and saving the final HTML report
-    def __init__(self):
+    def __init__(self, costs=CostData):
+        # Cost parameters shown in the descriptions (CostData or an OptimizationRequest)
+        self.costs = costs
         self.input_seq = InputData.cleaned_dna_sequence
 
         # Save input DNA sequence and visually highlight coding regions
@@ -78,6 +80,7 @@ class ReportBuilder:
         self.coding_idx = "" if InputData.coding_indexes is None else f"{InputData.coding_indexes[0] + 1} - {InputData.coding_indexes[1]}"
         self.cost_contribution = EliminationData.cost_contribution
         self.cost_substitution = EliminationData.cost_substitution
+        self.alternatives = EliminationData.alternatives or []
 
         # These are generated during report creation
         self.output_text = None
@@ -117,8 +120,8 @@ class ReportBuilder:
             'highlight_input': self.highlight_input,
             'coding_idx': self.coding_idx,
             'elimination_process_description': convert_to_html_list(get_elimination_process_description()),
-            'coding_region_cost_description': convert_to_html_list(get_coding_region_cost_description()),
-            'non_coding_region_cost_description': convert_to_html_list(get_non_coding_region_cost_description()),
+            'coding_region_cost_description': convert_to_html_list(get_coding_region_cost_description(self.costs)),
+            'non_coding_region_cost_description': convert_to_html_list(get_non_coding_region_cost_description(self.costs)),
             'cost': self.min_cost,
             'index_seq_str': self.index_seq_str,
             'marked_input_seq': self.marked_input_seq,
@@ -126,6 +129,7 @@ class ReportBuilder:
             'optimized_seq': self.optimized_seq,
             'cost_contribution': self.cost_contribution,
             'cost_substitution': self.cost_substitution,
+            'alternatives': self.alternatives,
             'execution_mode' : get_execution_mode(),
             'highlight_optimized_selected': self.highlight_optimized_selected,
             'headings': HEADINGS,
@@ -0,0 +1,19 @@
+import random
+
+from biosynth.utils.cost_utils import normalize_codon_usage
+
+
+def random_codon_usage(seed=7):
+    """Normalized codon usage with random, reproducible frequencies for every codon."""
+    bases = "ACGT"
+    rng = random.Random(seed)
+    raw = {a + b + c: rng.uniform(0.05, 1.0) for a in bases for b in bases for c in bases}
+    return normalize_codon_usage(raw)
+
+
+def codon_phases(n, start, codons):
+    """Codon phases of a sequence of length ``n`` with ``codons`` codons from ``start``, the first one a start codon."""
+    positions = [0] * n
+    for k in range(3 * codons):
+        positions[start + k] = -3 if k == 2 else k % 3 + 1
+    return positions
@@ -0,0 +1,131 @@
+import random
+import unittest
+
+import numpy as np
+
+from biosynth.algorithm.astar import charge_columns, change_penalties, remaining_cost_bounds, eliminate_astar
+from biosynth.algorithm.eliminate_sequence import EliminationController
+from biosynth.algorithm.fsm import FSM
+from biosynth.algorithm.vectorized_dp import PredecessorGraph, eliminate_vectorized
+from biosynth.data.optimization import OptimizationRequest
+from biosynth.utils.cost_utils import EliminationScorerConfig, with_reverse_complements
+from biosynth.utils.pattern_scanner import PatternScanner
+from biosynth.utils.text_utils import OutputFormat, set_output_format
+from biosynth.tests.helpers import codon_phases, random_codon_usage
+
+
+def _costs_to_go(fsm, cost_table):
+    """Exact cheapest cost of the columns after ``i`` from the cheapest state of column ``i``, by a backward fill."""
+    graph = PredecessorGraph(fsm)
+    n = len(cost_table)
+    column = np.zeros(len(graph.states))
+    costs_to_go = [0.0] * (n + 1)
+    for i in range(n, 2, -1):
+        candidates = cost_table.column(i)[graph.edge_key] + column[graph.dst]
+        column = np.full(len(graph.states), np.inf)
+        np.minimum.at(column, graph.src, candidates)
+        costs_to_go[i - 1] = float(column.min())
+    return costs_to_go
+
+
+class TestRemainingCostBounds(unittest.TestCase):
+    def setUp(self):
+        self.codon_usage = random_codon_usage()
+
+    def test_charge_columns(self):
+        cost_table = EliminationScorerConfig.cost_table("CCATGAAATAGCC", codon_phases(13, 2, 3), self.codon_usage,
+                                                        1.0, 2.0, 5.0, False)
+        self.assertEqual(charge_columns(cost_table).tolist(), [1, 2, 5, 5, 5, 8, 8, 8, 11, 11, 11, 12, 13])
+
+    def test_non_coding_changes_cost_the_cheapest_substitution(self):
+        cost_table = EliminationScorerConfig.cost_table("ACGTACGT", [0] * 8, self.codon_usage, 1.0, 2.0, 5.0, False)
+        self.assertEqual(change_penalties(cost_table).tolist(), [1.0] * 8)
+
+    def test_codon_penalties_depend_on_the_changed_base(self):
+        # Leucine CTT has synonymous codons differing at the first and at the third base, but not at the second
+        cost_table = EliminationScorerConfig.cost_table("ATGCTT", codon_phases(6, 0, 2), self.codon_usage,
+                                                        1.0, 2.0, 5.0, False)
+        penalties = change_penalties(cost_table)
+
+        self.assertLess(penalties[5], 1.0)
+        self.assertLess(penalties[3], 1.0)
+        self.assertGreaterEqual(penalties[4], 5.0)
+
+    def test_bounds_never_exceed_the_remaining_cost(self):
+        rng = random.Random(3)
+        for _ in range(40):
+            n = rng.randint(8, 40)
+            sequence = "".join(rng.choice("ACGT") for _ in range(n))
+            start = rng.randint(0, 4)
+            coding_positions = codon_phases(n, start, rng.randint(0, (n - start) // 3))
+            patterns = {"".join(rng.choice("ACGT") for _ in range(rng.randint(3, 5))) for _ in range(4)}
+            cost_table = EliminationScorerConfig.cost_table(sequence, coding_positions, self.codon_usage,
+                                                            1.0, 2.0, 5.0, rng.random() < 0.5)
+            bounds = remaining_cost_bounds(sequence, patterns, cost_table)
+            costs_to_go = _costs_to_go(FSM(patterns, {"A", "C", "G", "T"}), cost_table)
+            for i in range(2, n + 1):
+                self.assertLessEqual(bounds[i], costs_to_go[i] + 1e-9)
+
+
+class TestAStarEngine(unittest.TestCase):
+    def setUp(self):
+        set_output_format(OutputFormat.TEST)
+        self.codon_usage = random_codon_usage()
+
+    def assertSameCost(self, sequence, patterns, coding_positions, w=5.0, optimized_codon=False):
+        fsm = FSM(patterns, {"A", "C", "G", "T"})
+        cost_table = EliminationScorerConfig.cost_table(sequence, coding_positions, self.codon_usage,
+                                                        1.0, 2.0, w, optimized_codon)
+        for table in (cost_table, cost_table.synonymous_only()):
+            expected_cost, _ = eliminate_vectorized(sequence, fsm, table)
+            actual_cost, actual_seq = eliminate_astar(sequence, fsm, table)
+
+            self.assertAlmostEqual(actual_cost, expected_cost)
+            if expected_cost != float("inf"):
+                self.assertEqual(len(actual_seq), len(sequence))
+                self.assertFalse(PatternScanner.for_patterns(patterns).contains_any(actual_seq))
+                self.assertAlmostEqual(table.path_cost(actual_seq), actual_cost)
+
+    def test_matches_vectorized_engine_coding(self):
+        sequence = "AAATGCTTACGTAGCCATTAAGG"
+        for optimized_codon in (False, True):
+            self.assertSameCost(sequence, {"CGT", "GCC"}, codon_phases(23, 2, 6), optimized_codon=optimized_codon)
+
+    def test_matches_vectorized_engine_on_random_inputs(self):
+        rng = random.Random(2025)
+        for _ in range(60):
+            n = rng.randint(5, 60)
+            sequence = "".join(rng.choice("ACGT") for _ in range(n))
+            start = rng.randint(0, 5)
+            coding_positions = codon_phases(n, start, rng.randint(0, max(0, (n - start) // 3)))
+            patterns = {"".join(rng.choice("ACGT") for _ in range(rng.randint(3, 5))) for _ in range(3)}
+            self.assertSameCost(sequence, patterns, coding_positions, w=rng.choice((0.5, 100.0)),
+                                optimized_codon=rng.random() < 0.5)
+
+    def test_no_valid_sequence(self):
+        patterns = {a + b + c for a in "ACGT" for b in "ACGT" for c in "ACGT"}
+        cost_table = EliminationScorerConfig.cost_table("ATGAAA", codon_phases(6, 0, 2), self.codon_usage,
+                                                        1.0, 2.0, 5.0, False)
+        self.assertEqual(eliminate_astar("ATGAAA", FSM(patterns, {"A", "C", "G", "T"}), cost_table),
+                         (float("inf"), None))
+
+    def test_near_clean_sequences_expand_few_cells(self):
+        rng = random.Random(9)
+        n = 3000
+        sequence = "".join(rng.choice("ACGT") for _ in range(n))
+        fsm = FSM(with_reverse_complements({"GAATTC", "GGATCC", "AAGCTT", "TTTTT"}), {"A", "C", "G", "T"})
+        cost_table = EliminationScorerConfig.cost_table(sequence, codon_phases(n, 100, 900), self.codon_usage,
+                                                        1.0, 2.0, 100.0, False)
+        stats = {}
+        cost, _ = eliminate_astar(sequence, fsm, cost_table, stats=stats)
+
+        self.assertAlmostEqual(cost, eliminate_vectorized(sequence, fsm, cost_table)[0])
+        self.assertLess(stats["expanded_cells"], 0.1 * stats["lattice_cells"])
+
+    def test_expanded_cells_are_reported(self):
+        request = OptimizationRequest(sequence="TTAGTACAATGCTTACGTAGTAAGG", unwanted_patterns={"TAGTAC", "CGT"},
+                                      codon_usage=self.codon_usage, engine="astar")
+        info, *_, min_cost = EliminationController.eliminate(request.sequence, request.unwanted_patterns, [0] * 25,
+                                                             request=request)
+        self.assertRegex(info, r"A\* search: [\d,]+ of [\d,]+ lattice cells")
+        self.assertEqual(min_cost, 2.0)
@@ -0,0 +1,32 @@
+import unittest
+
+import numpy as np
+
+from biosynth.algorithm.backpointers import BackpointerTable
+
+
+class TestBackpointerTable(unittest.TestCase):
+    def test_dtype_grows_with_state_count(self):
+        self.assertEqual(BackpointerTable(10, 16).table.dtype, np.uint8)
+        self.assertEqual(BackpointerTable(10, 300).table.dtype, np.uint16)
+        self.assertEqual(BackpointerTable(10, 20000).table.dtype, np.uint32)
+
+    def test_one_row_per_column_from_three(self):
+        back = BackpointerTable(12, 22)
+        self.assertEqual(back.table.shape, (10, 22))
+        self.assertTrue((back.table == back.none).all())
+
+    def test_trace_follows_packed_codes(self):
+        # States 0..2, alphabet "ACGT"; path 1 -(G)-> 2 -(T)-> 0 over columns 3 and 4.
+        back = BackpointerTable(4, 3)
+        back.set_column(3, [back.none, back.none, BackpointerTable.encode(1, 2)])
+        back.set_column(4, [BackpointerTable.encode(2, 3), back.none, back.none])
+
+        state, symbols = back.trace(0, "ACGT")
+        self.assertEqual(state, 1)
+        self.assertEqual(symbols, ["G", "T"])
+
+    def test_trace_without_predecessor_raises(self):
+        back = BackpointerTable(3, 2)
+        with self.assertRaises(ValueError):
+            back.trace(0, "ACGT")
@@ -0,0 +1,114 @@
+"""Tests for biosynth.executions.controllers.batch_controller."""
+
+import csv
+import os
+import tempfile
+import unittest
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from biosynth.data import app_data
+from biosynth.executions.controllers import batch_controller
+from biosynth.executions.controllers.batch_controller import BatchController
+from biosynth.utils.cost_utils import normalize_codon_usage
+from biosynth.utils.text_utils import OutputFormat, set_output_format
+
+FASTA = """>orf1 forced substitution
+ATAGTAC
+>orf2 nothing to remove
+AAAAAA
+>orf3
+ATGXAA
+>orf4 coded
+AAA*ATGTAGTACTAA
+"""
+
+
+def _seed_inputs():
+    app_data.InputData.unwanted_patterns = {"TAGTAC"}
+    app_data.InputData.both_strands = False
+
+    bases = "ACGT"
+    raw = {a + b + c: 0.5 for a in bases for b in bases for c in bases}
+    app_data.CostData.codon_usage = normalize_codon_usage(raw)
+    app_data.CostData.alpha = 1.0
+    app_data.CostData.beta = 2.0
+    app_data.CostData.w = 100.0
+    app_data.CostData.optimized_codon = False
+
+
+def _read_rows(path):
+    with open(path, encoding="utf-8") as fh:
+        return list(csv.DictReader(fh, delimiter="\t"))
+
+
+class TestBatchController(unittest.TestCase):
+    def setUp(self):
+        set_output_format(OutputFormat.TERMINAL)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.fasta = os.path.join(self.tmp.name, "orfs.fasta")
+        with open(self.fasta, "w", encoding="utf-8") as fh:
+            fh.write(FASTA)
+        _seed_inputs()
+        self._patch_output = patch("biosynth.data.app_data.OutputData.output_path", new=self.tmp.name)
+        self._patch_output.start()
+        self.addCleanup(self._patch_output.stop)
+        self._patch_stdout = patch("sys.stdout", StringIO())
+        self._patch_stdout.start()
+        self.addCleanup(self._patch_stdout.stop)
+
+    def test_writes_one_row_per_record(self):
+        rows = _read_rows(BatchController(self.fasta, jobs=1).run())
+
+        self.assertEqual([row["Record"] for row in rows], ["orf1", "orf2", "orf3", "orf4"])
+        self.assertEqual([row["Status"] for row in rows], ["optimized", "unchanged", "invalid sequence", "optimized"])
+        self.assertNotIn("TAGTAC", rows[0]["Optimized_Sequence"])
+        self.assertEqual(rows[1]["Optimized_Sequence"], "AAAAAA")
+        self.assertEqual(rows[1]["Cost"], "0")
+        self.assertNotIn("TAGTAC", rows[3]["Optimized_Sequence"])
+
+    def test_process_pool_matches_serial_run(self):
+        serial = _read_rows(BatchController(self.fasta, jobs=1).run())
+        pooled = _read_rows(BatchController(self.fasta, jobs=2).run())
+        self.assertEqual(pooled, serial)
+
+    def test_per_record_reports(self):
+        BatchController(self.fasta, jobs=1, reports=True).run()
+        names = os.listdir(Path(self.tmp.name) / "BioSynth-Outputs")
+        reports = [n for n in names if n.startswith("BioSynth-Report_")]
+        self.assertEqual(len(reports), 3)
+        self.assertTrue(any(n.endswith("_orf1.html") for n in reports))
+
+    def test_failing_record_does_not_stop_the_batch(self):
+        real_optimize = batch_controller.optimize
+
+        def optimize(request, **kwargs):
+            if request.sequence == "AAAAAA":
+                raise RuntimeError("out of\tmemory")
+            if request.sequence == "ATAGTAC":
+                raise ValueError("bad backpointer")
+            return real_optimize(request, **kwargs)
+
+        with patch.object(batch_controller, "optimize", side_effect=optimize):
+            rows = _read_rows(BatchController(self.fasta, jobs=1).run())
+
+        self.assertEqual([row["Status"] for row in rows],
+                         ["optimization failed: bad backpointer", "optimization failed: out of memory",
+                          "invalid sequence", "optimized"])
+
+    def test_start_codon_errors_are_labelled(self):
+        with open(self.fasta, "w", encoding="utf-8") as fh:
+            fh.write(">orf1\nAAA*CCCAAA\n>orf2\nAAAAAA\n")
+        rows = _read_rows(BatchController(self.fasta, jobs=1).run())
+
+        self.assertTrue(rows[0]["Status"].startswith("start codon validation failed: "))
+        self.assertEqual(rows[1]["Status"], "unchanged")
+
+    def test_result_cache_is_not_used(self):
+        cache_dir = os.path.join(self.tmp.name, "cache")
+        with patch.dict(os.environ, {"BIOSYNTH_CACHE_DIR": cache_dir}), \
+                patch("biosynth.data.app_data.EngineData.result_cache", new=True):
+            BatchController(self.fasta, jobs=1).run()
+        self.assertFalse(os.path.exists(os.path.join(cache_dir, "results")))
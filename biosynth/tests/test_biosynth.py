@@ -0,0 +1,56 @@
+"""Startup benchmark for the command-line entry point in biosynth.BioSynth."""
+
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+# Cold-start budget for importing the entry point and the CLI controller. The
+# default is generous since timings depend on the machine and its load; a
+# dedicated benchmark runner can tighten it with BIOSYNTH_STARTUP_BUDGET_MS.
+STARTUP_BUDGET_MS = float(os.environ.get("BIOSYNTH_STARTUP_BUDGET_MS", 2000))
+
+_GUI_AND_REPORT_PACKAGES = ("PyQt5", "webview", "jinja2")
+
+_CLI_IMPORTS = """
+import sys
+import biosynth.BioSynth
+import biosynth.executions.controllers.cli_controller
+print(" ".join(sorted({name.split(".")[0] for name in sys.modules})))
+"""
+
+
+def _import_cli():
+    """Imports the CLI path in a fresh interpreter; returns its top-level modules and the ``-X importtime`` log."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CLI_IMPORTS],
+        cwd=Path(__file__).resolve().parents[2], capture_output=True, text=True, check=True,
+    )
+    return set(completed.stdout.split()), completed.stderr
+
+
+def _cumulative_us(importtime_log, module):
+    """Returns the cumulative import time of ``module`` in microseconds from an ``-X importtime`` log."""
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise AssertionError(f"{module} missing from the import-time log")
+
+
+class TestCLIStartup(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.modules, cls.importtime_log = _import_cli()
+
+    def test_cli_does_not_load_gui_or_report_dependencies(self):
+        self.assertFalse(self.modules & set(_GUI_AND_REPORT_PACKAGES))
+
+    def test_cli_cold_start_within_budget(self):
+        budget_ms = STARTUP_BUDGET_MS
+        elapsed_ms = (_cumulative_us(self.importtime_log, "biosynth.BioSynth")
+                      + _cumulative_us(self.importtime_log, "biosynth.executions.controllers.cli_controller")) / 1000
+        self.assertLess(elapsed_ms, budget_ms, f"CLI cold start took {elapsed_ms:.0f} ms (budget {budget_ms:.0f} ms)")
@@ -57,6 +57,7 @@ class TestCLIController(unittest.TestCase):
             "biosynth.executions.controllers.cli_controller.CommandController"
         )
         self.MockCommand = self._patch_command.start()
+        self.addCleanup(app_data.EngineData.reset)
 
     def tearDown(self):
         self._patch_command.stop()
@@ -88,6 +89,72 @@ class TestCLIController(unittest.TestCase):
         self.assertEqual(app_data.CostData.w, 200.0)
         self.assertFalse(app_data.CostData.optimized_codon)
 
+    def test_engine_options_plumbed_through(self):
+        with _Fixtures() as f:
+            argv = ["-s", f.seq, "-p", f.pat, "-c", f.cod, "--engine", "vectorized", "--low-memory",
+                    "--windowed", "--minimize-fsm", "--coding-mode", "auto", "--top-k", "3"]
+            CLIController(argv).execute()
+        self.assertEqual(app_data.EngineData.engine, "vectorized")
+        self.assertEqual(app_data.EngineData.coding_mode, "auto")
+        self.assertEqual(app_data.EngineData.top_k, 3)
+        self.assertTrue(app_data.EngineData.low_memory)
+        self.assertTrue(app_data.EngineData.windowed)
+        self.assertTrue(app_data.EngineData.fsm_cache)
+        self.assertTrue(app_data.EngineData.minimize_fsm)
+
+    def test_fsm_cache_can_be_disabled(self):
+        with _Fixtures() as f:
+            CLIController(["-s", f.seq, "-p", f.pat, "-c", f.cod, "--no-fsm-cache"]).execute()
+        self.assertFalse(app_data.EngineData.fsm_cache)
+        self.assertTrue(app_data.EngineData.result_cache)
+
+    def test_result_cache_can_be_disabled(self):
+        with _Fixtures() as f:
+            CLIController(["-s", f.seq, "-p", f.pat, "-c", f.cod, "--no-cache"]).execute()
+        self.assertFalse(app_data.EngineData.result_cache)
+
+    def test_both_strands_plumbed_through(self):
+        self.addCleanup(setattr, app_data.InputData, "both_strands", False)
+        with _Fixtures() as f:
+            CLIController(["-s", f.seq, "-p", f.pat, "-c", f.cod, "--both-strands"]).execute()
+        self.assertTrue(app_data.InputData.both_strands)
+
+    def test_batch_dispatches_to_batch_controller(self):
+        with _Fixtures() as f, patch(
+            "biosynth.executions.controllers.batch_controller.BatchController"
+        ) as MockBatch:
+            CLIController(["--batch", f.seq, "-p", f.pat, "-c", f.cod, "-j", "3", "--batch-reports"]).execute()
+        MockBatch.assert_called_once_with(f.seq, 3, True)
+        MockBatch.return_value.run.assert_called_once()
+        self.MockCommand.assert_not_called()
+
+    def test_sweep_dispatches_to_sweep_controller(self):
+        with _Fixtures() as f, patch(
+            "biosynth.executions.controllers.sweep_controller.SweepController"
+        ) as MockSweep:
+            CLIController(["-s", f.seq, "-p", f.pat, "-c", f.cod, "--sweep", "alpha=1,1.5;optimized_codon=no"]).execute()
+        MockSweep.assert_called_once_with([{"alpha": 1.0, "optimized_codon": False},
+                                           {"alpha": 1.5, "optimized_codon": False}])
+        MockSweep.return_value.run.assert_called_once()
+        self.MockCommand.assert_not_called()
+
+    def test_invalid_sweep_cost_exits(self):
+        with _Fixtures() as f, patch(
+            "biosynth.executions.controllers.sweep_controller.SweepController"
+        ) as MockSweep:
+            # alpha < beta violated by the second setting.
+            with self.assertRaises(SystemExit) as cm:
+                CLIController(["-s", f.seq, "-p", f.pat, "-c", f.cod, "--sweep", "alpha=1,3"]).execute()
+            self.assertEqual(cm.exception.code, 2)
+        MockSweep.assert_not_called()
+
+    def test_invalid_top_k_exits(self):
+        with _Fixtures() as f:
+            with self.assertRaises(SystemExit) as cm:
+                CLIController(["-s", f.seq, "-p", f.pat, "-c", f.cod, "--top-k", "0"]).execute()
+            self.assertEqual(cm.exception.code, 2)
+        self.MockCommand.assert_not_called()
+
     def test_invalid_input_exits(self):
         with _Fixtures() as f:
             # Overwrite sequence with invalid characters.
@@ -0,0 +1,97 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from biosynth.algorithm.codon_dp import CodonGraph, plan_strides, eliminate_codon_stride
+from biosynth.algorithm.fsm import FSM, FORBIDDEN
+from biosynth.algorithm.vectorized_dp import eliminate_vectorized
+from biosynth.utils.cost_utils import EliminationScorerConfig, CODONS
+from biosynth.utils.pattern_scanner import PatternScanner
+from biosynth.tests.helpers import codon_phases, random_codon_usage
+
+
+class TestCodonGraph(unittest.TestCase):
+    def test_codon_transitions_compose_three_base_transitions(self):
+        fsm = FSM({"ATATCA", "TAGTAC"}, {"A", "C", "G", "T"})
+        graph = CodonGraph(fsm)
+
+        for u_id, u in enumerate(graph.states):
+            for c, codon in enumerate(CODONS):
+                state = u
+                for base in codon:
+                    state = fsm.f[(state, base)] if state is not None else None
+                expected = FORBIDDEN if state is None else graph.states.index(state)
+                self.assertEqual(graph.codon_dst[u_id, c], expected)
+
+    def test_plan_steps_over_whole_codons(self):
+        sequence = "CCATGAAATAGCC"
+        cost_table = EliminationScorerConfig.cost_table(sequence, codon_phases(13, 2, 3), random_codon_usage(),
+                                                        1.0, 2.0, 5.0, False)
+        self.assertEqual(plan_strides(cost_table), [(3, 5), (3, 8), (3, 11), (1, 12), (1, 13)])
+
+    def test_plan_steps_base_by_base_over_the_seeded_columns(self):
+        sequence = "ATGAAATAG"
+        cost_table = EliminationScorerConfig.cost_table(sequence, codon_phases(9, 0, 3), random_codon_usage(),
+                                                        1.0, 2.0, 5.0, False)
+        self.assertEqual(plan_strides(cost_table), [(1, 3), (3, 6), (3, 9)])
+
+
+class TestCodonStrideEngine(unittest.TestCase):
+    def setUp(self):
+        self.codon_usage = random_codon_usage()
+
+    def assertSameCost(self, sequence, patterns, coding_positions, w=5.0, optimized_codon=False):
+        fsm = FSM(patterns, {"A", "C", "G", "T"})
+        cost_table = EliminationScorerConfig.cost_table(sequence, coding_positions, self.codon_usage,
+                                                        1.0, 2.0, w, optimized_codon)
+        expected_cost, _ = eliminate_vectorized(sequence, fsm, cost_table)
+        actual_cost, actual_seq = eliminate_codon_stride(sequence, fsm, cost_table)
+
+        self.assertAlmostEqual(actual_cost, expected_cost)
+        if expected_cost != float("inf"):
+            self.assertEqual(len(actual_seq), len(sequence))
+            self.assertFalse(PatternScanner.for_patterns(patterns).contains_any(actual_seq))
+            self.assertAlmostEqual(cost_table.path_cost(actual_seq), actual_cost)
+        return actual_seq
+
+    def test_matches_vectorized_engine_coding(self):
+        sequence = "AAATGCTTACGTAGCCATTAAGG"
+        for optimized_codon in (False, True):
+            self.assertSameCost(sequence, {"CGT", "GCC"}, codon_phases(23, 2, 6), optimized_codon=optimized_codon)
+
+    def test_matches_vectorized_engine_on_random_inputs(self):
+        rng = random.Random(2024)
+        for _ in range(40):
+            n = rng.randint(10, 60)
+            sequence = "".join(rng.choice("ACGT") for _ in range(n))
+            start = rng.randint(0, 5)
+            coding_positions = codon_phases(n, start, rng.randint(0, (n - start) // 3))
+            patterns = {"".join(rng.choice("ACGT") for _ in range(rng.randint(3, 5))) for _ in range(3)}
+            self.assertSameCost(sequence, patterns, coding_positions, w=rng.choice((0.5, 100.0)),
+                                optimized_codon=rng.random() < 0.5)
+
+    def test_ties_keep_the_original_codon(self):
+        # With a flat codon usage CTA is as cheap as TTA and reaches the same state; TTA is kept
+        usage = {codon: 0.0 for codon in CODONS}
+        sequence = "ATGTTAAAATAA"
+        cost_table = EliminationScorerConfig.cost_table(sequence, codon_phases(12, 0, 4), usage, 1.0, 2.0, 5.0, False)
+        cost, optimized_seq = eliminate_codon_stride(sequence, FSM({"GGGGG"}, {"A", "C", "G", "T"}), cost_table)
+
+        self.assertEqual((cost, optimized_seq), (0.0, sequence))
+
+    def test_no_valid_sequence(self):
+        patterns = {a + b + c for a in "ACGT" for b in "ACGT" for c in "ACGT"}
+        fsm = FSM(patterns, {"A", "C", "G", "T"})
+        cost_table = EliminationScorerConfig.cost_table("ATGAAA", codon_phases(6, 0, 2), self.codon_usage,
+                                                        1.0, 2.0, 5.0, False)
+        self.assertEqual(eliminate_codon_stride("ATGAAA", fsm, cost_table), (float("inf"), None))
+
+    def test_large_automata_step_over_few_candidates_only(self):
+        cost_table = EliminationScorerConfig.cost_table("CCATGAAATAGCC", codon_phases(13, 2, 3), self.codon_usage,
+                                                        1.0, 2.0, 5.0, False)
+        with patch("biosynth.algorithm.codon_dp.MAX_CODON_STRIDE_STATES", new=0):
+            # The start codon and the stop codon TAG have few candidates; AAA has dozens unless restricted
+            self.assertEqual(plan_strides(cost_table, 1),
+                             [(3, 5), (1, 6), (1, 7), (1, 8), (3, 11), (1, 12), (1, 13)])
+            self.assertEqual(plan_strides(cost_table.synonymous_only(), 1),
+                             [(3, 5), (3, 8), (3, 11), (1, 12), (1, 13)])
@@ -1,5 +1,6 @@
 """Tests for biosynth.executions.controllers.command_controller."""
 
+import json
 import os
 import tempfile
 import unittest
@@ -63,6 +64,23 @@ class TestCommandController(unittest.TestCase):
             self.assertTrue(any(n.startswith("Cost-Contribution_") for n in names))
             self.assertTrue(any(n.startswith("Cost-Substitution_") for n in names))
 
+    def test_writes_alternatives_as_fasta_and_json(self):
+        self.addCleanup(app_data.EngineData.reset)
+        app_data.EngineData.top_k = 3
+        with tempfile.TemporaryDirectory() as tmp:
+            app_data.OutputData.output_path = Path(tmp)
+            CommandController().run()
+            outputs_dir = Path(tmp) / "BioSynth-Outputs"
+            names = os.listdir(outputs_dir)
+            self.assertTrue(any(n.startswith("Alternative-Sequences_") and n.endswith(".fasta") for n in names))
+            json_name = next(n for n in names if n.startswith("Alternative-Sequences_") and n.endswith(".json"))
+            with open(outputs_dir / json_name, encoding="utf-8") as fh:
+                alternatives = json.load(fh)
+
+        self.assertEqual([row["Rank"] for row in alternatives], [1, 2, 3])
+        self.assertEqual(alternatives[0]["Sequence"], app_data.OutputData.optimized_sequence)
+        self.assertTrue(all(set(row) == {"Rank", "Cost", "Changed_Bases", "Sequence"} for row in alternatives))
+
     def test_exits_with_empty_sequence(self):
         app_data.InputData.dna_sequence = ""
         with self.assertRaises(SystemExit) as cm:
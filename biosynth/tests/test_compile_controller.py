@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from biosynth.algorithm import fsm_cache
+from biosynth.data.optimization import OptimizationRequest
+from biosynth.executions.controllers.compile_controller import CompilePatternsController
+from biosynth.utils.text_utils import OutputFormat, set_output_format
+
+
+class TestCompilePatternsController(unittest.TestCase):
+    def setUp(self):
+        set_output_format(OutputFormat.TERMINAL)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        for patcher in (patch.dict(os.environ, {"BIOSYNTH_CACHE_DIR": self.tmp.name}),
+                        patch("sys.stdout", StringIO())):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _pattern_file(self, text):
+        path = os.path.join(self.tmp.name, "patterns.txt")
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        return path
+
+    def test_compiles_into_cache(self):
+        path = self._pattern_file("TAGTAC\nATATCA\n")
+        CompilePatternsController([path]).execute()
+        self.assertTrue(os.path.exists(fsm_cache.cache_path({"TAGTAC", "ATATCA"}, {"A", "C", "G", "T"})))
+
+    def test_both_strands_matches_the_run_cache_key(self):
+        path = self._pattern_file("TAGTAC\nCGT\n")
+        CompilePatternsController(["--both-strands", path]).execute()
+        request = OptimizationRequest(sequence="", unwanted_patterns={"TAGTAC", "CGT"}, codon_usage={},
+                                      both_strands=True)
+        self.assertTrue(os.path.exists(fsm_cache.cache_path(request.patterns_to_eliminate(), {"A", "C", "G", "T"})))
+
+    def test_invalid_patterns_exit(self):
+        path = self._pattern_file("TAGXAC\n")
+        with self.assertRaises(SystemExit) as cm:
+            CompilePatternsController([path]).execute()
+        self.assertEqual(cm.exception.code, 2)
@@ -2,8 +2,10 @@ import unittest
 from unittest.mock import patch
 
 import numpy as np
+from biosynth.utils.amino_acid_utils import AminoAcidConfig
 
-from biosynth.utils.cost_utils import normalize_codon_usage, calculate_cost
+from biosynth.utils.cost_utils import (normalize_codon_usage, calculate_cost, CostTable, BASES, BIGRAMS,
+                                       reverse_complement, with_reverse_complements)
 
 
 class TestCalculateCost(unittest.TestCase):
@@ -174,4 +176,71 @@ class TestNormalizeAndEdgeCases(unittest.TestCase):
                 i=0, v="AT", sigma="G",
                 alpha=1.0, beta=2.0, w=100.0,
                 optimized_codon=False,
-            )
\ No newline at end of file
+            )
+
+class TestReverseComplement(unittest.TestCase):
+    def test_reverse_complement(self):
+        self.assertEqual(reverse_complement("AAGCT"), "AGCTT")
+        self.assertEqual(reverse_complement("NCCRGY"), "RCYGGN")
+
+    def test_palindromes_appear_once(self):
+        self.assertEqual(with_reverse_complements({"GAATTC", "TTAGG"}), {"GAATTC", "TTAGG", "CCTAA"})
+
+
+class TestCostTable(unittest.TestCase):
+    def setUp(self):
+        bases = "ACGT"
+        raw = {a + b + c: (ord(a) * 7 + ord(b) * 3 + ord(c)) % 13 + 1.0 for a in bases for b in bases for c in bases}
+        self.codon_usage = normalize_codon_usage(raw)
+        self.sequence = "GAATGCTTACGTAGCCATTAACC"
+        self.coding_positions = [0, 0] + [-3 if k == 2 else (k % 3) + 1 for k in range(18)] + [0, 0, 0]
+
+    def test_matches_calculate_cost_everywhere(self):
+        for optimized_codon in (False, True):
+            table = CostTable.build(self.sequence, self.coding_positions, self.codon_usage, 1.0, 2.0, 100.0,
+                                    optimized_codon).dense()
+            for i in range(2, len(self.sequence)):
+                for b, bigram in enumerate(BIGRAMS):
+                    for s, sigma in enumerate(BASES):
+                        _, expected = calculate_cost(self.sequence, self.coding_positions, self.codon_usage, i,
+                                                     bigram, sigma, 1.0, 2.0, 100.0, optimized_codon)
+                        self.assertEqual(table[i, b, s], expected, (optimized_codon, i, bigram, sigma))
+
+    def test_initial_costs_are_non_coding(self):
+        table = CostTable.build("AC", [1, 2], self.codon_usage, 1.0, 2.0, 100.0, True)
+        np.testing.assert_array_equal(table.initial, [[0.0, 2.0, 1.0, 2.0], [2.0, 0.0, 2.0, 1.0]])
+
+    def test_distinct_rows_are_shared(self):
+        table = CostTable.build(self.sequence, self.coding_positions, self.codon_usage, 1.0, 2.0, 100.0, True)
+        self.assertEqual(table.rows.shape, (133, 64))
+        self.assertEqual(len(table), len(self.sequence))
+
+    def test_path_cost_and_window(self):
+        table = CostTable.build(self.sequence, self.coding_positions, self.codon_usage, 1.0, 2.0, 100.0, False)
+        self.assertEqual(table.path_cost(self.sequence), 0.0)
+        self.assertEqual(table.path_cost("C" + self.sequence[1:]), 2.0)
+        np.testing.assert_array_equal(table.position_minimums(), np.zeros(len(self.sequence)))
+
+        window = table.window(5, 11)
+        self.assertEqual(len(window), 6)
+        np.testing.assert_array_equal(window.initial, np.zeros((2, 4)))
+        self.assertEqual(window.path_cost(self.sequence[5:11]), 0.0)
+
+    def test_synonymous_only(self):
+        table = CostTable.build(self.sequence, self.coding_positions, self.codon_usage, 1.0, 2.0, 100.0, True)
+        restricted = table.synonymous_only().dense()
+        dense = table.dense()
+        for i, codon_pos in enumerate(self.coding_positions):
+            for b, bigram in enumerate(BIGRAMS):
+                for s, sigma in enumerate(BASES):
+                    synonymous = AminoAcidConfig.encodes_same_amino_acid(bigram + sigma, self.sequence[i - 2:i + 1])
+                    expected = dense[i, b, s] if abs(codon_pos) != 3 or synonymous else np.inf
+                    self.assertEqual(restricted[i, b, s], expected, (i, bigram, sigma))
+
+    def test_invalid_codon_usage(self):
+        with self.assertRaises(ValueError):
+            CostTable.build(self.sequence, self.coding_positions, {"TAC": -0.1}, 1.0, 2.0, 100.0, True)
+
+    def test_unexpected_codon_position(self):
+        with self.assertRaises(ValueError):
+            CostTable.build("ACGT", [0, 0, 7, 0], self.codon_usage, 1.0, 2.0, 100.0, True)
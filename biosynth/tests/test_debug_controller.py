@@ -1,8 +1,8 @@
 """Tests for biosynth.executions.controllers.debug_controller.
 
 The DebugController loads its inputs from biosynth.settings.* modules and
-runs CommandController twice (once with each value of optimized_codon).
-We patch the CommandController to keep the test fast and offline.
+runs a SweepController over both values of optimized_codon. We patch the
+SweepController to keep the test fast and offline.
 """
 
 import unittest
@@ -20,22 +20,20 @@ class TestDebugController(unittest.TestCase):
         self._stdout = StringIO()
         self._patch_stdout = patch("sys.stdout", self._stdout)
         self._patch_stdout.start()
-        self._patch_command = patch(
-            "biosynth.executions.controllers.debug_controller.CommandController"
+        self._patch_sweep = patch(
+            "biosynth.executions.controllers.debug_controller.SweepController"
         )
-        self.MockCommand = self._patch_command.start()
+        self.MockSweep = self._patch_sweep.start()
 
     def tearDown(self):
-        self._patch_command.stop()
+        self._patch_sweep.stop()
         self._patch_stdout.stop()
 
-    def test_runs_command_controller_twice_for_both_optimized_codon_modes(self):
+    def test_sweeps_both_optimized_codon_modes(self):
         DebugController.execute()
-        # Two invocations of CommandController() — once per optimized_codon value.
-        self.assertEqual(self.MockCommand.call_count, 2)
-        self.assertEqual(self.MockCommand.return_value.run.call_count, 2)
-        # After execution, optimized_codon should be left at True (the second run).
-        self.assertTrue(app_data.CostData.optimized_codon)
+        # One sweep with a setting per optimized_codon value.
+        self.MockSweep.assert_called_once_with([{"optimized_codon": False}, {"optimized_codon": True}])
+        self.MockSweep.return_value.run.assert_called_once()
         # Cost params updated to the hard-coded debug values.
         self.assertAlmostEqual(app_data.CostData.alpha, 1.02)
         self.assertAlmostEqual(app_data.CostData.beta, 1.98)
@@ -43,13 +41,13 @@ class TestDebugController(unittest.TestCase):
 
     def test_short_circuits_on_invalid_input(self):
         # If is_valid_input returns False, DebugController returns early
-        # without ever building a CommandController.
+        # without ever building a SweepController.
         with patch(
             "biosynth.executions.controllers.debug_controller.is_valid_input",
             return_value=False,
         ):
             DebugController.execute()
-        self.MockCommand.assert_not_called()
+        self.MockSweep.assert_not_called()
 
     def test_short_circuits_on_invalid_cost(self):
         with patch(
@@ -57,5 +55,5 @@ class TestDebugController(unittest.TestCase):
             return_value=False,
         ):
             DebugController.execute()
-        self.MockCommand.assert_not_called()
+        self.MockSweep.assert_not_called()
 
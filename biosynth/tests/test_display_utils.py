@@ -188,3 +188,16 @@ class TestHighlightSequenceToTerminal(unittest.TestCase):
         # Reset code present even if no bases were highlighted.
         self.assertIn("\033[0m", out)
 
+
+class TestGetPatternOccurrences(unittest.TestCase):
+    def test_forward_strand_only(self):
+        rows = SequenceUtils.get_pattern_occurrences("TTAGGCCTAA", {"TTAGG"})
+        self.assertEqual(rows, [{"Pattern": "TTAGG", "Count": 1, "Positions": ["1-5"]}])
+
+    def test_both_strands_report_the_strand(self):
+        rows = SequenceUtils.get_pattern_occurrences("TTAGGCCTAAGAATTC", {"TTAGG", "GAATTC"}, both_strands=True)
+        self.assertEqual(rows, [
+            {"Pattern": "GAATTC", "Strand": "+/-", "Count": 1, "Positions": ["11-16"]},
+            {"Pattern": "TTAGG", "Strand": "+", "Count": 1, "Positions": ["1-5"]},
+            {"Pattern": "TTAGG", "Strand": "-", "Count": 1, "Positions": ["6-10"]},
+        ])
@@ -2,6 +2,8 @@ import unittest
 from unittest.mock import patch
 
 from biosynth.algorithm.eliminate_sequence import EliminationController
+from biosynth.data.app_data import CostData
+from biosynth.utils.cost_utils import EliminationScorerConfig
 from biosynth.utils.text_utils import OutputFormat, set_output_format
 
 class TestEliminationController(unittest.TestCase):
@@ -80,6 +82,14 @@ class TestEliminationController(unittest.TestCase):
         self.assertGreater(len(new_seq), 0)
         self.assertIsInstance(cost, float)
 
+    def test_both_strands_eliminates_reverse_complements(self):
+        with patch("biosynth.data.app_data.InputData.both_strands", new=True):
+            _, _, _, new_seq, _ = EliminationController.eliminate(
+                "CCTAAGGACT", {"TTAGG"}, [0] * 10
+            )
+        self.assertNotIn("TTAGG", new_seq)
+        self.assertNotIn("CCTAA", new_seq)
+
     def test_cost_non_negative(self):
         _, _, _, _, cost = EliminationController.eliminate(
             self.target_sequence,
@@ -250,4 +260,28 @@ class TestEliminationController(unittest.TestCase):
         self.assertTrue(cost_substitution or cost_contribution)
         # The substitution cost should be finite and >= 0.
         self.assertGreaterEqual(cost, 0.0)
-        self.assertLess(cost, float("inf"))
\ No newline at end of file
+        self.assertLess(cost, float("inf"))
+    def test_changes_match_the_cost_function_along_the_path(self):
+        """The rows rebuilt from the cost table equal those of the per-position cost function."""
+        target_sequence = "CCTAGATGCTTACGTAGTAAGG"
+        coding_positions = [0] * 5 + [-3 if k == 2 else k % 3 + 1 for k in range(15)] + [0] * 2
+        optimized_seq = "CGTCGATGCTCACATAGTAACG"
+        args = (target_sequence, coding_positions, CostData.codon_usage, 1.0, 2.0, 5.0, True)
+
+        initial_cost_function, cost_function = EliminationScorerConfig.cost_function(*args)
+        expected = []
+        for i in range(1, len(optimized_seq) + 1):
+            if i > 2:
+                expected.append((i, *cost_function(i, optimized_seq[i - 3:i - 1], optimized_seq[i - 1])))
+            elif coding_positions[i - 1] == 0:
+                expected.append((i, *initial_cost_function(i, optimized_seq[i - 1])))
+        expected = [(i, original, modified, cost) for i, (original, modified), cost in expected
+                    if cost > 0 or original != modified]
+
+        cost_contribution, cost_substitution = EliminationController.describe_changes(
+            target_sequence, coding_positions, optimized_seq, EliminationScorerConfig.cost_table(*args))
+        rows = sorted(cost_contribution + cost_substitution, key=lambda row: row["Position"])
+        self.assertEqual([(row["Position"], row["Original"], row["Optimized"]) for row in rows],
+                         [(i, original, modified) for i, original, modified, _ in expected])
+        self.assertEqual([float(row["Cost"]) for row in rows],
+                         [round(cost, 3) for *_, cost in expected])
@@ -40,7 +40,10 @@ class TestIsValidPatterns(unittest.TestCase):
         self.assertTrue(eu.is_valid_patterns({"ATGC", "GGGG"}))
 
     def test_rejects_invalid_base(self):
-        self.assertFalse(eu.is_valid_patterns({"ATGN"}))
+        self.assertFalse(eu.is_valid_patterns({"ATGX"}))
+
+    def test_accepts_iupac_codes(self):
+        self.assertTrue(eu.is_valid_patterns({"NCCAGCN", "RYSWKMBDHV"}))
 
     def test_empty_set_is_valid_alphabet(self):
         self.assertTrue(eu.is_valid_patterns(set()))
@@ -129,7 +132,7 @@ class TestIsValidInput(unittest.TestCase):
 
     def test_invalid_patterns(self):
         with patch("sys.stdout", new=io.StringIO()) as fake_out:
-            result = eu.is_valid_input("ATGC", {"NNN"}, self.usage)
+            result = eu.is_valid_input("ATGC", {"XXX"}, self.usage)
             output = fake_out.getvalue()
 
         self.assertFalse(result)
@@ -8,7 +8,7 @@ from unittest.mock import patch, mock_open
 
 from biosynth.utils.file_utils import (
     read_codon_freq_file, FileDataReader,
-    SequenceReader, PatternReader, CodonUsageReader,
+    SequenceReader, PatternReader, CodonUsageReader, FastaReader,
     create_dir, delete_dir, save_file, resource_path
 )
 
@@ -94,6 +94,29 @@ class TestSequenceReader(unittest.TestCase):
         self.assertEqual(cm.exception.code, 2)
         os.remove(tmp_path)
 
+class TestFastaReader(unittest.TestCase):
+    def test_read_records_joins_wrapped_lines(self):
+        with tempfile.NamedTemporaryFile(mode='w+', delete=False) as tmp:
+            tmp.write(">orf1 first record\nACGU\nTTA\n\n>orf2\nGGG\n>empty\n")
+            tmp_path = tmp.name
+        try:
+            records = list(FastaReader(tmp_path).read_records())
+            self.assertEqual(records, [("orf1", "ACGTTTA"), ("orf2", "GGG"), ("empty", "")])
+        finally:
+            os.remove(tmp_path)
+
+    def test_sequence_before_header_is_invalid(self):
+        with tempfile.NamedTemporaryFile(mode='w+', delete=False) as tmp:
+            tmp.write("ACGT\n>orf1\nACGT\n")
+            tmp_path = tmp.name
+        try:
+            with self.assertRaises(SystemExit) as cm:
+                list(FastaReader(tmp_path).read_records())
+            self.assertEqual(cm.exception.code, 2)
+        finally:
+            os.remove(tmp_path)
+
+
 class TestPatternReader(unittest.TestCase):
     def test_read_patterns_file_not_set(self):
         reader = PatternReader(None)
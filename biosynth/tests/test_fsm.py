@@ -1,6 +1,18 @@
+import random
 import unittest
 
-from biosynth.algorithm.fsm import FSM
+from biosynth.algorithm.eliminate_sequence import EliminationController
+from biosynth.algorithm.fsm import FSM, FORBIDDEN, kmp_based_fsm_bigram
+from biosynth.algorithm.vectorized_dp import eliminate_vectorized
+from biosynth.settings.pattern_settings import P
+from biosynth.utils.cost_utils import CostTable, IUPAC_CODES, normalize_codon_usage
+
+
+def expand_iupac(pattern):
+    literals = {''}
+    for code in pattern:
+        literals = {p + b for p in literals for b in IUPAC_CODES[code]}
+    return literals
 
 
 class TestCalculateFSM(unittest.TestCase):
@@ -151,3 +163,113 @@ class TestCalculateFSM(unittest.TestCase):
         fsm = FSM(patterns, sigma)
         self.assertEqual(fsm.sigma, sigma)
         self.assertEqual(fsm.unwanted_patterns, patterns)
+
+    def test_pattern_that_is_a_prefix_of_another_is_forbidden(self):
+        # Both insertion orders, since the construction iterates over the pattern set
+        for patterns in (["AAATT", "AAATTG"], ["AAATTG", "AAATT"]):
+            states, f, _ = kmp_based_fsm_bigram(patterns, self.alphabet)
+            self.assertIsNone(f[("AAAT", "T")])
+            self.assertNotIn("AAATT", states)
+
+
+class TestCompiledFSM(unittest.TestCase):
+    def setUp(self):
+        self.fsm = FSM({'ATATCA', 'TAGTAC'}, {'A', 'C', 'G', 'T'})
+        self.compiled = self.fsm.compiled
+
+    def test_states_are_numbered_in_sorted_order(self):
+        self.assertEqual(self.compiled.states, sorted(self.fsm.V))
+        self.assertEqual(len(self.compiled), len(self.fsm.V))
+        self.assertIs(self.fsm.compiled, self.compiled)
+
+    def test_transition_table_matches_string_form(self):
+        self.assertEqual(self.compiled.transitions.shape, (len(self.fsm.V), 4))
+        for u_id, u in enumerate(self.compiled.states):
+            for s_id, s in enumerate('ACGT'):
+                v = self.fsm.f[(u, s)]
+                v_id = self.compiled.transitions[u_id, s_id]
+                if v is None:
+                    self.assertEqual(v_id, FORBIDDEN)
+                else:
+                    self.assertEqual(self.compiled.states[v_id], v)
+
+    def test_bigram_classes(self):
+        states = self.compiled.states
+        self.assertEqual(self.compiled.state_bigram[states.index('TAGTA')], 4 * 3 + 0)
+        self.assertEqual([states[v] for v in self.compiled.bigram_states],
+                         [x + y for x in 'ACGT' for y in 'ACGT'])
+
+
+class TestMinimizedFSM(unittest.TestCase):
+    def setUp(self):
+        self.fsm = FSM(P, {'A', 'C', 'G', 'T'})
+        self.minimized = self.fsm.compiled.minimized()
+
+    def test_state_count_shrinks(self):
+        self.assertLess(len(self.minimized), len(self.fsm.compiled))
+        self.assertEqual(len(self.minimized.minimized()), len(self.minimized))
+
+    def test_bigram_states_stay_distinct(self):
+        self.assertEqual([self.minimized.states[v] for v in self.minimized.bigram_states],
+                         [x + y for x in 'ACGT' for y in 'ACGT'])
+
+    def test_accepts_the_same_sequences(self):
+        def accepts(compiled, sequence):
+            state = compiled.bigram_states[4 * 'ACGT'.index(sequence[0]) + 'ACGT'.index(sequence[1])]
+            for base in sequence[2:]:
+                state = compiled.transitions[state, 'ACGT'.index(base)]
+                if state == FORBIDDEN:
+                    return False
+            return True
+
+        rng = random.Random(4)
+        patterns = sorted(P)
+        for _ in range(300):
+            sequence = ''.join(rng.choice('ACGT') for _ in range(12))
+            if rng.random() < 0.5:
+                k = rng.randrange(6)
+                sequence = sequence[:k] + rng.choice(patterns) + sequence[k:]
+            with self.subTest(sequence=sequence):
+                expected = accepts(self.fsm.compiled, sequence)
+                self.assertEqual(expected, accepts(self.minimized, sequence))
+                self.assertEqual(expected, not any(p in sequence for p in P))
+
+    def test_same_optimal_cost(self):
+        codon_usage = normalize_codon_usage({a + b + c: 0.5 for a in 'ACGT' for b in 'ACGT' for c in 'ACGT'})
+        sequence = 'ACCCAGCATTCCAGCGGTCCAGCAAACCAGCT'
+        cost_table = CostTable.build(sequence, [0] * len(sequence), codon_usage, 1.0, 2.0, 100.0, False)
+        minimized = FSM(P, {'A', 'C', 'G', 'T'}, compiled=self.minimized)
+
+        expected_cost, _ = eliminate_vectorized(sequence, self.fsm, cost_table)
+        for engine in (eliminate_vectorized, EliminationController._eliminate_python):
+            cost, new_seq = engine(sequence, minimized, cost_table)
+            self.assertEqual(cost, expected_cost)
+            self.assertFalse(any(p in new_seq for p in P))
+
+
+class TestDegenerateFSM(unittest.TestCase):
+    def test_matches_expanded_literal_patterns(self):
+        alphabet = {'A', 'C', 'G', 'T'}
+        degenerate = FSM({'NCCAGCN', 'GATNNATC'}, alphabet)
+        literal = FSM(expand_iupac('NCCAGCN') | expand_iupac('GATNNATC'), alphabet)
+        self.assertLess(len(degenerate.V), len(literal.V))
+
+        codon_usage = normalize_codon_usage({a + b + c: 0.5 for a in 'ACGT' for b in 'ACGT' for c in 'ACGT'})
+        rng = random.Random(8)
+        for _ in range(20):
+            sequence = ''.join(rng.choice('ACGT') for _ in range(10)) + 'TCCAGCGATCCATC' + \
+                ''.join(rng.choice('ACGT') for _ in range(10))
+            cost_table = CostTable.build(sequence, [0] * len(sequence), codon_usage, 1.0, 2.0, 100.0, False)
+            with self.subTest(sequence=sequence):
+                cost, new_seq = eliminate_vectorized(sequence, degenerate, cost_table)
+                self.assertEqual(cost, eliminate_vectorized(sequence, literal, cost_table)[0])
+                self.assertFalse(any(p in new_seq for p in literal.unwanted_patterns))
+
+    def test_bigram_names_and_forbidden_transitions(self):
+        fsm = FSM({'ANT'}, {'A', 'C', 'G', 'T'})
+        for x in 'ACGT':
+            for y in 'ACGT':
+                self.assertIn(x + y, fsm.V)
+        self.assertIsNone(fsm.f[('AG', 'T')])
+        self.assertIsNone(fsm.f[('AC', 'T')])
+        self.assertEqual(fsm.f[('CG', 'T')], 'GT')
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from biosynth.algorithm import fsm_cache
+from biosynth.algorithm.fsm import FSM
+
+ALPHABET = {"A", "C", "G", "T"}
+PATTERNS = {"TAGTAC", "ATATCA", "GGATCC"}
+
+
+class TestFSMCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = patch.dict(os.environ, {"BIOSYNTH_CACHE_DIR": self.tmp.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_key_depends_only_on_pattern_set(self):
+        key = fsm_cache.pattern_set_key(["ACG", "TTT", "ACG"], ALPHABET)
+        self.assertEqual(key, fsm_cache.pattern_set_key({"TTT", "ACG"}, ALPHABET))
+        self.assertNotEqual(key, fsm_cache.pattern_set_key({"TTT"}, ALPHABET))
+
+    def test_miss_stores_and_hit_loads(self):
+        path = fsm_cache.cache_path(PATTERNS, ALPHABET)
+        self.assertTrue(path.startswith(self.tmp.name))
+        self.assertFalse(os.path.exists(path))
+
+        built = fsm_cache.load_fsm(PATTERNS, ALPHABET)
+        self.assertTrue(os.path.exists(path))
+
+        with patch("biosynth.algorithm.fsm.kmp_based_fsm_bigram") as build:
+            loaded = fsm_cache.load_fsm(PATTERNS, ALPHABET)
+            build.assert_not_called()
+
+        self.assertEqual(loaded.compiled.states, built.compiled.states)
+        np.testing.assert_array_equal(loaded.compiled.transitions, built.compiled.transitions)
+        np.testing.assert_array_equal(loaded.compiled.state_bigram, built.compiled.state_bigram)
+        np.testing.assert_array_equal(loaded.compiled.bigram_states, built.compiled.bigram_states)
+        self.assertEqual(loaded.V, built.V)
+        self.assertEqual(loaded.f, {k: v for k, v in built.f.items() if k[0] in built.V})
+
+    def test_corrupt_entry_is_rebuilt(self):
+        path = fsm_cache.store_fsm(FSM(PATTERNS, ALPHABET))
+        with open(path, "wb") as fh:
+            fh.write(b"not an npz file")
+
+        fsm = fsm_cache.load_fsm(PATTERNS, ALPHABET)
+        self.assertEqual(fsm.V, FSM(PATTERNS, ALPHABET).V)
+        self.assertIsNotNone(fsm_cache.load_fsm(PATTERNS, ALPHABET).compiled)
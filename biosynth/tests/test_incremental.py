@@ -0,0 +1,108 @@
+import random
+import unittest
+
+from biosynth.algorithm.fsm import FSM
+from biosynth.algorithm.incremental import DPCheckpoints, eliminate_incremental
+from biosynth.algorithm.optimize import optimize
+from biosynth.algorithm.vectorized_dp import eliminate_vectorized
+from biosynth.data.optimization import OptimizationRequest
+from biosynth.utils.cost_utils import EliminationScorerConfig
+from biosynth.utils.text_utils import OutputFormat, set_output_format
+from biosynth.tests.helpers import random_codon_usage
+
+ALPHABET = {"A", "C", "G", "T"}
+PATTERNS = {"GAT", "CCA", "TTTT"}
+
+
+def _edit(sequence, position):
+    return sequence[:position] + ("A" if sequence[position] != "A" else "C") + sequence[position + 1:]
+
+
+class TestEliminateIncremental(unittest.TestCase):
+    def setUp(self):
+        self.codon_usage = random_codon_usage()
+
+    def _table(self, sequence, alpha=1.0):
+        return EliminationScorerConfig.cost_table(sequence, [0] * len(sequence), self.codon_usage,
+                                                  alpha, 2.0, 100.0, False)
+
+    def test_matches_the_vectorized_engine_after_edits(self):
+        rng = random.Random(3)
+        fsm = FSM(PATTERNS, ALPHABET)
+        for _ in range(40):
+            n = rng.randint(5, 300)
+            original = "".join(rng.choice("ACGT") for _ in range(n))
+            edited = original
+            for _ in range(rng.randint(0, 3)):
+                edited = _edit(edited, rng.randrange(n))
+            if rng.random() < 0.3:
+                # Truncated or extended sequences
+                edited = edited[:rng.randint(2, n)] + "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 20)))
+
+            checkpoints = DPCheckpoints(interval=rng.randint(1, 20))
+            for sequence in (original, edited, edited, original):
+                table = self._table(sequence)
+                self.assertEqual(eliminate_incremental(sequence, fsm, table, checkpoints),
+                                 eliminate_vectorized(sequence, fsm, table))
+
+    def test_resumes_before_the_first_edit(self):
+        rng = random.Random(5)
+        sequence = "".join(rng.choice("ACGT") for _ in range(2000))
+        checkpoints = DPCheckpoints()
+        eliminate_incremental(sequence, FSM(PATTERNS, ALPHABET), self._table(sequence), checkpoints)
+
+        edited = _edit(sequence, 1900)
+        stats = {}
+        result = eliminate_incremental(edited, FSM(PATTERNS, ALPHABET), self._table(edited), checkpoints, stats)
+
+        self.assertEqual(result, eliminate_vectorized(edited, FSM(PATTERNS, ALPHABET), self._table(edited)))
+        self.assertEqual(stats["dp_columns"], 1998)
+        # Column 1901 is the first one charging the edited base
+        self.assertEqual(stats["reused_columns"], 1900 // checkpoints.interval * checkpoints.interval - 2)
+
+    def test_changed_costs_or_patterns_restart(self):
+        sequence = "ACGATCCATTTTGGATCCA" * 10
+        for table, patterns in ((self._table(sequence, alpha=1.5), PATTERNS),
+                                (self._table(sequence), PATTERNS | {"GGG"})):
+            checkpoints = DPCheckpoints(interval=8)
+            eliminate_incremental(sequence, FSM(PATTERNS, ALPHABET), self._table(sequence), checkpoints)
+            stats = {}
+            eliminate_incremental(sequence, FSM(patterns, ALPHABET), table, checkpoints, stats)
+            self.assertEqual(stats["reused_columns"], 0)
+
+    def test_unchanged_sequence_reuses_every_column(self):
+        sequence = "ACGATCCATTTTGGATCCA" * 10
+        checkpoints = DPCheckpoints()
+        expected = eliminate_incremental(sequence, FSM(PATTERNS, ALPHABET), self._table(sequence), checkpoints)
+        stats = {}
+        self.assertEqual(eliminate_incremental(sequence, FSM(PATTERNS, ALPHABET), self._table(sequence), checkpoints,
+                                               stats), expected)
+        self.assertEqual(stats["reused_columns"], stats["dp_columns"])
+
+
+class TestOptimizeIncremental(unittest.TestCase):
+    def setUp(self):
+        set_output_format(OutputFormat.TEST)
+
+    def test_rerun_after_an_edit(self):
+        rng = random.Random(9)
+        coding = "".join(rng.choice("ACGT") for _ in range(600)).replace("TAA", "TAC").replace(
+            "TAG", "TAC").replace("TGA", "TGC")
+        request = OptimizationRequest(sequence="CCGATC*ATG" + coding[:597] + "TAAGGATCCA",
+                                      unwanted_patterns={"GATC", "CCAT"}, codon_usage=random_codon_usage())
+        checkpoints = DPCheckpoints()
+        optimize(request, checkpoints=checkpoints)
+
+        edited = OptimizationRequest(sequence=_edit(request.sequence, 550), unwanted_patterns=request.unwanted_patterns,
+                                     codon_usage=request.codon_usage)
+        result = optimize(edited, checkpoints=checkpoints)
+        expected = optimize(edited)
+
+        self.assertEqual(result.optimized_sequence, expected.optimized_sequence)
+        self.assertAlmostEqual(result.min_cost, expected.min_cost)
+        self.assertEqual(result.cost_contribution, expected.cost_contribution)
+        self.assertRegex(result.info, r"Incremental DP: [\d,]+ of [\d,]+ DP columns \(\d+\.\d%\) were reused")
+
+
+if __name__ == "__main__":
+    unittest.main()
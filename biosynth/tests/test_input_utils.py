@@ -1,7 +1,8 @@
+import argparse
 import unittest
 from unittest.mock import patch
 import sys
-from biosynth.utils.input_utils import ArgumentParser, VERSION
+from biosynth.utils.input_utils import ArgumentParser, VERSION, parse_sweep_grid
 
 
 class TestCommandLineParser(unittest.TestCase):
@@ -372,4 +373,25 @@ class TestCommandLineParser(unittest.TestCase):
         with self.assertRaises(SystemExit):
             self.parser.parse_args(["-h"])
         self.assertGreaterEqual(mock_help.call_count, 2)  # help text + info
-        mock_exit.assert_called_with(1)
\ No newline at end of file
+        mock_exit.assert_called_with(1)
+
+
+class TestSweepGrid(unittest.TestCase):
+    def test_expands_every_combination(self):
+        self.assertEqual(parse_sweep_grid("alpha=1,2; w=50,100"),
+                         [{"alpha": 1.0, "w": 50.0}, {"alpha": 1.0, "w": 100.0},
+                          {"alpha": 2.0, "w": 50.0}, {"alpha": 2.0, "w": 100.0}])
+
+    def test_optimized_codon_values(self):
+        self.assertEqual(parse_sweep_grid("optimized_codon=no,yes"),
+                         [{"optimized_codon": False}, {"optimized_codon": True}])
+
+    def test_invalid_grids(self):
+        for spec in ("", "gamma=1", "alpha=1;alpha=2", "alpha=x", "optimized_codon=maybe"):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                parse_sweep_grid(spec)
+
+    def test_parsed_from_the_command_line(self):
+        parser = ArgumentParser()
+        parser.parse_args(["-s", "s.txt", "-p", "p.txt", "-c", "c.txt", "--sweep", "beta=2,3"])
+        self.assertEqual(parser.options.sweep, [{"beta": 2.0}, {"beta": 3.0}])
@@ -0,0 +1,141 @@
+import itertools
+import random
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from biosynth.algorithm.fsm import FSM
+from biosynth.algorithm.incremental import DPCheckpoints, eliminate_incremental
+from biosynth.algorithm.marginals import MarginalCosts, marginal_costs
+from biosynth.algorithm.optimize import optimize
+from biosynth.algorithm.vectorized_dp import eliminate_vectorized
+from biosynth.data.optimization import OptimizationRequest
+from biosynth.utils.cost_utils import EliminationScorerConfig
+from biosynth.utils.text_utils import OutputFormat, set_output_format
+from biosynth.tests.helpers import random_codon_usage
+
+
+def _patterns(rng):
+    return {"".join(rng.choice("ACGT") for _ in range(rng.randint(3, 4))) for _ in range(3)}
+
+
+class TestMarginalCosts(unittest.TestCase):
+    def setUp(self):
+        self.codon_usage = random_codon_usage()
+
+    def test_matches_brute_force_enumeration(self):
+        rng = random.Random(2)
+        for _ in range(60):
+            n = rng.randint(2, 7)
+            sequence = "".join(rng.choice("ACGT") for _ in range(n))
+            coding_positions = [1, 2, -3, 1, 2, 3, 0][:n] if n >= 6 and rng.random() < 0.5 else [0] * n
+            patterns = _patterns(rng)
+            table = EliminationScorerConfig.cost_table(sequence, coding_positions, self.codon_usage,
+                                                       1.0, 2.0, 5.0, rng.random() < 0.5)
+
+            expected = np.full((n, 4), np.inf)
+            for letters in itertools.product("ACGT", repeat=n):
+                candidate = "".join(letters)
+                if not any(p in candidate for p in patterns):
+                    cost = table.path_cost(candidate)
+                    for position, base in enumerate(candidate):
+                        expected[position, "ACGT".index(base)] = min(expected[position, "ACGT".index(base)], cost)
+
+            fsm = FSM(patterns, {"A", "C", "G", "T"})
+            np.testing.assert_allclose(marginal_costs(sequence, fsm, table), expected)
+
+            # From the checkpoints of a run, refilling segments of two columns
+            checkpoints = DPCheckpoints(interval=2)
+            eliminate_incremental(sequence, fsm, table, checkpoints)
+            np.testing.assert_allclose(marginal_costs(sequence, fsm, table, checkpoints), expected)
+
+    def test_row_minimum_is_the_optimal_cost(self):
+        rng = random.Random(4)
+        sequence = "".join(rng.choice("ACGT") for _ in range(400))
+        fsm = FSM({"GAATTC", "GGATCC", "GCGC"}, {"A", "C", "G", "T"})
+        table = EliminationScorerConfig.cost_table(sequence, [0] * 400, self.codon_usage, 1.0, 2.0, 100.0, False)
+        min_cost, optimized = eliminate_vectorized(sequence, fsm, table)
+
+        marginals = MarginalCosts(marginal_costs(sequence, fsm, table))
+        np.testing.assert_allclose(marginals.costs.min(axis=1), min_cost)
+        for position, base in enumerate(optimized):
+            self.assertAlmostEqual(marginals.extra_cost(position, base), 0.0)
+            self.assertIn(base, marginals.free_bases(position))
+
+    def test_reuses_only_matching_checkpoints(self):
+        rng = random.Random(5)
+        sequence = "".join(rng.choice("ACGT") for _ in range(300))
+        fsm = FSM({"GAATTC", "GGATCC", "GCGC"}, {"A", "C", "G", "T"})
+        table = EliminationScorerConfig.cost_table(sequence, [0] * 300, self.codon_usage, 1.0, 2.0, 100.0, False)
+        expected = marginal_costs(sequence, fsm, table)
+
+        checkpoints = DPCheckpoints(interval=7)
+        eliminate_incremental(sequence, fsm, table, checkpoints)
+        with patch("biosynth.algorithm.marginals._stored_columns") as stored_columns:
+            np.testing.assert_allclose(marginal_costs(sequence, fsm, table, checkpoints), expected)
+        stored_columns.assert_not_called()
+
+        # Checkpoints of another sequence are not used
+        edited = sequence[:150] + ("A" if sequence[150] != "A" else "C") + sequence[151:]
+        edited_table = EliminationScorerConfig.cost_table(edited, [0] * 300, self.codon_usage, 1.0, 2.0, 100.0, False)
+        np.testing.assert_allclose(marginal_costs(edited, fsm, edited_table, checkpoints),
+                                   marginal_costs(edited, fsm, edited_table))
+
+    def test_lock_queries(self):
+        marginals = MarginalCosts([[1.0, 2.0, 1.0, np.inf], [1.0, 3.0, 4.0, 5.0]])
+        self.assertEqual(marginals.min_cost, 1.0)
+        self.assertEqual(marginals.cost(0, "C"), 2.0)
+        self.assertEqual(marginals.extra_cost(1, "T"), 4.0)
+        self.assertEqual(marginals.free_bases(0), ["A", "G"])
+        self.assertEqual(marginals.free_positions(), [0])
+        self.assertEqual(marginals.locked_cost({}), 1.0)
+        self.assertEqual(marginals.locked_cost({1: "G"}), 4.0)
+        self.assertEqual(marginals.locked_cost({0: "C", 1: "G"}), 4.0)
+        self.assertEqual(marginals.locked_cost({0: "T"}), np.inf)
+
+
+class TestOptimizeMarginals(unittest.TestCase):
+    def setUp(self):
+        set_output_format(OutputFormat.TEST)
+
+    def test_marginals_are_reported_on_request(self):
+        request = OptimizationRequest(sequence="TTAGTACA*ATGTCGTAGTACTTACGTTAAGG",
+                                      unwanted_patterns={"TAGTAC", "CGT"}, codon_usage=random_codon_usage(),
+                                      marginals=True)
+        result = optimize(request)
+
+        self.assertEqual(len(result.marginal_costs), len(result.cleaned_sequence))
+        marginals = MarginalCosts(result.marginal_costs)
+        self.assertAlmostEqual(marginals.min_cost, result.min_cost)
+        self.assertRegex(result.info, r"Marginal costs: [\d,]+ of [\d,]+ positions can change without raising the cost")
+        self.assertIsNone(optimize(OptimizationRequest(sequence=request.sequence,
+                                                       unwanted_patterns=request.unwanted_patterns,
+                                                       codon_usage=request.codon_usage)).marginal_costs)
+
+    def test_marginals_without_pattern_occurrences(self):
+        request = OptimizationRequest(sequence="AAGTACCA", unwanted_patterns={"TAGTAC"},
+                                      codon_usage=random_codon_usage(), optimized_codon=False, marginals=True)
+        result = optimize(request)
+
+        self.assertEqual(result.optimized_sequence, "AAGTACCA")
+        marginals = MarginalCosts(result.marginal_costs)
+        self.assertEqual(len(marginals), 8)
+        self.assertEqual(marginals.min_cost, 0.0)
+        for position, base in enumerate(request.sequence):
+            self.assertEqual(marginals.extra_cost(position, base), 0.0)
+        # T at the first position completes TAGTAC, so another base must change as well
+        self.assertGreater(marginals.cost(0, "T"), marginals.cost(0, "C"))
+
+    def test_marginals_without_valid_sequence(self):
+        patterns = {a + b + c for a in "ACGT" for b in "ACGT" for c in "ACGT"}
+        result = optimize(OptimizationRequest(sequence="AAGTACCA", unwanted_patterns=patterns,
+                                              codon_usage=random_codon_usage(), marginals=True))
+
+        self.assertIsNone(result.optimized_sequence)
+        self.assertEqual(np.asarray(result.marginal_costs).shape, (8, 4))
+        self.assertTrue(np.isinf(result.marginal_costs).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""Tests for biosynth.algorithm.optimize and the request/result objects of biosynth.data.optimization."""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from unittest.mock import patch
+
+from biosynth.algorithm.optimize import analyze, optimize
+from biosynth.data import app_data
+from biosynth.data.optimization import OptimizationRequest
+from biosynth.utils.cost_utils import normalize_codon_usage
+
+
+def _request(**overrides):
+    bases = "ACGT"
+    raw = {a + b + c: 0.1 + 0.01 * k for k, (a, b, c) in
+           enumerate((a, b, c) for a in bases for b in bases for c in bases)}
+    request = OptimizationRequest(
+        sequence="TTAGTACA*ATGCTTACGTAGTAAGG",
+        unwanted_patterns={"TAGTAC", "CGT"},
+        codon_usage=normalize_codon_usage(raw),
+    )
+    return replace(request, **overrides)
+
+
+class TestOptimize(unittest.TestCase):
+    def test_analysis_locates_the_coding_region(self):
+        analysis = analyze(_request())
+        self.assertEqual(analysis.cleaned_sequence, "TTAGTACAATGCTTACGTAGTAAGG")
+        self.assertEqual(analysis.coding_indexes, (8, 20))
+        self.assertEqual([row["Pattern"] for row in analysis.unwanted_patterns_occurrences], ["CGT", "TAGTAC"])
+        self.assertIsNone(analysis.optimized_sequence)
+
+    def test_optimize_eliminates_the_patterns(self):
+        result = optimize(_request())
+        for pattern in ("TAGTAC", "CGT"):
+            self.assertNotIn(pattern, result.optimized_sequence)
+        self.assertGreater(result.min_cost, 0.0)
+        self.assertTrue(result.cost_contribution or result.cost_substitution)
+
+    def test_nothing_to_eliminate(self):
+        result = optimize(_request(sequence="AAAAAA"))
+        self.assertEqual(result.optimized_sequence, "AAAAAA")
+        self.assertEqual(result.min_cost, 0.0)
+        self.assertEqual(result.cost_contribution, [])
+
+    def test_invalid_start_codon_raises(self):
+        with self.assertRaises(ValueError):
+            optimize(_request(sequence="AA*CCC"))
+
+    def test_app_data_is_not_read(self):
+        expected = optimize(_request(alpha=1.5, beta=3.0))
+        with patch("biosynth.data.app_data.CostData.alpha", new=0.1), \
+                patch("biosynth.data.app_data.CostData.codon_usage", new=None), \
+                patch("biosynth.data.app_data.EngineData.engine", new="vectorized"):
+            self.assertEqual(optimize(_request(alpha=1.5, beta=3.0)), expected)
+
+    def test_concurrent_requests_do_not_interfere(self):
+        requests = [_request(optimized_codon=flag, both_strands=strands, w=w)
+                    for flag in (False, True) for strands in (False, True) for w in (50.0, 100.0)]
+        serial = [optimize(request) for request in requests]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            self.assertEqual(list(pool.map(optimize, requests * 2)), serial * 2)
+
+    def test_request_from_app_data(self):
+        with patch("biosynth.data.app_data.InputData.both_strands", new=True), \
+                patch("biosynth.data.app_data.EngineData.minimize_fsm", new=True):
+            request = OptimizationRequest.from_app_data(sequence="ACGT")
+        self.assertEqual(request.sequence, "ACGT")
+        self.assertTrue(request.both_strands)
+        self.assertTrue(request.minimize_fsm)
+        self.assertEqual(request.alpha, app_data.CostData.alpha)
+
+    def test_patterns_to_eliminate(self):
+        self.assertEqual(_request().patterns_to_eliminate(), {"TAGTAC", "CGT"})
+        self.assertEqual(_request(both_strands=True).patterns_to_eliminate(), {"TAGTAC", "GTACTA", "CGT", "ACG"})
+        self.assertEqual(_request(both_strands=True).patterns_to_eliminate({"CGT"}), {"CGT", "ACG"})
+
+    def test_result_published_to_app_data(self):
+        result = optimize(_request())
+        with patch("biosynth.data.app_data.OutputData.optimized_sequence"), \
+                patch("biosynth.data.app_data.EliminationData.min_cost"), \
+                patch("biosynth.data.app_data.InputData.coding_indexes"):
+            result.to_app_data()
+            self.assertEqual(app_data.OutputData.optimized_sequence, result.optimized_sequence)
+            self.assertEqual(app_data.EliminationData.min_cost, result.min_cost)
+            self.assertEqual(app_data.InputData.coding_indexes, (8, 20))
+
+
+class TestCodingModes(unittest.TestCase):
+    def test_synonymous_only_matches_the_full_alphabet(self):
+        full = optimize(_request())
+        for coding_mode in ("synonymous-only", "auto"):
+            result = optimize(_request(coding_mode=coding_mode))
+            self.assertEqual(result.min_cost, full.min_cost)
+            self.assertNotIn("full alphabet", result.info)
+
+    def test_synonymous_only_falls_back_to_the_full_alphabet(self):
+        # The only way to remove TGG is to change the tryptophan codon
+        request = _request(sequence="*ATGTGGTAA", unwanted_patterns={"TGG"}, coding_mode="synonymous-only")
+        result = optimize(request)
+        self.assertIn("falling back to the full alphabet", result.info)
+        self.assertNotIn("TGG", result.optimized_sequence)
+        self.assertEqual(result.min_cost, optimize(replace(request, coding_mode="full")).min_cost)
+
+    def test_auto_reoptimizes_when_a_non_synonymous_change_may_be_cheaper(self):
+        request = _request(alpha=2.0, w=0.1, coding_mode="auto")
+        result = optimize(request)
+        self.assertIn("re-optimizing with the full alphabet", result.info)
+        self.assertEqual(result.min_cost, optimize(replace(request, coding_mode="full")).min_cost)
@@ -0,0 +1,63 @@
+import random
+import unittest
+
+from biosynth.utils.cost_utils import IUPAC_CODES
+from biosynth.utils.pattern_scanner import PatternScanner
+
+
+def _naive(sequence, patterns):
+    ranges = {}
+    for pattern in patterns:
+        ranges[pattern] = [(k, k + len(pattern)) for k in range(len(sequence) - len(pattern) + 1)
+                           if sequence.startswith(pattern, k)]
+    return ranges
+
+
+class TestPatternScanner(unittest.TestCase):
+    def test_overlapping_and_nested_hits(self):
+        scanner = PatternScanner({"AA", "AAA", "GAA"})
+        self.assertEqual(list(scanner.scan("GAAAA")), [
+            (0, 3, "GAA"), (1, 3, "AA"),
+            (1, 4, "AAA"), (2, 4, "AA"),
+            (2, 5, "AAA"), (3, 5, "AA"),
+        ])
+
+    def test_find_all_matches_naive_search(self):
+        rng = random.Random(9)
+        for _ in range(50):
+            sequence = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 60)))
+            patterns = {"".join(rng.choice("ACGT") for _ in range(rng.randint(1, 5))) for _ in range(8)}
+            with self.subTest(sequence=sequence, patterns=patterns):
+                self.assertEqual(PatternScanner(patterns).find_all(sequence), _naive(sequence, patterns))
+
+    def test_contains_any(self):
+        scanner = PatternScanner({"TAGTAC", "ATATCA"})
+        self.assertTrue(scanner.contains_any("GGATATCAGG"))
+        self.assertFalse(scanner.contains_any("GGATATCGG"))
+        self.assertFalse(PatternScanner(set()).contains_any("ACGT"))
+
+    def test_characters_outside_patterns_reset_the_scan(self):
+        scanner = PatternScanner({"ACG"})
+        self.assertEqual(scanner.find_all("AC*ACG"), {"ACG": [(3, 6)]})
+
+    def test_scanners_are_cached_per_pattern_set(self):
+        first = PatternScanner.for_patterns({"ACG", "TTT"})
+        self.assertIs(first, PatternScanner.for_patterns(["TTT", "ACG"]))
+        self.assertIsNot(first, PatternScanner.for_patterns({"ACG"}))
+
+    def test_iupac_codes_match_their_bases(self):
+        scanner = PatternScanner({"NCCAGCN", "GRT"})
+        self.assertIsNotNone(scanner.masks)
+        self.assertEqual(scanner.find_all("TACCAGCAGATGGT"), {"NCCAGCN": [(1, 8)], "GRT": [(8, 11), (11, 14)]})
+
+    def test_iupac_matches_expanded_literals(self):
+        rng = random.Random(12)
+        for _ in range(30):
+            sequence = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 60)))
+            pattern = "".join(rng.choice("ACGTRYSWKMBDHVN") for _ in range(rng.randint(1, 4)))
+            literals = [""]
+            for code in pattern:
+                literals = [p + b for p in literals for b in IUPAC_CODES[code]]
+            expected = sorted(hit for hits in _naive(sequence, literals).values() for hit in hits)
+            with self.subTest(sequence=sequence, pattern=pattern):
+                self.assertEqual(PatternScanner({pattern}).find_all(sequence)[pattern], expected)
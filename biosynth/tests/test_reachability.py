@@ -0,0 +1,80 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from biosynth.algorithm.eliminate_sequence import EliminationController
+from biosynth.algorithm.fsm import FSM
+from biosynth.algorithm.reachability import live_cells
+from biosynth.algorithm.vectorized_dp import PredecessorGraph, eliminate_vectorized
+from biosynth.data.optimization import OptimizationRequest
+from biosynth.utils.cost_utils import EliminationScorerConfig
+from biosynth.utils.text_utils import OutputFormat, set_output_format
+from biosynth.tests.helpers import random_codon_usage
+
+
+def _cost_table(sequence, coding_positions):
+    return EliminationScorerConfig.cost_table(sequence, coding_positions, random_codon_usage(), 1.0, 2.0, 5.0, False)
+
+
+class TestLiveCells(unittest.TestCase):
+    def test_states_without_a_way_in_are_dead(self):
+        # Every way of reading 'C' after an 'A' completes a pattern
+        fsm = FSM({"AAC", "CAC", "GAC", "TAC"}, {"A", "C", "G", "T"})
+        graph = PredecessorGraph(fsm)
+        live = live_cells(graph, _cost_table("ACGTACGT", [0] * 8))
+
+        ac = graph.states.index("AC")
+        self.assertTrue(live[2, ac])
+        self.assertFalse(live[3:, ac].any())
+
+    def test_states_without_a_way_out_are_dead(self):
+        # Every base read after 'TT' completes a pattern, so 'TT' can only end the sequence
+        fsm = FSM({"TTA", "TTC", "TTG", "TTT"}, {"A", "C", "G", "T"})
+        graph = PredecessorGraph(fsm)
+        live = live_cells(graph, _cost_table("ACGTACGT", [0] * 8))
+
+        tt = graph.states.index("TT")
+        self.assertFalse(live[2:8, tt].any())
+        self.assertTrue(live[8, tt])
+
+    def test_codons_of_infinite_cost_prune_their_prefixes(self):
+        # The start codon only allows ATG, so the states reading its first two bases must end in 'AT'
+        fsm = FSM({"GGGGG"}, {"A", "C", "G", "T"})
+        graph = PredecessorGraph(fsm)
+        live = live_cells(graph, _cost_table("CCATGAAATAA", [0, 0, 1, 2, -3, 1, 2, 3, 1, 2, 3]))
+
+        self.assertEqual({graph.states[v][-2:] for v in live[4].nonzero()[0]}, {"AT"})
+
+
+class TestPrunedPythonEngine(unittest.TestCase):
+    def setUp(self):
+        set_output_format(OutputFormat.TEST)
+        patcher = patch("biosynth.algorithm.eliminate_sequence.MIN_PRUNED_STATES", new=0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_matches_the_vectorized_engine(self):
+        rng = random.Random(11)
+        for _ in range(30):
+            n = rng.randint(8, 45)
+            sequence = "".join(rng.choice("ACGT") for _ in range(n))
+            start = rng.randint(0, 4)
+            coding_positions = [0] * n
+            for k in range(3 * rng.randint(0, (n - start) // 3)):
+                coding_positions[start + k] = -3 if k == 2 else k % 3 + 1
+            patterns = {"".join(rng.choice("ACGT") for _ in range(rng.randint(3, 5))) for _ in range(4)}
+            fsm = FSM(patterns, {"A", "C", "G", "T"})
+            cost_table = _cost_table(sequence, coding_positions)
+            for table in (cost_table, cost_table.synonymous_only()):
+                stats = {}
+                self.assertEqual(EliminationController._eliminate_python(sequence, fsm, table, stats=stats),
+                                 eliminate_vectorized(sequence, fsm, table))
+                self.assertEqual(stats["dp_cells"], (n - 2) * len(fsm.compiled))
+                self.assertLessEqual(stats["pruned_cells"], stats["dp_cells"])
+
+    def test_pruned_cells_are_reported(self):
+        request = OptimizationRequest(sequence="TTAGTACAATGCTTACGTAGTAAGG", unwanted_patterns={"TAGTAC", "CGT"},
+                                      codon_usage=random_codon_usage(), coding_mode="synonymous-only")
+        info, *_ = EliminationController.eliminate(request.sequence, request.unwanted_patterns, [0] * 25,
+                                                   request=request)
+        self.assertRegex(info, r"Reachability pruning: [\d,]+ of [\d,]+ DP cells")
@@ -46,6 +46,7 @@ def _seed_app_data():
     app_data.EliminationData.cost_contribution = []
     app_data.EliminationData.cost_substitution = []
     app_data.EliminationData.min_cost = 0.0
+    app_data.EliminationData.alternatives = None
 
 
 class TestReportBuilder(unittest.TestCase):
@@ -88,6 +89,18 @@ class TestReportBuilder(unittest.TestCase):
         # Cleanup the scratch dir the report was rendered into.
         shutil.rmtree(os.path.dirname(path), ignore_errors=True)
 
+    def test_create_report_lists_the_alternatives(self):
+        app_data.EliminationData.alternatives = [
+            {"Rank": 1, "Cost": "0", "Changed_Bases": 0, "Sequence": "ATGAAATAA"},
+            {"Rank": 2, "Cost": "1.5", "Changed_Bases": 1, "Sequence": "ATGAAGTAA"},
+        ]
+        path = ReportBuilder().create_report(file_date="01-Jan-1970_00-00-00")
+        with open(path, encoding="utf-8") as fh:
+            html = fh.read()
+        self.assertIn('id="alternative-sequences"', html)
+        self.assertIn("ATGAAGTAA", html)
+        shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+
     def test_create_report_with_output_path_writes_under_biosynth_outputs(self):
         ctrl = ReportBuilder()
         with tempfile.TemporaryDirectory() as tmp:
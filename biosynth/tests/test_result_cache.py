@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+from dataclasses import replace
+from unittest.mock import patch
+
+from biosynth.algorithm import result_cache
+from biosynth.algorithm.optimize import optimize
+from biosynth.data.optimization import OptimizationRequest
+from biosynth.utils.text_utils import OutputFormat, set_output_format
+
+CODON_USAGE = {a + b + c: 0.5 for a in "ACGT" for b in "ACGT" for c in "ACGT"}
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        set_output_format(OutputFormat.TEST)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = patch.dict(os.environ, {"BIOSYNTH_CACHE_DIR": self.tmp.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.request = OptimizationRequest(sequence="TTAGTACA*ATGCTTACGTAGTAAGG", unwanted_patterns={"TAGTAC", "CGT"},
+                                           codon_usage=CODON_USAGE, engine="vectorized", result_cache=True)
+
+    def test_key_is_canonical(self):
+        key = result_cache.request_key(self.request)
+        reordered = replace(self.request, unwanted_patterns=["CGT", "TAGTAC"],
+                            codon_usage=dict(reversed(list(CODON_USAGE.items()))),
+                            codon_usage_filename="usage.txt", fsm_cache=True, result_cache=False)
+        self.assertEqual(result_cache.request_key(reordered), key)
+        for changed in (replace(self.request, alpha=1.5), replace(self.request, optimized_codon=False),
+                        replace(self.request, unwanted_patterns={"TAGTAC"}), replace(self.request, top_k=2),
+                        replace(self.request, codon_usage={**CODON_USAGE, "AAA": 0.25})):
+            self.assertNotEqual(result_cache.request_key(changed), key)
+
+    def test_miss_stores_and_hit_skips_the_optimization(self):
+        first = optimize(self.request)
+        self.assertTrue(os.path.exists(result_cache.cache_path(self.request)))
+
+        with patch("biosynth.algorithm.optimize.EliminationController.eliminate") as eliminate:
+            second = optimize(self.request)
+            eliminate.assert_not_called()
+
+        self.assertEqual(replace(second, info=first.info), first)
+        self.assertIn("loaded from the result cache", second.info)
+
+    def test_disabled_cache_is_not_used(self):
+        request = replace(self.request, result_cache=False)
+        optimize(request)
+        self.assertFalse(os.path.exists(result_cache.cache_dir()))
+
+    def test_no_valid_sequence_round_trips(self):
+        request = replace(self.request, sequence="ACGTAC",
+                          unwanted_patterns={a + b + c for a in "ACGT" for b in "ACGT" for c in "ACGT"})
+        optimize(request)
+        cached = result_cache.load_result(request)
+        self.assertIsNone(cached.optimized_sequence)
+        self.assertEqual(cached.min_cost, float("inf"))
+
+    def test_corrupt_entry_is_a_miss(self):
+        path = result_cache.store_result(self.request, optimize(replace(self.request, result_cache=False)))
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write("{not json")
+        self.assertIsNone(result_cache.load_result(self.request))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        requests = [replace(self.request, alpha=alpha) for alpha in (0.5, 1.0, 1.5)]
+        paths = [result_cache.store_result(r, optimize(replace(r, result_cache=False))) for r in requests]
+        for age, path in enumerate(paths):
+            os.utime(path, (1000 + age, 1000 + age))
+
+        # A hit makes the oldest entry the most recently used one
+        self.assertIsNotNone(result_cache.load_result(requests[0]))
+        size = os.path.getsize(paths[1])
+        self.assertEqual(result_cache.evict(max_bytes=sum(map(os.path.getsize, paths)) - size), 1)
+        self.assertEqual([os.path.exists(path) for path in paths], [True, False, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Tests for biosynth.executions.service and its client, biosynth.executions.service_client."""
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from biosynth.executions import service
+from biosynth.executions.service import OptimizationServer, UnixOptimizationServer, run_job
+from biosynth.executions.service_client import request_service
+
+
+def _job(**overrides):
+    bases = "ACGT"
+    job = {
+        "sequence": "TTAGTACA*ATGCTTACGTAGTAAGG",
+        "unwanted_patterns": ["TAGTAC", "CGT"],
+        "codon_usage": {a + b + c: 0.5 for a in bases for b in bases for c in bases},
+    }
+    job.update(overrides)
+    return job
+
+
+class TestRunJob(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        for patcher in (patch.dict(os.environ, {"BIOSYNTH_CACHE_DIR": self.tmp.name}),
+                        patch("sys.stdout", StringIO())):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_optimizes_and_reuses_the_caches(self):
+        service._automaton.cache_clear()
+        service._codon_table.cache_clear()
+
+        first = run_job(_job())
+        second = run_job(_job(alpha=1.5, beta=3.0))
+        for result in (first, second):
+            self.assertNotIn("TAGTAC", result["optimized_sequence"])
+            self.assertNotIn("CGT", result["optimized_sequence"])
+        self.assertEqual(service.cache_stats()["automata"]["hits"], 1)
+        self.assertEqual(service.cache_stats()["codon_tables"]["hits"], 1)
+
+    def test_reports_the_top_k_sequences(self):
+        result = run_job(_job(top_k=3))
+        alternatives = result["alternatives"]
+        self.assertEqual([row["Rank"] for row in alternatives], [1, 2, 3])
+        self.assertEqual(alternatives[0]["Sequence"], result["optimized_sequence"])
+        self.assertEqual(len({row["Sequence"] for row in alternatives}), 3)
+        json.dumps(result)
+
+    def test_impossible_marginal_costs_become_null(self):
+        result = run_job(_job(marginals=True, coding_mode="synonymous-only"))
+        costs = [cost for row in result["marginal_costs"] for cost in row]
+        self.assertIn(None, costs)
+        self.assertEqual(min(cost for cost in costs if cost is not None), result["min_cost"])
+        json.dumps(result, allow_nan=False)
+
+    def test_invalid_jobs(self):
+        for job in (_job(sequence="ATGX"), _job(unwanted_patterns="TAGTAC"), _job(codon_usage={"AAA": 1.0}),
+                    _job(alpha=5.0), _job(engine="fast"), _job(top_k=0), _job(colour="red"), ["not", "a", "job"]):
+            with self.subTest(job=job), self.assertRaises(ValueError):
+                run_job(job)
+
+
+class TestOptimizationServer(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        for patcher in (patch.dict(os.environ, {"BIOSYNTH_CACHE_DIR": self.tmp.name}),
+                        patch("sys.stdout", StringIO())):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _start(self, server):
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+    def test_tcp_round_trip(self):
+        server = OptimizationServer(("127.0.0.1", 0))
+        self._start(server)
+        port = server.server_address[1]
+
+        result = request_service("POST", "/optimize", _job(), port=port)
+        self.assertEqual(result, json.loads(json.dumps(run_job(_job(result_cache=False)))))
+        self.assertIn("loaded from the result cache", request_service("POST", "/optimize", _job(), port=port)["info"])
+        self.assertEqual(request_service("GET", "/health", port=port)["status"], "ok")
+
+        with self.assertRaises(ValueError):
+            request_service("POST", "/optimize", _job(sequence=""), port=port)
+
+    def test_unix_socket_replaces_only_a_stale_socket(self):
+        path = os.path.join(self.tmp.name, "biosynth.sock")
+        UnixOptimizationServer(path).server_close()
+        stale = UnixOptimizationServer(path)
+        stale.socket.close()  # Leaves the socket file behind, as a killed server would
+        UnixOptimizationServer(path).server_close()
+        self.assertFalse(os.path.exists(path))
+
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write("not a socket")
+        with self.assertRaises(FileExistsError):
+            UnixOptimizationServer(path)
+        with open(path, encoding="utf-8") as fh:
+            self.assertEqual(fh.read(), "not a socket")
+
+    def test_unix_socket_with_worker_pool(self):
+        path = os.path.join(self.tmp.name, "biosynth.sock")
+        server = UnixOptimizationServer(path, jobs=2)
+        self._start(server)
+
+        result = request_service("POST", "/optimize", _job(), socket_path=path)
+        self.assertEqual(result["optimized_sequence"], run_job(_job())["optimized_sequence"])
@@ -0,0 +1,59 @@
+import json
+import os
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from biosynth.executions.controllers.submit_controller import SubmitController
+from biosynth.utils.text_utils import OutputFormat, set_output_format
+
+
+class TestSubmitController(unittest.TestCase):
+    def setUp(self):
+        set_output_format(OutputFormat.TERMINAL)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self._stdout = StringIO()
+        patcher = patch("sys.stdout", self._stdout)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        bases = "ACGT"
+        self.argv = []
+        for flag, name, text in (("-s", "seq.txt", "ATAGTAC\n"), ("-p", "pat.txt", "TAGTAC\n"),
+                                 ("-c", "cod.txt", "\n".join(f"{a + b + c} 0.5" for a in bases
+                                                             for b in bases for c in bases))):
+            path = os.path.join(self.tmp.name, name)
+            with open(path, "w", encoding="utf-8") as fh:
+                fh.write(text)
+            self.argv += [flag, path]
+
+    def test_sends_the_job_and_saves_the_result(self):
+        reply = {"optimized_sequence": "ATAGCAC", "min_cost": 2.0}
+        output = os.path.join(self.tmp.name, "result.json")
+        with patch("biosynth.executions.controllers.submit_controller.request_service",
+                   return_value=reply) as request:
+            SubmitController(self.argv + ["-a", "1.5", "--both-strands", "--no-cache", "--port", "9000",
+                                          "-o", output]).execute()
+
+        method, path, job = request.call_args.args
+        self.assertEqual((method, path), ("POST", "/optimize"))
+        self.assertEqual(job["sequence"], "ATAGTAC")
+        self.assertEqual(job["unwanted_patterns"], ["TAGTAC"])
+        self.assertEqual(len(job["codon_usage"]), 64)
+        self.assertEqual(job["alpha"], 1.5)
+        self.assertTrue(job["both_strands"])
+        self.assertFalse(job["result_cache"])
+        self.assertNotIn("beta", job)
+        self.assertEqual(request.call_args.kwargs["port"], 9000)
+        with open(output, encoding="utf-8") as fh:
+            self.assertEqual(json.load(fh), reply)
+        self.assertIn("ATAGCAC", self._stdout.getvalue())
+
+    def test_unreachable_service_exits(self):
+        with patch("biosynth.executions.controllers.submit_controller.request_service",
+                   side_effect=ConnectionRefusedError("refused")):
+            with self.assertRaises(SystemExit) as cm:
+                SubmitController(self.argv).execute()
+        self.assertEqual(cm.exception.code, 3)
@@ -0,0 +1,106 @@
+import csv
+import random
+import tempfile
+import unittest
+from dataclasses import replace
+from io import StringIO
+from unittest.mock import patch
+
+from biosynth.algorithm.fsm import FSM
+from biosynth.algorithm.optimize import optimize, sweep
+from biosynth.algorithm.sweep import eliminate_sweep
+from biosynth.algorithm.vectorized_dp import eliminate_vectorized
+from biosynth.data import app_data
+from biosynth.data.optimization import OptimizationRequest
+from biosynth.executions.controllers.sweep_controller import SweepController
+from biosynth.utils.cost_utils import EliminationScorerConfig
+from biosynth.utils.text_utils import OutputFormat, set_output_format
+from biosynth.tests.helpers import codon_phases, random_codon_usage
+
+
+SETTINGS = [(0.5, 2.0, 0.5, False), (1.0, 2.0, 100.0, False), (1.0, 3.0, 5.0, True), (2.0, 4.0, 100.0, True)]
+
+
+class TestEliminateSweep(unittest.TestCase):
+    def setUp(self):
+        self.codon_usage = random_codon_usage()
+
+    def test_matches_the_vectorized_engine_per_setting(self):
+        rng = random.Random(17)
+        for _ in range(30):
+            n = rng.randint(5, 50)
+            sequence = "".join(rng.choice("ACGT") for _ in range(n))
+            start = rng.randint(0, 4)
+            coding_positions = codon_phases(n, start, rng.randint(0, max(0, (n - start) // 3)))
+            patterns = {"".join(rng.choice("ACGT") for _ in range(rng.randint(3, 5))) for _ in range(4)}
+            fsm = FSM(patterns, {"A", "C", "G", "T"})
+            cost_tables = [EliminationScorerConfig.cost_table(sequence, coding_positions, self.codon_usage, *setting)
+                           for setting in SETTINGS]
+
+            self.assertEqual(eliminate_sweep(sequence, fsm, cost_tables),
+                             [eliminate_vectorized(sequence, fsm, table) for table in cost_tables])
+
+    def test_no_valid_sequence(self):
+        patterns = {a + b + c for a in "ACGT" for b in "ACGT" for c in "ACGT"}
+        cost_tables = [EliminationScorerConfig.cost_table("ACGTAC", [0] * 6, self.codon_usage, *setting)
+                       for setting in SETTINGS[:2]]
+        self.assertEqual(eliminate_sweep("ACGTAC", FSM(patterns, {"A", "C", "G", "T"}), cost_tables),
+                         [(float("inf"), None)] * 2)
+
+    def test_tables_must_share_their_codon_phases(self):
+        cost_tables = [EliminationScorerConfig.cost_table("CCATGAAATAG", positions, self.codon_usage, *SETTINGS[0])
+                       for positions in ([0] * 11, codon_phases(11, 2, 3))]
+        with self.assertRaises(ValueError):
+            eliminate_sweep("CCATGAAATAG", FSM({"AAA"}, {"A", "C", "G", "T"}), cost_tables)
+
+
+class TestSweep(unittest.TestCase):
+    def setUp(self):
+        set_output_format(OutputFormat.TEST)
+        self.request = OptimizationRequest(sequence="TTAGTACA*ATGTCGTAGTACTTACGTTAAGG",
+                                           unwanted_patterns={"TAGTAC", "CGT"}, codon_usage=random_codon_usage())
+
+    def test_matches_separate_optimizations(self):
+        for coding_mode in ("full", "synonymous-only", "auto"):
+            requests = [replace(self.request, alpha=alpha, beta=beta, w=w, optimized_codon=optimized_codon,
+                                coding_mode=coding_mode, engine="vectorized")
+                        for alpha, beta, w, optimized_codon in SETTINGS]
+            for request, result in zip(requests, sweep(requests)):
+                expected = optimize(request)
+                self.assertEqual(result.optimized_sequence, expected.optimized_sequence)
+                self.assertAlmostEqual(result.min_cost, expected.min_cost)
+                self.assertEqual(result.cost_contribution, expected.cost_contribution)
+                self.assertEqual(result.cost_substitution, expected.cost_substitution)
+
+    def test_nothing_to_eliminate(self):
+        request = replace(self.request, unwanted_patterns={"GGGGG"})
+        results = sweep([request, replace(request, w=5.0)])
+        self.assertEqual([(r.optimized_sequence, r.min_cost) for r in results],
+                         [(request.sequence.replace("*", ""), 0.0)] * 2)
+
+
+class TestSweepController(unittest.TestCase):
+    def setUp(self):
+        set_output_format(OutputFormat.TERMINAL)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        app_data.InputData.dna_sequence = "ATAGTACA*ATGTAGTACTAA"
+        app_data.InputData.unwanted_patterns = {"TAGTAC"}
+        app_data.InputData.both_strands = False
+        app_data.CostData.codon_usage = random_codon_usage()
+        app_data.CostData.alpha = 1.0
+        app_data.CostData.beta = 2.0
+        app_data.CostData.w = 100.0
+        for target in (patch("biosynth.data.app_data.OutputData.output_path", new=self.tmp.name),
+                       patch("sys.stdout", StringIO())):
+            target.start()
+            self.addCleanup(target.stop)
+
+    def test_writes_one_row_per_setting(self):
+        settings = [{"alpha": 1.0, "optimized_codon": False}, {"alpha": 1.5, "optimized_codon": True}]
+        with open(SweepController(settings).run(), encoding="utf-8") as fh:
+            rows = list(csv.DictReader(fh, delimiter="\t"))
+
+        self.assertEqual([(row["Alpha"], row["Optimized_Codon"]) for row in rows], [("1", "False"), ("1.5", "True")])
+        self.assertEqual({row["Status"] for row in rows}, {"optimized"})
+        self.assertTrue(all(int(row["Changed_Bases"]) > 0 for row in rows))
@@ -0,0 +1,95 @@
+import itertools
+import random
+import unittest
+from dataclasses import replace
+
+from biosynth.algorithm.fsm import FSM
+from biosynth.algorithm.optimize import optimize
+from biosynth.algorithm.top_k import eliminate_top_k
+from biosynth.algorithm.vectorized_dp import eliminate_vectorized
+from biosynth.data.optimization import OptimizationRequest
+from biosynth.utils.cost_utils import EliminationScorerConfig
+from biosynth.utils.text_utils import OutputFormat, set_output_format
+from biosynth.tests.helpers import random_codon_usage
+
+
+def _patterns(rng):
+    return {"".join(rng.choice("ACGT") for _ in range(rng.randint(3, 4))) for _ in range(3)}
+
+
+class TestEliminateTopK(unittest.TestCase):
+    def setUp(self):
+        self.codon_usage = random_codon_usage()
+
+    def test_matches_brute_force_enumeration(self):
+        rng = random.Random(11)
+        for _ in range(80):
+            n = rng.randint(3, 7)
+            sequence = "".join(rng.choice("ACGT") for _ in range(n))
+            coding_positions = [1, 2, -3, 1, 2, 3, 0][:n] if n >= 6 and rng.random() < 0.5 else [0] * n
+            patterns = _patterns(rng)
+            table = EliminationScorerConfig.cost_table(sequence, coding_positions, self.codon_usage,
+                                                       1.0, 2.0, 5.0, rng.random() < 0.5)
+            k = rng.randint(1, 12)
+
+            alternatives = []
+            best = eliminate_top_k(sequence, FSM(patterns, {"A", "C", "G", "T"}), table, k, alternatives)
+
+            valid = ("".join(s) for s in itertools.product("ACGT", repeat=n))
+            expected = sorted(table.path_cost(s) for s in valid if not any(p in s for p in patterns))[:k]
+            self.assertEqual(len(alternatives), len(expected))
+            self.assertEqual(best, alternatives[0])
+            self.assertEqual(len({s for _, s in alternatives}), len(alternatives))
+            for (cost, seq), expected_cost in zip(alternatives, expected):
+                self.assertAlmostEqual(cost, expected_cost)
+                self.assertAlmostEqual(table.path_cost(seq), cost)
+                self.assertFalse(any(p in seq for p in patterns))
+
+    def test_cheapest_matches_the_vectorized_engine(self):
+        rng = random.Random(5)
+        for _ in range(20):
+            n = rng.randint(10, 60)
+            sequence = "".join(rng.choice("ACGT") for _ in range(n))
+            fsm = FSM(_patterns(rng), {"A", "C", "G", "T"})
+            table = EliminationScorerConfig.cost_table(sequence, [0] * n, self.codon_usage, 1.0, 2.0, 100.0, False)
+            for k in (1, 4):
+                self.assertEqual(eliminate_top_k(sequence, fsm, table, k), eliminate_vectorized(sequence, fsm, table))
+
+    def test_no_valid_sequence(self):
+        patterns = {a + b + c for a in "ACGT" for b in "ACGT" for c in "ACGT"}
+        table = EliminationScorerConfig.cost_table("ACGTAC", [0] * 6, self.codon_usage, 1.0, 2.0, 100.0, False)
+        alternatives = []
+        self.assertEqual(eliminate_top_k("ACGTAC", FSM(patterns, {"A", "C", "G", "T"}), table, 3, alternatives),
+                         (float("inf"), None))
+        self.assertEqual(alternatives, [])
+
+
+class TestOptimizeTopK(unittest.TestCase):
+    def setUp(self):
+        set_output_format(OutputFormat.TEST)
+        self.request = OptimizationRequest(sequence="TTAGTACA*ATGTCGTAGTACTTACGTTAAGG",
+                                           unwanted_patterns={"TAGTAC", "CGT"}, codon_usage=random_codon_usage(),
+                                           engine="vectorized", top_k=5)
+
+    def test_reports_the_alternatives(self):
+        for coding_mode in ("full", "synonymous-only", "auto"):
+            request = replace(self.request, coding_mode=coding_mode)
+            result = optimize(request)
+            expected = optimize(replace(request, top_k=1))
+
+            self.assertAlmostEqual(result.min_cost, expected.min_cost)
+            self.assertEqual([row["Rank"] for row in result.alternatives], [1, 2, 3, 4, 5])
+            self.assertEqual(result.alternatives[0]["Sequence"], result.optimized_sequence)
+            self.assertEqual(len({row["Sequence"] for row in result.alternatives}), 5)
+            self.assertIn("Top-k search: found 5 of the 5 requested sequences.", result.info)
+            self.assertEqual(expected.alternatives, [])
+
+    def test_auto_mode_ranks_over_the_full_alphabet(self):
+        request = replace(self.request, w=5.0, optimized_codon=False)
+        auto = optimize(replace(request, coding_mode="auto"))
+        full = optimize(replace(request, coding_mode="full"))
+        self.assertEqual([row["Cost"] for row in auto.alternatives], [row["Cost"] for row in full.alternatives])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import random
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from biosynth.algorithm.eliminate_sequence import EliminationController
+from biosynth.algorithm.fsm import FSM
+from biosynth.algorithm.vectorized_dp import PredecessorGraph, fill_column, eliminate_vectorized, \
+    eliminate_low_memory
+from biosynth.utils.cost_utils import EliminationScorerConfig
+from biosynth.utils.text_utils import OutputFormat, set_output_format
+from biosynth.tests.helpers import random_codon_usage
+
+
+def _run(engine, sequence, patterns, coding_positions):
+    with patch("biosynth.data.app_data.EngineData.engine", new=engine):
+        return EliminationController.eliminate(sequence, patterns, coding_positions)
+
+
+class TestPredecessorGraph(unittest.TestCase):
+    def test_every_transition_becomes_one_edge(self):
+        fsm = FSM({"ATATCA", "TAGTAC"}, {"A", "C", "G", "T"})
+        graph = PredecessorGraph(fsm)
+
+        valid = sum(1 for v in fsm.f.values() if v is not None)
+        self.assertEqual(len(graph.src), valid)
+        self.assertEqual(graph.indptr[-1], valid)
+        self.assertEqual(len(graph.bigram_states), 16)
+
+        for e in range(len(graph.src)):
+            u = graph.states[graph.src[e]]
+            v = graph.states[graph.dst[e]]
+            self.assertEqual(fsm.f[(u, "ACGT"[graph.sym[e]])], v)
+
+    def test_unreachable_states_keep_infinite_cost(self):
+        # Every way of reading 'C' after an 'A' completes a pattern, so the
+        # bigram state 'AC' has no incoming edges past column 2.
+        fsm = FSM({"AAC", "CAC", "GAC", "TAC"}, {"A", "C", "G", "T"})
+        graph = PredecessorGraph(fsm)
+        prev = np.zeros(len(graph.states))
+        column, best_edge = fill_column(graph, prev, np.zeros(64))
+
+        ac = graph.states.index("AC")
+        self.assertEqual(column[ac], np.inf)
+        self.assertEqual(best_edge[ac], -1)
+
+
+class TestVectorizedEngine(unittest.TestCase):
+    def setUp(self):
+        set_output_format(OutputFormat.TEST)
+        self.patchers = [
+            patch("biosynth.data.app_data.CostData.codon_usage", new=random_codon_usage()),
+            patch("biosynth.data.app_data.CostData.alpha", new=1.0),
+            patch("biosynth.data.app_data.CostData.beta", new=2.0),
+            patch("biosynth.data.app_data.CostData.w", new=100.0),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def assertSameResult(self, sequence, patterns, coding_positions):
+        expected = _run("python", sequence, patterns, coding_positions)
+        actual = _run("vectorized", sequence, patterns, coding_positions)
+        # The info string carries a timestamp; compare everything else exactly.
+        self.assertEqual(expected[1:], actual[1:])
+
+    def test_matches_python_engine_non_coding(self):
+        self.assertSameResult("TAGTACATATCAGGTAGTAC", {"TAGTAC", "ATATCA"}, [0] * 20)
+
+    def test_matches_python_engine_coding(self):
+        sequence = "AAATGCTTACGTAGCCATTAAGG"
+        coding_positions = [0, 0] + [-3 if k == 2 else (k % 3) + 1 for k in range(18)] + [0, 0, 0]
+        for optimized_codon in (False, True):
+            with patch("biosynth.data.app_data.CostData.optimized_codon", new=optimized_codon):
+                self.assertSameResult(sequence, {"CGT", "GCC"}, coding_positions)
+
+    def test_matches_python_engine_on_random_inputs(self):
+        rng = random.Random(2024)
+        for _ in range(20):
+            n = rng.randint(10, 40)
+            sequence = "".join(rng.choice("ACGT") for _ in range(n))
+            patterns = {sequence[k:k + rng.randint(2, 5)] for k in rng.sample(range(n - 5), 3)}
+            patterns |= {"".join(rng.choice("ACGT") for _ in range(4))}
+            self.assertSameResult(sequence, patterns, [0] * n)
+
+    def test_no_valid_sequence(self):
+        patterns = {a + b + c for a in "ACGT" for b in "ACGT" for c in "ACGT"}
+        info, _, new_seq, cost = _run("vectorized", "ATG", patterns, [0] * 3)
+        self.assertIsNone(new_seq)
+        self.assertEqual(cost, float("inf"))
+        self.assertIn("No valid sequence", info)
+
+
+class TestLowMemoryEngine(unittest.TestCase):
+    def setUp(self):
+        set_output_format(OutputFormat.TEST)
+        self.codon_usage = random_codon_usage()
+
+    def _cost_table(self, sequence, coding_positions):
+        return EliminationScorerConfig.cost_table(sequence, coding_positions, self.codon_usage,
+                                                  1.0, 2.0, 100.0, True)
+
+    def test_matches_full_table_for_every_checkpoint_interval(self):
+        rng = random.Random(11)
+        sequence = "".join(rng.choice("ACGT") for _ in range(37))
+        patterns = {sequence[3:8], sequence[20:24], "GATC"}
+        fsm = FSM(patterns, {"A", "C", "G", "T"})
+        cost_table = self._cost_table(sequence, [0] * len(sequence))
+
+        expected = eliminate_vectorized(sequence, fsm, cost_table)
+        for interval in (None, 1, 2, 5, 36, 100):
+            with self.subTest(interval=interval):
+                actual = eliminate_low_memory(sequence, fsm, cost_table, interval)
+                self.assertEqual(expected, actual)
+
+    def test_short_sequences(self):
+        fsm = FSM({"TAG"}, {"A", "C", "G", "T"})
+        for sequence in ("TA", "TAG"):
+            cost_table = self._cost_table(sequence, [0] * len(sequence))
+            self.assertEqual(eliminate_vectorized(sequence, fsm, cost_table),
+                             eliminate_low_memory(sequence, fsm, cost_table))
+
+    def test_low_memory_flag_routes_through_controller(self):
+        with patch("biosynth.data.app_data.CostData.codon_usage", new=self.codon_usage), \
+                patch("biosynth.data.app_data.EngineData.low_memory", new=True):
+            low = EliminationController.eliminate("TAGTACATATCAGG", {"TAGTAC", "ATATCA"}, [0] * 14)
+        with patch("biosynth.data.app_data.CostData.codon_usage", new=self.codon_usage):
+            full = EliminationController.eliminate("TAGTACATATCAGG", {"TAGTAC", "ATATCA"}, [0] * 14)
+        self.assertEqual(low[1:], full[1:])
@@ -0,0 +1,86 @@
+import random
+import unittest
+
+from biosynth.algorithm.fsm import FSM
+from biosynth.algorithm.vectorized_dp import eliminate_vectorized
+from biosynth.algorithm.windowed import align_window, build_windows, eliminate_windowed
+from biosynth.utils.cost_utils import EliminationScorerConfig
+from biosynth.tests.helpers import codon_phases, random_codon_usage
+
+ALPHABET = {"A", "C", "G", "T"}
+
+
+class TestWindows(unittest.TestCase):
+    def test_align_window_to_codon_boundaries(self):
+        positions = codon_phases(20, 4, 4)
+        # Hit from the middle of the start codon to the middle of the second codon
+        self.assertEqual(align_window(5, 9, positions), (4, 10))
+        self.assertEqual(align_window(0, 3, positions), (0, 3))
+        # A window may not start at position 1
+        self.assertEqual(align_window(1, 3, [0] * 5), (0, 3))
+
+    def test_build_windows_pads_and_merges(self):
+        windows = build_windows([(10, 13), (18, 21), (40, 43)], 3, [0] * 50)
+        self.assertEqual(windows, [(7, 24), (37, 46)])
+
+
+class TestWindowedElimination(unittest.TestCase):
+    def setUp(self):
+        self.codon_usage = random_codon_usage(5)
+        self.calls = []
+
+    def _engine(self, sequence, fsm, cost_table):
+        self.calls.append(len(sequence))
+        return eliminate_vectorized(sequence, fsm, cost_table)
+
+    def _compare(self, sequence, patterns, coding_positions, optimized_codon=False):
+        fsm = FSM(patterns, ALPHABET)
+        cost_table = EliminationScorerConfig.cost_table(sequence, coding_positions, self.codon_usage,
+                                                        1.0, 2.0, 100.0, optimized_codon)
+        expected_cost, _ = eliminate_vectorized(sequence, fsm, cost_table)
+        actual_cost, actual_seq = eliminate_windowed(sequence, coding_positions, fsm, cost_table, self._engine)
+
+        self.assertAlmostEqual(expected_cost, actual_cost)
+        self.assertFalse(any(p in actual_seq for p in patterns if len(p) > 2))
+        self.assertAlmostEqual(cost_table.path_cost(actual_seq), actual_cost)
+        return actual_seq
+
+    def test_only_windows_are_optimized(self):
+        rng = random.Random(3)
+        background = "".join(rng.choice("AC") for _ in range(300))
+        sequence = background[:100] + "GTGTG" + background[100:250] + "TTGTT" + background[250:]
+        actual = self._compare(sequence, {"GTGTG", "TTGTT"}, [0] * len(sequence))
+
+        self.assertTrue(self.calls)
+        self.assertLess(max(self.calls), 20)
+        self.assertEqual(actual[:90], sequence[:90])
+        self.assertEqual(actual[-40:], sequence[-40:])
+
+    def test_matches_full_dp_on_random_inputs(self):
+        rng = random.Random(17)
+        for _ in range(30):
+            n = rng.randint(20, 80)
+            sequence = "".join(rng.choice("ACGT") for _ in range(n))
+            patterns = {sequence[k:k + rng.randint(3, 6)] for k in rng.sample(range(n - 6), 3)}
+            with self.subTest(sequence=sequence, patterns=patterns):
+                self._compare(sequence, patterns, [0] * n)
+
+    def test_matches_full_dp_in_coding_regions(self):
+        rng = random.Random(23)
+        for optimized_codon in (False, True):
+            for _ in range(10):
+                sequence = "".join(rng.choice("ACGT") for _ in range(60))
+                sequence = sequence[:10] + "ATG" + sequence[13:]
+                coding_positions = codon_phases(60, 10, 12)
+                patterns = {sequence[k:k + 4] for k in rng.sample(range(5, 50), 2)}
+                with self.subTest(sequence=sequence, patterns=patterns, optimized_codon=optimized_codon):
+                    self._compare(sequence, patterns, coding_positions, optimized_codon)
+
+    def test_no_valid_sequence(self):
+        patterns = {a + b + c for a in "ACGT" for b in "ACGT" for c in "ACGT"}
+        fsm = FSM(patterns, ALPHABET)
+        sequence = "ACACACACATGCACACACAC"
+        cost_table = EliminationScorerConfig.cost_table(sequence, [0] * 20, self.codon_usage,
+                                                        1.0, 2.0, 100.0, False)
+        self.assertEqual(eliminate_windowed(sequence, [0] * 20, fsm, cost_table, self._engine),
+                         (float("inf"), None))
@@ -1,8 +1,43 @@
+from functools import lru_cache
+
 import numpy as np
 
 from biosynth.utils.amino_acid_utils import AminoAcidConfig, GeneticCodeTable
 from biosynth.utils.logger import Logger
 
+# Canonical base order shared by every integer encoding of bases, bigrams and codons.
+BASES = ('A', 'C', 'G', 'T')
+BIGRAMS = tuple(x + y for x in BASES for y in BASES)
+CODONS = tuple(xy + z for xy in BIGRAMS for z in BASES)
+
+BASE_INDEX = {base: k for k, base in enumerate(BASES)}
+BIGRAM_INDEX = {bigram: k for k, bigram in enumerate(BIGRAMS)}
+
+# IUPAC nucleotide codes accepted in unwanted patterns, with the bases each one matches.
+IUPAC_CODES = {
+    'A': 'A', 'C': 'C', 'G': 'G', 'T': 'T',
+    'R': 'AG', 'Y': 'CT', 'S': 'CG', 'W': 'AT', 'K': 'GT', 'M': 'AC',
+    'B': 'CGT', 'D': 'AGT', 'H': 'ACT', 'V': 'ACG',
+    'N': 'ACGT',
+}
+IUPAC_COMPLEMENT = {
+    'A': 'T', 'C': 'G', 'G': 'C', 'T': 'A',
+    'R': 'Y', 'Y': 'R', 'S': 'S', 'W': 'W', 'K': 'M', 'M': 'K',
+    'B': 'V', 'D': 'H', 'H': 'D', 'V': 'B',
+    'N': 'N',
+}
+
+
+def reverse_complement(pattern):
+    """Return the reverse complement of a DNA pattern, IUPAC codes included."""
+    return ''.join(IUPAC_COMPLEMENT[base] for base in reversed(pattern))
+
+
+def with_reverse_complements(unwanted_patterns):
+    """Return the patterns together with their reverse complements; palindromic sites appear once."""
+    return set(unwanted_patterns) | {reverse_complement(p) for p in unwanted_patterns}
+
+
 def normalize_codon_usage(codon_usage):
     """
     Normalize codon usage frequencies into CAI-aligned log-scaled costs.
@@ -76,6 +111,37 @@ def evaluate_substitution(target_sequence, i, sigma, alpha, beta):
         return changes, beta
 
 
+def codon_substitution_cost(target_codon, proposed_codon, codon_pos, codon_usage, w, optimized_codon):
+    """
+    Evaluates the cost of replacing a whole codon, charged at its third position.
+
+    Parameters:
+        target_codon (str): The codon of the original sequence.
+        proposed_codon (str): The codon of the candidate sequence.
+        codon_pos (int): The codon phase of the third base (3, or -3 for the start codon).
+        codon_usage (dict): Normalized codon costs for synonymous substitutions.
+        w (float): The cost for non-synonymous substitutions in coding regions.
+        optimized_codon (bool): Whether to optimize codon usage even for unchanged codons.
+
+    Returns:
+        float: The substitution cost of the codon.
+    """
+    # Evaluate substitution costs
+    if not optimized_codon and proposed_codon == target_codon:
+        # No substitution
+        return 0.0
+    elif AminoAcidConfig.encodes_same_amino_acid(proposed_codon, target_codon):
+        # Synonymous substitution with a logarithmic penalty based on codon usage
+        return codon_usage[proposed_codon]
+    elif AminoAcidConfig.is_start_codon(codon_pos) or AminoAcidConfig.either_is_stop_codon(target_codon,
+                                                                                           proposed_codon):
+        # Penalize stop codon formation
+        return float('inf')
+    else:
+        # Non-synonymous substitution
+        return w + AminoAcidConfig.edit_dist(target_codon, proposed_codon)
+
+
 def calculate_cost(target_sequence, coding_positions, codon_usage, i, v, sigma, alpha, beta, w, optimized_codon):
     """
     Calculate the substitution cost for a given position in a nucleotide sequence.
@@ -159,25 +225,177 @@ def calculate_cost(target_sequence, coding_positions, codon_usage, i, v, sigma,
         proposed_codon = f'{last2_bases}{sigma}'
 
         changes = (target_codon, proposed_codon)
-        # Evaluate substitution costs
-        if not optimized_codon and proposed_codon == target_codon:
-            # No substitution
-            return changes, 0.0
-        elif AminoAcidConfig.encodes_same_amino_acid(proposed_codon, target_codon):
-            # Synonymous substitution with a logarithmic penalty based on codon usage
-            return changes, codon_usage[proposed_codon]
-        elif AminoAcidConfig.is_start_codon(codon_pos) or AminoAcidConfig.either_is_stop_codon(target_codon,
-                                                                                               proposed_codon):
-            # Penalize stop codon formation
-            return changes, float('inf')
-        else:
-            # Non-synonymous substitution
-            return changes, w + AminoAcidConfig.edit_dist(target_codon, proposed_codon)
+        return changes, codon_substitution_cost(target_codon, proposed_codon, codon_pos, codon_usage, w,
+                                                optimized_codon)
 
     # Fallback (should not be reached under correct conditions)
     raise ValueError(f"Unexpected codon position value: {codon_pos}")
 
 
+@lru_cache(maxsize=32)
+def _codon_cost_rows(usage, w, optimized_codon):
+    """Return the ``128 x 64`` third-position costs, plain then start codons; shared by tables with the same ``w``."""
+    usage = dict(zip(CODONS, usage))
+    return np.vstack([[[codon_substitution_cost(target, proposed, codon_pos, usage, w, optimized_codon)
+                        for proposed in CODONS] for target in CODONS]
+                      for codon_pos in (3, -3)])
+
+
+class CostTable:
+    """
+    Per-position substitution costs indexed by (position, last bigram class, proposed base).
+
+    The cost of proposing a base at position ``i`` depends only on the codon
+    phase and the original bases around ``i``, the last two bases of the FSM
+    state and the proposed base. The logical ``n x 16 x 4`` tensor therefore
+    has at most 133 distinct ``16 x 4`` slices (four non-coding ones, one for
+    codon positions 1 and 2, and one per target codon at third positions, with
+    and without the start-codon restriction). They are stored once in ``rows``
+    and referenced per position through ``row_index``.
+
+    Attributes:
+        rows (np.ndarray): Distinct cost slices, flattened to ``bigram_class * 4 + base``.
+        row_index (np.ndarray): Row of ``rows`` used by each 0-based position.
+        initial (np.ndarray): ``2 x 4`` costs of the bases at the first two positions.
+    """
+
+    # Layout of the distinct rows
+    ZERO_ROW = len(BASES)
+    CODON_ROWS = ZERO_ROW + 1
+    START_CODON_ROWS = CODON_ROWS + len(CODONS)
+
+    def __init__(self, rows, row_index, initial):
+        self.rows = rows
+        self.row_index = row_index
+        self.initial = initial
+
+    def __len__(self):
+        return len(self.row_index)
+
+    def column(self, i):
+        """Return the flat ``16 x 4`` costs of the 1-based DP column ``i``."""
+        return self.rows[self.row_index[i - 1]]
+
+    def dense(self):
+        """Return the materialized ``n x 16 x 4`` cost tensor."""
+        return self.rows[self.row_index].reshape(len(self), len(BIGRAMS), len(BASES))
+
+    def window(self, start, end):
+        """
+        Returns the table of the 0-based positions ``start..end - 1`` as a standalone sequence.
+
+        The first two positions of the window are seeded from their own rows.
+        This is exact as long as neither of them is a third codon position,
+        since every other row is the same for all bigram classes.
+
+        Args:
+            start (int): First position of the window.
+            end (int): Position after the last one of the window.
+
+        Returns:
+            CostTable: A view sharing ``rows`` with this table.
+        """
+        if start == 0:
+            initial = self.initial
+        else:
+            initial = self.rows[self.row_index[start:start + 2], :len(BASES)]
+        return CostTable(self.rows, self.row_index[start:end], initial)
+
+    def position_costs(self, sequence):
+        """Return the cost charged at every position when the DP spells ``sequence``."""
+        bases = np.fromiter((BASE_INDEX[base] for base in sequence), dtype=np.int64, count=len(sequence))
+        costs = np.empty(len(sequence))
+        costs[:2] = self.initial[np.arange(len(bases[:2])), bases[:2]]
+        keys = (bases[:-2] * len(BASES) + bases[1:-1]) * len(BASES) + bases[2:]
+        costs[2:] = self.rows[self.row_index[2:], keys]
+        return costs
+
+    def position_minimums(self):
+        """Return the cheapest cost available at every position, ignoring the unwanted patterns."""
+        minimums = self.rows.min(axis=1)[self.row_index]
+        minimums[:2] = self.initial.min(axis=1)[:len(self)]
+        return minimums
+
+    def synonymous_only(self):
+        """
+        Returns the table with every non-synonymous codon priced at infinity.
+
+        Coding regions can then only be changed by synonymous codons, which
+        removes most candidates at third codon positions.
+
+        Returns:
+            CostTable: A table sharing ``row_index`` and ``initial`` with this one.
+        """
+        synonymous = np.array([[AminoAcidConfig.encodes_same_amino_acid(proposed, target) for proposed in CODONS]
+                               for target in CODONS])
+        rows = self.rows.copy()
+        rows[CostTable.CODON_ROWS:][~np.tile(synonymous, (2, 1))] = np.inf
+        return CostTable(rows, self.row_index, self.initial)
+
+    def path_cost(self, sequence):
+        """Return the total cost of ``sequence``, accumulated in the same order as the DP."""
+        total = 0.0
+        for cost in self.position_costs(sequence).tolist():
+            total += cost
+        return total
+
+    @staticmethod
+    def build(target_sequence, coding_positions, codon_usage, alpha, beta, w, optimized_codon):
+        """
+        Precomputes the cost table of a sequence, vectorized over its positions.
+
+        Args:
+            target_sequence (str): The DNA sequence being analyzed.
+            coding_positions (list): Codon phase of every position (0 for non-coding).
+            codon_usage (dict): Normalized codon costs for synonymous substitutions.
+            alpha (float): Cost for transition substitution in non-coding regions.
+            beta (float): Cost for transversion substitution in non-coding regions.
+            w (float): Cost for non-synonymous substitution in coding regions.
+            optimized_codon (bool): Whether to optimize codon usage even for unchanged codons.
+
+        Returns:
+            CostTable: The table; costs equal those of :func:`calculate_cost`.
+
+        Raises:
+            ValueError: If codon usage contains negative costs or a codon phase is unexpected.
+        """
+        # Validate codon usage once instead of on every cost evaluation
+        if any(freq < 0 for freq in codon_usage.values()):
+            raise ValueError("Invalid codon usage: probabilities must be positive and normalized.")
+
+        # Non-coding costs per (original base, proposed base)
+        non_coding = np.array([[evaluate_substitution(x, 0, y, alpha, beta)[1] for y in BASES] for x in BASES])
+
+        # Third-position costs per (target codon, proposed codon); codons missing
+        # from the usage table cannot be proposed.
+        usage = tuple(codon_usage.get(codon, float('inf')) for codon in CODONS)
+        codon_costs = _codon_cost_rows(usage, w, optimized_codon)
+
+        rows = np.vstack([np.tile(non_coding, (1, len(BIGRAMS))), np.zeros((1, len(CODONS))), codon_costs])
+
+        n = len(target_sequence)
+        bases = np.fromiter((BASE_INDEX[base] for base in target_sequence), dtype=np.int64, count=n)
+        positions = np.asarray(coding_positions, dtype=np.int64).reshape(n)
+
+        if not np.isin(positions, (0, 1, 2, 3, -3)).all():
+            codon_pos = positions[~np.isin(positions, (0, 1, 2, 3, -3))][0]
+            raise ValueError(f"Unexpected codon position value: {codon_pos}")
+
+        row_index = np.full(n, CostTable.ZERO_ROW, dtype=np.int64)
+        row_index[positions == 0] = bases[positions == 0]
+
+        third = np.flatnonzero(np.abs(positions) == 3)
+        if len(third) and third[0] < 2:
+            raise ValueError("Position i must be at least 2 to extract the last three bases.")
+        target_codons = bases[third - 2] * 16 + bases[third - 1] * 4 + bases[third]
+        row_index[third] = np.where(positions[third] == -3, CostTable.START_CODON_ROWS,
+                                    CostTable.CODON_ROWS) + target_codons
+
+        initial = non_coding[bases[:2]]
+
+        return CostTable(rows, row_index, initial)
+
+
 class EliminationScorerConfig:
     """Configuration object holding the DNA alphabet and factory for cost functions."""
 
@@ -216,3 +434,16 @@ class EliminationScorerConfig:
             return calculate_cost(target_sequence, coding_positions, codon_usage, i - 1, v, sigma, alpha, beta, w, optimized_codon)
 
         return initial_cost_function, cost_function
+
+    @staticmethod
+    def cost_table(target_sequence, coding_positions, codon_usage, alpha, beta, w, optimized_codon):
+        """
+        Precomputes the costs of :py:meth:`cost_function` for every position, bigram and base.
+
+        Args:
+            Same as :py:meth:`cost_function`.
+
+        Returns:
+            CostTable: Costs indexed by (position, last bigram class, proposed base).
+        """
+        return CostTable.build(target_sequence, coding_positions, codon_usage, alpha, beta, w, optimized_codon)
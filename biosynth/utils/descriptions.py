@@ -13,19 +13,19 @@ def get_elimination_process_description():
     )
 
 
-def get_coding_region_cost_description():
-    """Return a bullet-list string describing the coding-region cost parameters."""
+def get_coding_region_cost_description(costs=CostData):
+    """Return a bullet-list string describing the coding-region cost parameters of ``costs``."""
     return (
-        f"• Non-synonymous substitution cost in coding region: w = {format_cost(CostData.w)}\n"
-        f"• Synonymous substitution costs determined by codon usage frequencies from: {CostData.codon_usage_filename}"
+        f"• Non-synonymous substitution cost in coding region: w = {format_cost(costs.w)}\n"
+        f"• Synonymous substitution costs determined by codon usage frequencies from: {costs.codon_usage_filename}"
     )
 
 
-def get_non_coding_region_cost_description():
-    """Return a bullet-list string describing the non-coding-region transition/transversion costs."""
+def get_non_coding_region_cost_description(costs=CostData):
+    """Return a bullet-list string describing the non-coding-region transition/transversion costs of ``costs``."""
     return (
-        f"• Transition substitution in non-coding sites (A ↔ G, C ↔ T): α = {format_cost(CostData.alpha)}\n"
-        f"• Transversion substitution in non-coding sites ({{A,G}} ↔ {{C,T}}): β = {format_cost(CostData.beta)}"
+        f"• Transition substitution in non-coding sites (A ↔ G, C ↔ T): α = {format_cost(costs.alpha)}\n"
+        f"• Transversion substitution in non-coding sites ({{A,G}} ↔ {{C,T}}): β = {format_cost(costs.beta)}"
     )
 
 def get_info_usage():
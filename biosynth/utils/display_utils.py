@@ -1,5 +1,8 @@
 import re
 
+from biosynth.utils.cost_utils import reverse_complement
+from biosynth.utils.pattern_scanner import PatternScanner
+
 def get_color_for_coding_region(color_counter):
     """Return the next color name from a fixed palette along with the incremented counter."""
     colors = ["red", "blue", "green", "orange", "purple"]
@@ -58,37 +61,47 @@ class SequenceUtils:
         return formatted_patterns
 
     @staticmethod
-    def get_pattern_occurrences(sequence: str, unwanted_patterns: set, per_line: int = 6):
+    def get_pattern_occurrences(sequence: str, unwanted_patterns: set, per_line: int = 6, both_strands: bool = False):
         """Return per-pattern occurrence rows (overlapping matches, 1-based positions).
 
         Args:
             sequence (str): DNA sequence to scan.
             unwanted_patterns (set): Patterns to locate in the sequence.
             per_line (int): Number of position ranges per line in the "Positions" cell.
+            both_strands (bool): Also locate the reverse complement of every pattern. Rows then
+                carry a "Strand" key: "+" for the pattern itself, "-" for its reverse complement
+                and "+/-" for palindromic patterns.
 
         Returns:
-            list[dict]: Rows with keys "Pattern", "Count", "Positions".
+            list[dict]: Rows with keys "Pattern", "Count", "Positions" (and "Strand").
         """
-        rows = []
+        strands = {}
         for pattern in sorted(unwanted_patterns):
-            ranges = []
-            start = 0
-            while True:
-                idx = sequence.find(pattern, start)
-                if idx == -1:
-                    break
-                ranges.append((idx + 1, idx + len(pattern)))
-                start = idx + 1  # overlapping matches
-
-            tokens = []
-            if ranges:
-                tokens = [f"{s}-{e}" for s, e in ranges]
-
-            rows.append({
-                "Pattern": pattern,
-                "Count": len(ranges),
-                "Positions": tokens,
-            })
+            if not both_strands:
+                strands[pattern] = [(None, pattern)]
+            elif reverse_complement(pattern) == pattern:
+                strands[pattern] = [("+/-", pattern)]
+            else:
+                strands[pattern] = [("+", pattern), ("-", reverse_complement(pattern))]
+
+        scanned = {site for sites in strands.values() for _, site in sites}
+        occurrences = PatternScanner.for_patterns(scanned).find_all(sequence)
+
+        rows = []
+        for pattern, sites in strands.items():
+            for strand, site in sites:
+                ranges = [(start + 1, end) for start, end in occurrences.get(site, [])]
+
+                tokens = []
+                if ranges:
+                    tokens = [f"{s}-{e}" for s, e in ranges]
+
+                row = {"Pattern": pattern}
+                if strand is not None:
+                    row["Strand"] = strand
+                row["Count"] = len(ranges)
+                row["Positions"] = tokens
+                rows.append(row)
         return rows
 
     @staticmethod
@@ -2,7 +2,6 @@ import os
 import re
 import shutil
 import sys
-import numpy as np
 
 from pathlib import Path
 from importlib.resources import files
@@ -100,6 +99,58 @@ class SequenceReader(FileDataReader):
 
         return seq
 
+# Inherit from FileDataReader to stream the records of a FASTA file.
+class FastaReader(FileDataReader):
+    """Streams the records of a (multi-record) FASTA file."""
+
+    def read_records(self, convert_to_dna=True):
+        """
+        Yields the records of the file one at a time, without loading the whole file.
+
+        The record id is the first word of the header line; sequence lines are
+        joined with surrounding whitespace removed.
+
+        :return: A generator of ``(record_id, sequence)`` tuples.
+        """
+
+        if self.file_path is None:
+            handle_critical_error("FASTA file path is not set. Cannot proceed without a valid file.")
+
+        try:
+            file = open(self.file_path, 'r')
+        except FileNotFoundError:
+            handle_critical_error(f"File not found - {self.file_path}.\nPlease check if the path is correct.")
+            return
+
+        with file:
+            record_id, chunks = None, []
+            for line_num, line in enumerate(file, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+
+                if line.startswith('>'):
+                    if record_id is not None:
+                        yield record_id, self._join(chunks, convert_to_dna)
+                    header = line[1:].split()
+                    record_id, chunks = (header[0] if header else f"record_{line_num}"), []
+                elif record_id is None:
+                    handle_critical_error(f"Invalid format in:\n{self.file_path}\nat line {line_num}: "
+                                          "FASTA records must start with a '>' header line.")
+                else:
+                    chunks.append(line)
+
+            if record_id is not None:
+                yield record_id, self._join(chunks, convert_to_dna)
+
+    @staticmethod
+    def _join(chunks, convert_to_dna):
+        seq = ''.join(chunks)
+        if convert_to_dna:
+            seq = seq.replace("U", "T")
+        return seq
+
+
 # Inherit from FileDataReader to read patterns from a file.
 class PatternReader(FileDataReader):
     """Reads unwanted-pattern tokens from a file into a set."""
@@ -108,6 +159,9 @@ class PatternReader(FileDataReader):
         """
         Reads patterns from the file, splitting them by commas and adding to a set.
 
+        Patterns may use IUPAC degenerate codes (N, R, Y, S, W, K, M, B, D, H, V);
+        they are kept as written and compiled directly into the automaton.
+
         :return: A set containing the extracted patterns.
         """
 
@@ -177,6 +231,13 @@ def delete_dir(directory):
         return f"Deleting of the directory '{directory}' failed because of {error}"
 
 
+def output_dir(path=None):
+    """Return the ``BioSynth-Outputs`` directory under ``path``, or under the user's Downloads folder."""
+    if path:
+        return Path(path) / 'BioSynth-Outputs'
+    return Path.home() / 'Downloads' / 'BioSynth-Outputs'
+
+
 def save_file(output, filename, path=None):
     """Write ``output`` to ``filename`` under a ``BioSynth-Outputs`` directory.
 
@@ -189,12 +250,7 @@ def save_file(output, filename, path=None):
         The written file path on success, or an error message string on failure.
     """
     try:
-        # Convert path to Path object if it's not None
-        if path:
-            output_path = Path(path) / 'BioSynth-Outputs'
-        else:
-            downloads_path = Path.home() / 'Downloads'
-            output_path = downloads_path / 'BioSynth-Outputs'
+        output_path = output_dir(path)
 
         # Replace colons with underscores in the filename
         filename = re.sub(':', '_', filename)
@@ -1,4 +1,5 @@
 import argparse
+import itertools
 import sys
 
 from biosynth.utils.logger import Logger
@@ -22,6 +23,56 @@ def get_terminal_information():
            f"{get_elimination_info()}"
 
 
+def _parse_bool(value):
+    """Parse a yes/no command-line value, returning ``None`` when it is neither."""
+    if value.strip().lower() in ("false", "0", "no"):
+        return False
+    if value.strip().lower() in ("true", "1", "yes"):
+        return True
+    return None
+
+
+def parse_sweep_grid(spec):
+    """
+    Expands a ``--sweep`` grid into the cost settings it describes.
+
+    The grid lists values per parameter, e.g. ``alpha=1,2;w=50,100``; every
+    combination of the values is one setting, with the last parameter varying
+    fastest.
+
+    Args:
+        spec (str): ``;``-separated ``name=value,value,...`` axes over ``alpha``, ``beta``,
+            ``w`` and ``optimized_codon``.
+
+    Returns:
+        list: One dict of parameter values per setting.
+
+    Raises:
+        argparse.ArgumentTypeError: If a parameter is unknown, repeated or has an invalid value.
+    """
+    axes = {}
+    for axis in filter(None, (part.strip() for part in spec.split(";"))):
+        name, _, values = axis.partition("=")
+        name = name.strip()
+        if name not in ("alpha", "beta", "w", "optimized_codon") or name in axes:
+            raise argparse.ArgumentTypeError(f"unknown or repeated sweep parameter: {name!r}")
+
+        parsed = []
+        for value in values.split(","):
+            try:
+                parsed.append(_parse_bool(value) if name == "optimized_codon" else float(value))
+            except ValueError:
+                parsed.append(None)
+            if parsed[-1] is None:
+                raise argparse.ArgumentTypeError(f"invalid value for sweep parameter {name!r}: {value!r}")
+        axes[name] = parsed
+
+    if not axes:
+        raise argparse.ArgumentTypeError("the sweep grid is empty")
+
+    return [dict(zip(axes, values)) for values in itertools.product(*axes.values())]
+
+
 class CompactHelpFormatter(argparse.HelpFormatter):
     """Shows metavar only once, next to the long option. No line wrapping."""
     def __init__(self, prog):
@@ -43,6 +94,8 @@ class ArgumentParser:
     """Command-line argument parser for the BioSynth elimination tool."""
 
     def __init__(self):
+        # Namespace of the last parse, for options beyond the core tuple returned by parse_args
+        self.options = None
         self.parser = argparse.ArgumentParser(
             prog="biosynth",
             description="\n  This application is designed for the elimination of unwanted patterns from synthetic DNA sequences.\n",
@@ -122,6 +175,95 @@ class ArgumentParser:
             default=None,
             help="Enable/Disable codon optimization based on codon usage (optional - default is true)."
         )
+        self.parser.add_argument(
+            "-e", "--engine",
+            metavar="NAME",
+            choices=("python", "vectorized", "codon", "astar"),
+            default=None,
+            help="Selects the dynamic-programming engine: 'python', 'vectorized', 'codon' or 'astar' "
+                 "(optional - default is python)."
+        )
+        self.parser.add_argument(
+            "--low-memory",
+            action="store_true",
+            default=False,
+            help="Keep only O(sqrt(n)) DP columns and recompute the path between checkpoints, for very long sequences."
+        )
+        self.parser.add_argument(
+            "--windowed",
+            action="store_true",
+            default=False,
+            help="Re-optimize only the neighbourhoods of the unwanted pattern occurrences (same cost as the full DP)."
+        )
+        self.parser.add_argument(
+            "--no-fsm-cache",
+            action="store_true",
+            default=False,
+            help="Always rebuild the pattern automaton instead of using the on-disk cache (~/.cache/biosynth)."
+        )
+        self.parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            default=False,
+            help="Always re-run the optimization instead of reusing a cached result of identical inputs."
+        )
+        self.parser.add_argument(
+            "--minimize-fsm",
+            action="store_true",
+            default=False,
+            help="Merge equivalent automaton states before the DP (same optimal cost, fewer states)."
+        )
+        self.parser.add_argument(
+            "--coding-mode",
+            metavar="MODE",
+            choices=("full", "synonymous-only", "auto"),
+            default=None,
+            help="Candidate codons in coding regions: 'full', 'synonymous-only' (falls back to 'full' when no "
+                 "synonymous solution exists) or 'auto' (keeps the synonymous-only result when it is provably "
+                 "optimal) (optional - default is full)."
+        )
+        self.parser.add_argument(
+            "-k", "--top-k",
+            metavar="INT",
+            type=int,
+            default=None,
+            help="Also reports the k cheapest distinct sequences, found in the same DP pass "
+                 "(optional - default is 1)."
+        )
+        self.parser.add_argument(
+            "--both-strands",
+            action="store_true",
+            default=False,
+            help="Also eliminate the reverse complement of every unwanted pattern."
+        )
+        self.parser.add_argument(
+            "--sweep",
+            metavar="GRID",
+            type=parse_sweep_grid,
+            default=None,
+            help="Optimizes the sequence once per combination of cost values, e.g. 'alpha=1,2;w=50,100' (parameters "
+                 "alpha, beta, w and optimized_codon), in a single pass, and writes a comparison table instead of "
+                 "a report."
+        )
+        self.parser.add_argument(
+            "--batch",
+            metavar="PATH",
+            default=None,
+            help="Optimizes every record of a FASTA file instead of -s, writing one consolidated results file."
+        )
+        self.parser.add_argument(
+            "-j", "--jobs",
+            metavar="INT",
+            type=int,
+            default=None,
+            help="Number of worker processes for --batch (optional - default is the number of CPUs)."
+        )
+        self.parser.add_argument(
+            "--batch-reports",
+            action="store_true",
+            default=False,
+            help="Also write an HTML report for every --batch record."
+        )
 
     def parse_args(self, argv):
         """
@@ -143,6 +285,8 @@ class ArgumentParser:
             )
             sys.exit(2)
 
+        self.options = args
+
         if args.help:
             set_output_format(OutputFormat.TERMINAL)
             Logger.help(self.parser.format_help())
@@ -157,10 +301,7 @@ class ArgumentParser:
         # Parse optimized_codon string -> bool
         optimized_codon = None
         if args.optimized_codon is not None:
-            if args.optimized_codon.strip().lower() in ("false", "0", "no"):
-                optimized_codon = False
-            elif args.optimized_codon.strip().lower() in ("true", "1", "yes"):
-                optimized_codon = True
+            optimized_codon = _parse_bool(args.optimized_codon)
 
         return (
             args.gui,
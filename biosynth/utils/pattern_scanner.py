@@ -0,0 +1,157 @@
+from collections import deque
+from functools import lru_cache
+
+from biosynth.utils.cost_utils import BASES, IUPAC_CODES
+
+
+class PatternScanner:
+    """
+    Aho–Corasick automaton reporting every (overlapping) occurrence of a pattern set in one pass.
+
+    The trie of the patterns is completed into a deterministic automaton over
+    the characters that appear in the patterns, and every node carries the
+    patterns ending there, including those reached through failure links.
+    Characters outside that alphabet send the scan back to the root.
+
+    Pattern sets containing IUPAC codes other than A/C/G/T are scanned
+    bit-parallel instead (Shift-And, one bit per pattern position), which
+    matches the degenerate positions without expanding the patterns.
+
+    Attributes:
+        patterns (tuple): The distinct non-empty patterns, sorted.
+        goto (list): Transition dict per node, mapping a character to the next node.
+        output (list): Indices into ``patterns`` of the patterns ending at each node.
+        masks (dict): Shift-And mask per base for degenerate pattern sets, otherwise ``None``.
+    """
+
+    def __init__(self, unwanted_patterns):
+        """
+        Compiles the automaton of ``unwanted_patterns``.
+
+        Args:
+            unwanted_patterns (iterable): The patterns to search for.
+        """
+        self.patterns = tuple(sorted({p for p in unwanted_patterns if p}))
+        self.goto = [{}]
+        self.output = [[]]
+        self.masks = None
+
+        if any(ch not in BASES and ch in IUPAC_CODES for pattern in self.patterns for ch in pattern):
+            self._compile_degenerate()
+            return
+
+        # Trie of the patterns
+        for k, pattern in enumerate(self.patterns):
+            node = 0
+            for ch in pattern:
+                if ch not in self.goto[node]:
+                    self.goto.append({})
+                    self.output.append([])
+                    self.goto[node][ch] = len(self.goto) - 1
+                node = self.goto[node][ch]
+            self.output[node].append(k)
+
+        # Failure links in BFS order; missing transitions are filled in from
+        # the failure node, which is always shallower and thus complete.
+        alphabet = sorted({ch for pattern in self.patterns for ch in pattern})
+        fail = [0] * len(self.goto)
+        queue = deque()
+        for ch in alphabet:
+            child = self.goto[0].get(ch)
+            if child is None:
+                self.goto[0][ch] = 0
+            else:
+                queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            self.output[node] = self.output[node] + self.output[fail[node]]
+            for ch in alphabet:
+                child = self.goto[node].get(ch)
+                if child is None:
+                    self.goto[node][ch] = self.goto[fail[node]][ch]
+                else:
+                    fail[child] = self.goto[fail[node]][ch]
+                    queue.append(child)
+
+    def _compile_degenerate(self):
+        """Builds the Shift-And masks of a pattern set with IUPAC codes."""
+        self.masks = {base: 0 for base in BASES}
+        self._starts = 0
+        self._finals = {}
+        offset = 0
+        for k, pattern in enumerate(self.patterns):
+            self._starts |= 1 << offset
+            for j, code in enumerate(pattern):
+                for base in IUPAC_CODES.get(code, ''):
+                    self.masks[base] |= 1 << (offset + j)
+            self._finals[offset + len(pattern) - 1] = k
+            offset += len(pattern)
+        self._final_mask = sum(1 << bit for bit in self._finals)
+
+    def _scan_degenerate(self, sequence):
+        """Shift-And counterpart of :meth:`scan`."""
+        masks = self.masks
+        starts = self._starts
+        final_mask = self._final_mask
+        prefixes = 0
+        for i, ch in enumerate(sequence):
+            prefixes = ((prefixes << 1) | starts) & masks.get(ch, 0)
+            if prefixes & final_mask:
+                ended = [self.patterns[k] for bit, k in self._finals.items() if prefixes >> bit & 1]
+                for pattern in sorted(ended, key=len, reverse=True):
+                    yield i + 1 - len(pattern), i + 1, pattern
+
+    @staticmethod
+    def for_patterns(unwanted_patterns):
+        """Return the scanner of ``unwanted_patterns``, compiled once per distinct pattern set."""
+        return _compile(frozenset(unwanted_patterns))
+
+    def scan(self, sequence):
+        """
+        Yields every occurrence of the patterns in ``sequence``.
+
+        Args:
+            sequence (str): The sequence to scan.
+
+        Yields:
+            tuple: ``(start, end, pattern)`` with 0-based ``start`` and exclusive ``end``,
+            ordered by ``end`` and then by decreasing pattern length.
+        """
+        if self.masks is not None:
+            yield from self._scan_degenerate(sequence)
+            return
+
+        goto = self.goto
+        output = self.output
+        node = 0
+        for i, ch in enumerate(sequence):
+            node = goto[node].get(ch, 0)
+            for k in output[node]:
+                pattern = self.patterns[k]
+                yield i + 1 - len(pattern), i + 1, pattern
+
+    def contains_any(self, sequence):
+        """Return whether any pattern occurs in ``sequence``, stopping at the first hit."""
+        return next(self.scan(sequence), None) is not None
+
+    def find_all(self, sequence):
+        """
+        Collects the occurrences of every pattern in ``sequence``.
+
+        Args:
+            sequence (str): The sequence to scan.
+
+        Returns:
+            dict: Pattern to its ``(start, end)`` ranges (0-based, end exclusive) in increasing order;
+            every pattern is present, with an empty list when it does not occur.
+        """
+        ranges = {pattern: [] for pattern in self.patterns}
+        for start, end, pattern in self.scan(sequence):
+            ranges[pattern].append((start, end))
+        return ranges
+
+
+@lru_cache(maxsize=32)
+def _compile(unwanted_patterns):
+    return PatternScanner(unwanted_patterns)